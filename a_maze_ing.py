@@ -1,110 +1,359 @@
 #! .venv/bin/python3
 
-from mazegen.config import Config
-from mazegen.maze_generation import MazeGenerator
+from mazegen.config import Config, ConfigWatcher
+from mazegen.config import create_config
+from mazegen.maze_generation import MazeGenerator, GenerationWorker
 from mazegen.display import Displayer
+from mazegen import cli
+from mazegen.profiler import PhaseProfiler
 from mazegen.display.button import ButtonText
 from src.button_function import change_path, change_theme, print_seed
+from src.button_function import solve_maze
 from src.button_function import regenerate_maze, victory_function
+from contextlib import nullcontext
+from typing import Any, ContextManager
 import sys
 
 
-def create_config(config: Config) -> None:
+# Work needed to apply a change of each parameter while running.
+RELOAD_KINDS: dict[str, int] = {
+    "WIDTH": ConfigWatcher.REGENERATE,
+    "HEIGHT": ConfigWatcher.REGENERATE,
+    "ENTRY": ConfigWatcher.REGENERATE,
+    "EXIT": ConfigWatcher.REGENERATE,
+    "OUTPUT_FILE": ConfigWatcher.REGENERATE,
+    "PERFECT": ConfigWatcher.REGENERATE,
+    "SEED": ConfigWatcher.REGENERATE,
+    "ICON_FILE": ConfigWatcher.REGENERATE,
+    "TOGGLE_PATH": ConfigWatcher.REDRAW,
+    "MAZE_SIZE": ConfigWatcher.RESTART,
+    "WALL_THICKNESS": ConfigWatcher.REDRAW,
+    "CUSTOM_COLORS": ConfigWatcher.RECOLOR,
+    "BACKGROUND_COLOR": ConfigWatcher.RECOLOR,
+    "WALLS_COLOR": ConfigWatcher.RECOLOR,
+    "ICON_COLOR": ConfigWatcher.RECOLOR,
+    "ENTRY_COLOR": ConfigWatcher.RECOLOR,
+    "EXIT_COLOR": ConfigWatcher.RECOLOR,
+    "PATH_COLOR": ConfigWatcher.RECOLOR,
+    "FRONTIER_COLOR": ConfigWatcher.RECOLOR,
+    "SOLVER": ConfigWatcher.RESTART,
+    "ANIMATED": ConfigWatcher.SETTING,
+    "FPS": ConfigWatcher.SETTING,
+    "ANIMATION_DURATION": ConfigWatcher.SETTING,
+    "SPACING": ConfigWatcher.RESTART,
+    "STATS_LOG_INTERVAL": ConfigWatcher.SETTING,
+    "KEY_REPEAT_RATE": ConfigWatcher.SETTING,
+    "AUTO_WALK_SPEED": ConfigWatcher.SETTING,
+    "CUSTOM_PLAYER_FILE": ConfigWatcher.REDRAW,
+    "AUTO_ADJUST_PLAYER": ConfigWatcher.REDRAW,
+    "CUSTOM_PLAYER_COLORS": ConfigWatcher.REDRAW,
+    "PROFILE": ConfigWatcher.RESTART,
+    "PROFILE_FILE": ConfigWatcher.RESTART,
+}
+
+
+def apply_colors(displayer: Displayer, config: Config) -> None:
+    """Set the colors of the configuration, or the default ones.
+
+    Only the palette is updated, see :meth:`Displayer.apply_palette`.
+
+    Parameters
+    ----------
+    displayer : Displayer
+        The displayer to color.
+    config : Config
+        The configuration.
+
+    Returns
+    -------
+    None
     """
-    Register all configuration parameters with their default values and types.
+    if not config.get_value("CUSTOM_COLORS"):
+        displayer.reset_colors()
+        return
+    displayer.set_color("background", config.get_value("BACKGROUND_COLOR"))
+    displayer.set_color("walls", config.get_value("WALLS_COLOR"))
+    displayer.set_color("icon", config.get_value("ICON_COLOR"))
+    displayer.set_color("entry", config.get_value("ENTRY_COLOR"))
+    displayer.set_color("exit", config.get_value("EXIT_COLOR"))
+    displayer.set_color("path", config.get_value("PATH_COLOR"))
+    displayer.set_color("frontier", config.get_value("FRONTIER_COLOR"))
 
-    Sets up the complete configuration schema for the A-Maze-Ing application,
-    including maze generation parameters, display settings, colors, and player
-    customization options.
+
+def apply_settings(displayer: Displayer, config: Config) -> None:
+    """Set the display parameters that need no redraw.
 
     Parameters
     ----------
+    displayer : Displayer
+        The displayer to configure.
     config : Config
-        The Config instance to register parameters into.
+        The configuration.
+
+    Returns
+    -------
+    None
+    """
+    displayer.set_key_repeat_rate(config.get_value("KEY_REPEAT_RATE"))
+    displayer.set_auto_walk_speed(config.get_value("AUTO_WALK_SPEED"))
+    displayer.set_animation_duration(config.get_value("ANIMATION_DURATION"))
+    displayer.set_stats_log_interval(config.get_value("STATS_LOG_INTERVAL"))
+
+
+def apply_player(displayer: Displayer, config: Config) -> None:
+    """Set the custom player of the configuration, if any.
+
+    Parameters
+    ----------
+    displayer : Displayer
+        The displayer to configure.
+    config : Config
+        The configuration.
+
+    Returns
+    -------
+    None
+    """
+    player_file: str = config.get_value("CUSTOM_PLAYER_FILE")
+
+    if player_file != "":
+        displayer.set_auto_adjust_player(
+                config.get_value("AUTO_ADJUST_PLAYER")
+            )
+        displayer.set_custom_player_colors(
+            config.get_value("CUSTOM_PLAYER_COLORS")
+        )
+        displayer.set_custom_player(player_file)
+    else:
+        displayer.custom_player = None
+        displayer.custom_player_source = None
+
+
+def reload_config(watcher: ConfigWatcher, displayer: Displayer,
+                  regenerate_param: list[Any]) -> None:
+    """Apply the changes of the configuration file, if any.
+
+    Called periodically by the displayer watcher. Only the cheapest step
+    covering all the changed parameters is done: update the settings,
+    recolor, redraw, or generate a new maze.
+    Errors of the new configuration are printed and leave the program
+    running.
+
+    Parameters
+    ----------
+    watcher : ConfigWatcher
+        Watcher of the configuration file.
+    displayer : Displayer
+        The running displayer.
+    regenerate_param : list[Any]
+        Parameters of the REGENERATE button, updated in place.
 
     Returns
     -------
     None
     """
-    config.add_parameter("WIDTH", [20, [int]])
-    config.add_parameter("HEIGHT", [15, [int]])
-    config.add_parameter("ENTRY", [(0, 0), [tuple, 2, [[int], [int]], ","]])
-    config.add_parameter("EXIT", [(19, 14), [tuple, 2, [[int], [int]], ","]])
-    config.add_parameter("OUTPUT_FILE", ["maze.txt", [str]])
-    config.add_parameter("PERFECT", [True, [bool]])
-    config.add_parameter("SEED", [0, [int]])
-    config.add_parameter("ICON_FILE", ["src/default_icon.txt", [str]])
-    config.add_parameter("TOGGLE_PATH", [False, [bool]])
-    config.add_parameter("MAZE_SIZE", [((0, 0), (0, 0)), [
-        tuple, 2, [
-            [tuple, 2, [[int], [int]], ","], [tuple, 2, [[int], [int]], ","]
-            ], " "
-        ]])
-    config.add_parameter("WALL_THICKNESS", [5, [int]])
-
-    config.add_parameter("CUSTOM_COLORS", [False, [bool]])
-    config.add_parameter("BACKGROUND_COLOR", [
-            (255, 255, 255), [tuple, 3, [[int], [int], [int]], ","]
-        ])
-    config.add_parameter("WALLS_COLOR", [
-            (0, 0, 0), [tuple, 3, [[int], [int], [int]], ","]
-        ])
-    config.add_parameter("ICON_COLOR", [
-            (0, 0, 0), [tuple, 3, [[int], [int], [int]], ","]
-        ])
-    config.add_parameter("ENTRY_COLOR", [
-            (0, 255, 0), [tuple, 3, [[int], [int], [int]], ","]
-        ])
-    config.add_parameter("EXIT_COLOR", [
-            (255, 0, 0), [tuple, 3, [[int], [int], [int]], ","]
-        ])
-    config.add_parameter("PATH_COLOR", [
-            (0, 0, 255), [tuple, 3, [[int], [int], [int]], ","]
-        ])
-
-    config.add_parameter("ANIMATED", [False, [bool]])
-    config.add_parameter("FPS", [60, [int]])
-    config.add_parameter("SPACING", [42, [int]])
-
-    config.add_parameter("CUSTOM_PLAYER_FILE", ["", [str]])
-    config.add_parameter("AUTO_ADJUST_PLAYER", [True, [bool]])
-    config.add_parameter("CUSTOM_PLAYER_COLORS", [{"r": (255, 0, 0)}, [
-        dict, [
-            [tuple, 2, [[str], [tuple, 3, [[int], [int], [int]], ","]], ":"],
-            [tuple, 2, [[str], [tuple, 3, [[int], [int], [int]], ","]], ":"],
-            [tuple, 2, [[str], [tuple, 3, [[int], [int], [int]], ","]], ":"],
-            [tuple, 2, [[str], [tuple, 3, [[int], [int], [int]], ","]], ":"],
-            ], " "
-        ]])
+    changed = watcher.poll()
+    if watcher.error:
+        print(watcher.error)
+        watcher.error = ""
+    if not changed:
+        return
+    restart = watcher.get_restart_parameters(changed)
+    if restart:
+        print(f"Config reload: restart to apply {', '.join(restart)}")
+    kind = watcher.classify(changed)
+    if kind < 0:
+        return
+
+    config = watcher.config
+    try:
+        apply_settings(displayer, config)
+        if "FPS" in changed:
+            displayer.set_fps(config.get_value("FPS"))
+        regenerate_param[1:] = [
+            config.get_value("ANIMATED"),
+            config.get_value("WIDTH"), config.get_value("HEIGHT"),
+            config.get_value("ENTRY"), config.get_value("EXIT"),
+            config.get_value("PERFECT"), config.get_value("ICON_FILE"),
+            config.get_value("OUTPUT_FILE"),
+        ]
+
+        if kind >= ConfigWatcher.RECOLOR:
+            apply_colors(displayer, config)
+        if kind >= ConfigWatcher.REDRAW:
+            displayer.set_wall_thickness(config.get_value("WALL_THICKNESS"))
+            displayer.set_toggle_path(config.get_value("TOGGLE_PATH"))
+            apply_player(displayer, config)
+            displayer.set_function(victory_function,
+                                   (displayer, config.get_value("EXIT")))
+        if kind == ConfigWatcher.REGENERATE:
+            displayer.set_run_file(config.get_value("OUTPUT_FILE") + ".run")
+            regenerate_maze(regenerate_param + [config.get_value("SEED")])
+        elif kind == ConfigWatcher.REDRAW:
+            displayer.fit_custom_player()
+            displayer.display(False)
+        elif kind == ConfigWatcher.RECOLOR:
+            displayer.apply_palette()
+            displayer.put_image()
+    except Exception as error:
+        print(f"Config reload: {error}")
+
+
+def load_config(config_file_name: str) -> Config:
+    """Create the configuration and parse the configuration file, if any.
+
+    Parameters
+    ----------
+    config_file_name : str
+        The configuration file, empty for the default configuration.
+
+    Returns
+    -------
+    Config
+        The configuration.
+    """
+    config: Config = Config()
+
+    create_config(config)
+
+    if config_file_name != "":
+        with open(config_file_name) as config_file:
+            config.parse_file(config_file)
+    return config
+
+
+def start_profiler(stats_file: str) -> PhaseProfiler:
+    """Create and start the startup profiler.
+
+    It stops itself, and prints its phases with :func:`report_profile`,
+    once the first full frame is drawn, so that the rest of the session
+    runs without tracing.
+
+    Parameters
+    ----------
+    stats_file : str
+        File the ``cProfile`` statistics are dumped to, empty for none.
+
+    Returns
+    -------
+    PhaseProfiler
+        The started profiler.
+    """
+    profiler = PhaseProfiler(stats_file, stop_after="first full frame",
+                             on_stop=report_profile)
+    profiler.start()
+    return profiler
+
+
+def profile_phase(profiler: PhaseProfiler | None,
+                  name: str) -> ContextManager[None]:
+    """Return a context manager recording a startup phase.
+
+    Parameters
+    ----------
+    profiler : PhaseProfiler | None
+        The startup profiler, None when not profiling.
+    name : str
+        Name of the phase.
+
+    Returns
+    -------
+    ContextManager[None]
+        A phase of the profiler, or a no-op without profiler.
+    """
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
+
+
+def report_profile(profiler: PhaseProfiler) -> None:
+    """Print the phases of the stopped startup profiler.
+
+    Parameters
+    ----------
+    profiler : PhaseProfiler
+        The startup profiler.
+
+    Returns
+    -------
+    None
+    """
+    print(profiler.format_table())
+    stats_file = profiler.get_stats_file()
+    if stats_file != "":
+        print(f"cProfile statistics written to {stats_file}")
+
+
+def run_batch(config_file_name: str, jobs: int) -> None:
+    """Generate every maze described by a sweep configuration file.
+
+    Values may list alternatives and ranges, see :class:`ConfigSweep`. The
+    mazes are generated in worker processes and written to their output
+    files, without display; this is ``mazegen generate``.
+
+    Parameters
+    ----------
+    config_file_name : str
+        The sweep configuration file.
+    jobs : int
+        Number of worker processes, 0 for one per CPU.
+
+    Returns
+    -------
+    None
+    """
+    cli.main(["generate", config_file_name, "--jobs", str(jobs)])
 
 
 def main() -> None:
     """Main entry point for the A-Maze-Ing application.
 
-    Initializes the configuration, generates a maze, creates a display window,
+    Initializes the configuration, starts generating a maze in a background
+    worker, creates a display window that draws it while it is generated,
     sets up interactive buttons, and handles the main event loop. Optionally
     loads custom settings from a configuration file and enables animated
     maze generation.
 
+    With ``--batch CONFIG_FILE [JOBS]``, the mazes of a sweep configuration
+    file are generated without display instead, see :func:`run_batch`.
+
+    With ``--profile`` or ``--profile=STATS_FILE`` (or ``PROFILE=True`` and
+    ``PROFILE_FILE`` in the configuration file), the time and allocations
+    of each startup phase are printed once the first full frame is drawn,
+    and the ``cProfile`` statistics of the main thread are dumped to the
+    file.
+
     Returns
     -------
     None
     """
-    argv: list[str] = sys.argv
+    profile_options: list[str] = [
+        arg for arg in sys.argv[1:]
+        if arg == "--profile" or arg.startswith("--profile=")]
+    argv: list[str] = [arg for arg in sys.argv if arg not in profile_options]
     argc: int = len(argv)
 
     config_file_name: str = ""
 
+    if argc >= 3 and argv[1] == "--batch":
+        run_batch(argv[2], int(argv[3]) if argc >= 4 else 0)
+        return
+
     if argc >= 2:
         config_file_name = argv[1]
 
-    config: Config = Config()
+    profiler: PhaseProfiler | None = None
+    if profile_options:
+        profiler = start_profiler(profile_options[-1].partition("=")[2])
 
-    create_config(config)
+    with profile_phase(profiler, "config parse"):
+        config: Config = load_config(config_file_name)
 
-    if config_file_name != "":
-        with open(config_file_name) as config_file:
-            config.parse_file(config_file)
+    if profiler is None and config.get_value("PROFILE"):
+        profiler = start_profiler(config.get_value("PROFILE_FILE"))
+        # Parsed again, now that it is profiled.
+        with profiler.phase("config parse"):
+            config = load_config(config_file_name)
 
     width: int = config.get_value("WIDTH")
     height: int = config.get_value("HEIGHT")
@@ -118,84 +367,96 @@ def main() -> None:
     output_file_name: str = config.get_value("OUTPUT_FILE")
     icon_file_name: str = config.get_value("ICON_FILE")
 
-    with open(output_file_name, "w") as output_file:
-        with open(icon_file_name, "r") as icon_file:
-            maze: MazeGenerator = MazeGenerator(
-                            width,
-                            height,
-                            entry,
-                            _exit,
-                            perfect,
-                            seed,
-                            icon_file
-                        )
-
-            maze.create_full_maze()
-        maze.output_in_file(output_file)
+    animated: bool = config.get_value("ANIMATED")
+
+    # Fail before opening the window if the output file is not writable,
+    # the maze itself is written by the worker once generated.
+    with open(output_file_name, "w"):
+        pass
+
+    with profile_phase(profiler, "maze construction"), \
+            open(icon_file_name, "r") as icon_file:
+        maze: MazeGenerator = MazeGenerator(
+                        width,
+                        height,
+                        entry,
+                        _exit,
+                        perfect,
+                        seed,
+                        icon_file
+                    )
+
+    if profiler is not None:
+        maze.set_phase_callback(profiler.switch)
+    worker: GenerationWorker = GenerationWorker(
+        maze, output_file_name, blocking=animated)
+    worker.start()
 
     screen_size, maze_size = config.get_value("MAZE_SIZE")
     wall_thickness: int = config.get_value("WALL_THICKNESS")
 
-    displayer: Displayer = Displayer(
-                                screen_size,
-                                maze_size,
-                                maze,
-                                wall_thickness
-                            )
-
-    if config.get_value("CUSTOM_COLORS"):
-        displayer.set_color("background", config.get_value(
-            "BACKGROUND_COLOR"))
-        displayer.set_color("walls", config.get_value("WALLS_COLOR"))
-        displayer.set_color("icon", config.get_value("ICON_COLOR"))
-        displayer.set_color("entry", config.get_value("ENTRY_COLOR"))
-        displayer.set_color("exit", config.get_value("EXIT_COLOR"))
-        displayer.set_color("path", config.get_value("PATH_COLOR"))
-
-    animated: bool = config.get_value("ANIMATED")
+    with profile_phase(profiler, "Displayer init"):
+        displayer: Displayer = Displayer(
+                                    screen_size,
+                                    maze_size,
+                                    maze,
+                                    wall_thickness
+                                )
+    displayer.set_profiler(profiler)
 
+    apply_colors(displayer, config)
     displayer.set_spacing(config.get_value("SPACING"))
+    apply_settings(displayer, config)
+    displayer.set_run_file(output_file_name + ".run")
 
     button1 = ButtonText(
         change_path, displayer, (300, 100), (5, 55, 175), "PATH")
     button2 = ButtonText(
-        next, change_theme(displayer), (300, 100), (5, 55, 175), "THEME")
+        solve_maze, (displayer, config.get_value("SOLVER")),
+        (300, 100), (5, 55, 175), "SOLVE")
     button3 = ButtonText(
-        regenerate_maze,
-        (displayer, animated,
-            width, height, entry, _exit,
-            perfect, icon_file_name, output_file_name),
-        (300, 100), (5, 55, 175), "REGENERATE")
+        next, change_theme(displayer), (300, 100), (5, 55, 175), "THEME")
+    regenerate_param: list[Any] = [
+        displayer, animated, width, height, entry, _exit,
+        perfect, icon_file_name, output_file_name]
     button4 = ButtonText(
+        regenerate_maze, regenerate_param,
+        (300, 100), (5, 55, 175), "REGENERATE")
+    button5 = ButtonText(
         print_seed, displayer, (300, 100), (5, 55, 175), "PRINT SEED")
 
     displayer.add_button(button1)
     displayer.add_button(button2)
     displayer.add_button(button3)
     displayer.add_button(button4)
+    displayer.add_button(button5)
 
-    displayer.print_buttons()
-
-    player_file: str = config.get_value("CUSTOM_PLAYER_FILE")
+    with profile_phase(profiler, "buttons"):
+        displayer.print_buttons()
 
-    if player_file != "":
-        with open(player_file, "r") as textio_player_file:
-            displayer.set_auto_adjust_player(
-                    config.get_value("AUTO_ADJUST_PLAYER")
-                )
-            displayer.set_custom_player_colors(
-                config.get_value("CUSTOM_PLAYER_COLORS")
-            )
-            displayer.set_custom_player(textio_player_file)
+    with profile_phase(profiler, "player"):
+        apply_player(displayer, config)
 
     if config.get_value("TOGGLE_PATH"):
         displayer.set_toggle_path(True)
     displayer.set_function(victory_function, (displayer, maze.get_exit()))
 
-    if animated is True:
-        displayer.start_animated_display(config.get_value("FPS"))
-    else:
-        displayer.display()
+    if config_file_name != "":
+        watcher = ConfigWatcher(config_file_name, create_config,
+                                RELOAD_KINDS, config)
+        displayer.set_watcher(lambda: reload_config(
+            watcher, displayer, regenerate_param))
+
+    try:
+        if animated is True:
+            displayer.start_animated_display(
+                config.get_value("FPS"), worker=worker)
+        else:
+            displayer.start_generation_display(worker)
+    finally:
+        # Closed before the first full frame: report what was recorded.
+        if profiler is not None:
+            profiler.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,243 @@
+"""Rendering benchmarks run on the headless MLX backend.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.bench_display [--sizes 20 50 100] [--output FILE]
+
+Results are printed (or written to ``--output``) as JSON.
+"""
+from mazegen.display import Displayer, HeadlessMlx
+from mazegen.maze_generation import MazeGenerator
+from src.button_function import change_theme, victory_function
+from typing import Any, Callable
+import argparse
+import json
+import platform
+import sys
+import time
+
+
+ICON_FILE: str = "src/default_icon.txt"
+PLAYER_FILE: str = "src/default_player.txt"
+PLAYER_COLORS: dict[str, tuple[int, int, int]] = {
+    "r": (255, 0, 0), "g": (0, 255, 0), "b": (0, 0, 255),
+    "w": (255, 255, 255),
+}
+KEYS: dict[tuple[int, int], int] = {
+    (-1, 0): 65361, (0, -1): 65362, (1, 0): 65363, (0, 1): 65364,
+}
+
+
+def measure(function: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Time several calls of a function.
+
+    Parameters
+    ----------
+    function : Callable[[], Any]
+        Function to time.
+    repeat : int
+        Number of calls.
+
+    Returns
+    -------
+    dict[str, float]
+        Number of calls and min, mean and max duration in seconds.
+    """
+    durations: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return {
+        "calls": len(durations),
+        "min": min(durations),
+        "mean": sum(durations) / len(durations),
+        "max": max(durations),
+    }
+
+
+def create_displayer(size: int, image_size: int,
+                     seed: int) -> tuple[Displayer, HeadlessMlx]:
+    """Create a square maze and a headless Displayer for it.
+
+    Parameters
+    ----------
+    size : int
+        Maze width and height in cells.
+    image_size : int
+        Image width and height in pixels.
+    seed : int
+        Maze seed.
+
+    Returns
+    -------
+    tuple[Displayer, HeadlessMlx]
+        The Displayer and its backend.
+    """
+    with open(ICON_FILE) as icon_file:
+        maze = MazeGenerator(size, size, (0, 0), (size - 1, size - 1),
+                             True, seed, icon_file)
+        maze.create_full_maze()
+
+    mlx = HeadlessMlx()
+    window = (image_size, image_size)
+    displayer = Displayer(window, window, maze, 5, mlx)
+    return displayer, mlx
+
+
+def bench_animation(displayer: Displayer, mlx: HeadlessMlx,
+                    frames: int) -> dict[str, float]:
+    """Time the first frames of the animated display.
+
+    Parameters
+    ----------
+    displayer : Displayer
+        Displayer to animate.
+    mlx : HeadlessMlx
+        Backend of the Displayer.
+    frames : int
+        Maximum number of frames to run.
+
+    Returns
+    -------
+    dict[str, float]
+        Number of frames, total and mean frame duration in seconds.
+    """
+    mlx.loop_iterations = frames
+    calls = mlx.loop_calls
+    start = time.perf_counter()
+    displayer.start_animated_display(10 ** 9)
+    total = time.perf_counter() - start
+    calls = mlx.loop_calls - calls
+    mlx.loop_iterations = 0
+    return {"frames": calls, "total": total, "mean": total / max(calls, 1)}
+
+
+def bench_player(displayer: Displayer) -> dict[str, float]:
+    """Time the player moves along the shortest path to the exit.
+
+    The default player sprite is used. Each move is queued by a key press
+    then applied by one frame of the loop hook. The last move triggers the
+    victory screen.
+
+    Parameters
+    ----------
+    displayer : Displayer
+        Displayer to play on.
+
+    Returns
+    -------
+    dict[str, float]
+        Number of moves and min, mean and max duration in seconds.
+    """
+    maze = displayer.get_maze()
+    displayer.set_function(victory_function, (displayer, maze.get_exit()))
+    displayer.set_custom_player_colors(PLAYER_COLORS)
+    displayer.set_custom_player(PLAYER_FILE)
+    displayer.set_key_repeat_rate(0)
+    displayer.key_press(109, None)
+    mlx = displayer.get_mlx()
+
+    keys: list[int] = []
+    x, y = maze.get_entry()
+    for next_x, next_y in maze.get_shortest_path_coords():
+        keys.append(KEYS[(next_x - x, next_y - y)])
+        x, y = next_x, next_y
+
+    def move(keycode: int) -> None:
+        displayer.key_press(keycode, None)
+        mlx.run_loop_hook()
+
+    moves = iter(keys)
+    result = measure(lambda: move(next(moves)), len(keys))
+    if displayer.player_pos != maze.get_exit():
+        raise RuntimeError("the player did not reach the exit.")
+    displayer.key_press(109, None)
+    return result
+
+
+def bench_size(size: int, image_size: int, repeat: int, frames: int,
+               seed: int) -> dict[str, Any]:
+    """Run every rendering benchmark on one maze size.
+
+    Parameters
+    ----------
+    size : int
+        Maze width and height in cells.
+    image_size : int
+        Image width and height in pixels.
+    repeat : int
+        Number of calls of each timed operation.
+    frames : int
+        Maximum number of animation frames.
+    seed : int
+        Maze seed.
+
+    Returns
+    -------
+    dict[str, Any]
+        Results of every benchmark for this size.
+    """
+    displayer, mlx = create_displayer(size, image_size, seed)
+    result: dict[str, Any] = {
+        "width": size,
+        "height": size,
+        "cell_size": displayer.get_cell_size(),
+    }
+
+    result["display"] = measure(lambda: displayer.display(False), repeat)
+
+    displayer.set_toggle_path(True)
+    result["print_path"] = measure(displayer.print_path, repeat)
+
+    themes = change_theme(displayer)
+    result["theme"] = measure(lambda: next(themes), repeat)
+
+    result["player_move"] = bench_player(displayer)
+
+    uploaded = mlx.uploaded_bytes
+    result["animation"] = bench_animation(displayer, mlx, frames)
+    result["animation"]["uploaded_bytes"] = mlx.uploaded_bytes - uploaded
+    return result
+
+
+def main() -> None:
+    """Parse the arguments, run the benchmarks and output JSON.
+
+    Returns
+    -------
+    None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[20, 50, 100, 200])
+    parser.add_argument("--image-size", type=int, default=800)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    report: dict[str, Any] = {
+        "benchmark": "display",
+        "python": platform.python_version(),
+        "image_size": args.image_size,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "results": [
+            bench_size(size, args.image_size, args.repeat, args.frames,
+                       args.seed)
+            for size in args.sizes
+        ],
+    }
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+    else:
+        json.dump(report, sys.stdout, indent=4)
+        print()
+
+
+if __name__ == "__main__":
+    main()
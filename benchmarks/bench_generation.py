@@ -0,0 +1,318 @@
+"""Maze generation benchmarks, with a regression check against a baseline.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.bench_generation [--sizes 10 50 200 1000 2000]
+                                          [--repeat 3] [--output FILE]
+                                          [--baseline FILE]
+                                          [--tolerance 0.25]
+                                          [--update-baseline]
+                                          [--allow-missing]
+
+Every size is generated perfect and non-perfect, with and without the
+default icon. The construction (grid and icon) and each phase reported by
+``MazeGenerator.set_phase_callback()`` are timed separately: carve, breach,
+``check_maze`` (validation), ``shortest_path`` (solve) and
+``output_in_file`` (export, to memory). The best time of each phase is
+compared with the same case of the baseline, and the exit status is 1 if
+one is slower than the baseline by more than the tolerance, or if a case
+is missing from the baseline (unless ``--allow-missing`` is given).
+"""
+from mazegen.maze_generation import MazeGenerator
+from mazegen.maze_generation.maze import MazeError
+from mazegen.profiler import PhaseProfiler
+from typing import Any
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import sys
+
+
+ICON_FILE: str = "src/default_icon.txt"
+BASELINE_FILE: str = "benchmarks/baseline_generation.json"
+SIZES: list[int] = [10, 50, 200, 1000, 2000]
+PHASES: tuple[str, ...] = ("construction", "carve", "breach", "check_maze",
+                           "shortest_path", "output_in_file")
+
+
+def generate(size: int, perfect: bool, icon: bool,
+             seed: int) -> dict[str, float]:
+    """Generate and export a maze, timing each phase.
+
+    Parameters
+    ----------
+    size : int
+        Width and height of the maze, in cells.
+    perfect : bool
+        Whether the maze is perfect.
+    icon : bool
+        Whether the default icon is placed in the maze.
+    seed : int
+        Generation seed.
+
+    Returns
+    -------
+    dict[str, float]
+        Duration of each phase in seconds, see ``PHASES``.
+    """
+    profiler = PhaseProfiler(trace_memory=False)
+    profiler.start()
+    with profiler.phase("construction"):
+        icon_file = open(ICON_FILE) if icon else io.StringIO("")
+        with icon_file:
+            maze = MazeGenerator(size, size, (0, 0), (size - 1, size - 1),
+                                 perfect, seed, icon_file)
+    maze.set_phase_callback(profiler.switch)
+    maze.create_full_maze()
+    maze.output_in_file(io.StringIO())
+    profiler.stop()
+    return {record["name"]: record["duration"]
+            for record in profiler.records}
+
+
+def bench_case(size: int, perfect: bool, icon: bool, seed: int,
+               repeat: int) -> dict[str, Any]:
+    """Time the phases of several generations of the same maze.
+
+    Parameters
+    ----------
+    size : int
+        Width and height of the maze, in cells.
+    perfect : bool
+        Whether the maze is perfect.
+    icon : bool
+        Whether the default icon is placed in the maze.
+    seed : int
+        Generation seed, the same for every run.
+    repeat : int
+        Number of runs.
+
+    Returns
+    -------
+    dict[str, Any]
+        The case parameters, and for each phase the number of runs and
+        the min, mean and max duration in seconds. The error message is
+        set, and there are no phases, if the maze cannot be generated.
+    """
+    result: dict[str, Any] = {
+        "width": size, "height": size, "perfect": perfect, "icon": icon,
+        "seed": seed, "phases": {}, "error": "",
+    }
+    durations: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        gc.collect()
+        try:
+            run = generate(size, perfect, icon, seed)
+        except MazeError as error:
+            result["error"] = str(error)
+            return result
+        for phase, duration in run.items():
+            durations.setdefault(phase, []).append(duration)
+    result["phases"] = {
+        phase: {
+            "calls": len(durations[phase]),
+            "min": min(durations[phase]),
+            "mean": sum(durations[phase]) / len(durations[phase]),
+            "max": max(durations[phase]),
+        }
+        for phase in PHASES if phase in durations
+    }
+    return result
+
+
+def case_key(result: dict[str, Any]) -> tuple[int, int, bool, bool, int]:
+    """Return what identifies a benchmark case in a baseline.
+
+    Parameters
+    ----------
+    result : dict[str, Any]
+        Result of :func:`bench_case`.
+
+    Returns
+    -------
+    tuple[int, int, bool, bool, int]
+        Width, height, perfect, icon and seed of the case.
+    """
+    return (result["width"], result["height"], result["perfect"],
+            result["icon"], result["seed"])
+
+
+def compare(results: list[dict[str, Any]], baseline: list[dict[str, Any]],
+            tolerance: float, min_delta: float) -> tuple[int, int]:
+    """Compare the best phase times with a baseline.
+
+    Each result gets a ``"regressions"`` list of the phases slower than
+    the baseline by more than ``tolerance`` (relative) and ``min_delta``
+    (absolute, so that the noise of very short phases is ignored), and a
+    ``"missing"`` flag set when the baseline has no such case, so that it
+    could not be checked. Cases that could not be generated are not
+    compared.
+
+    Parameters
+    ----------
+    results : list[dict[str, Any]]
+        Results of :func:`bench_case`, updated in place.
+    baseline : list[dict[str, Any]]
+        Results of a previous run.
+    tolerance : float
+        Allowed slowdown, as a fraction of the baseline time.
+    min_delta : float
+        Allowed slowdown in seconds, whatever the tolerance.
+
+    Returns
+    -------
+    tuple[int, int]
+        Number of regressions and of cases missing from the baseline.
+    """
+    baseline_cases = {case_key(case): case for case in baseline}
+    count = 0
+    missing = 0
+    for result in results:
+        result["regressions"] = []
+        base = baseline_cases.get(case_key(result))
+        result["missing"] = base is None and not result["error"]
+        if result["missing"]:
+            missing += 1
+        if base is None:
+            continue
+        for phase, times in result["phases"].items():
+            base_times = base["phases"].get(phase)
+            if base_times is None:
+                continue
+            best, base_best = times["min"], base_times["min"]
+            if (best > base_best * (1 + tolerance)
+                    and best - base_best > min_delta):
+                result["regressions"].append(phase)
+                count += 1
+    return count, missing
+
+
+def format_table(results: list[dict[str, Any]]) -> str:
+    """Format the best phase times as a text table.
+
+    Parameters
+    ----------
+    results : list[dict[str, Any]]
+        Results of :func:`bench_case`, compared or not.
+
+    Returns
+    -------
+    str
+        One line per case with its times in milliseconds, the phases
+        slower than the baseline marked with ``!``, and a header.
+    """
+    header = ["size", "perfect", "icon"] + [f"{phase} (ms)"
+                                            for phase in PHASES]
+    rows = [header]
+    for result in results:
+        row = [f"{result['width']}x{result['height']}",
+               "yes" if result["perfect"] else "no",
+               "yes" if result["icon"] else "no"]
+        for phase in PHASES:
+            times = result["phases"].get(phase)
+            if times is None:
+                row.append(result["error"] and "error")
+                continue
+            mark = "!" if phase in result.get("regressions", []) else ""
+            row.append(f"{mark}{times['min'] * 1000:.2f}")
+        rows.append(row)
+    widths = [max(len(row[column]) for row in rows)
+              for column in range(len(header))]
+    lines = ["  ".join(value.ljust(width) if column == 0
+                       else value.rjust(width)
+                       for column, (value, width) in enumerate(zip(row,
+                                                                   widths)))
+             for row in rows]
+    lines.insert(1, "-" * len(lines[0]))
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Parse the arguments, run the benchmarks and check the baseline.
+
+    Returns
+    -------
+    None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="")
+    parser.add_argument("--baseline", default="",
+                        help=f"results to compare with, e.g. {BASELINE_FILE}")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown, as a fraction of the"
+                        " baseline time")
+    parser.add_argument("--min-delta", type=float, default=1.0,
+                        help="allowed slowdown in milliseconds")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write the results to the baseline file"
+                        " instead of comparing them")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="do not fail on cases missing from the"
+                        " baseline")
+    args = parser.parse_args()
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline needs --baseline")
+    if (args.baseline and not args.update_baseline
+            and not os.path.exists(args.baseline)):
+        parser.error(f"no baseline '{args.baseline}', record it first with"
+                     " --update-baseline")
+
+    results: list[dict[str, Any]] = []
+    for size in args.sizes:
+        for perfect in (True, False):
+            for icon in (False, True):
+                results.append(bench_case(size, perfect, icon, args.seed,
+                                          max(1, args.repeat)))
+
+    report: dict[str, Any] = {
+        "benchmark": "generation",
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "results": results,
+    }
+
+    regressions = 0
+    missing = 0
+    if args.baseline and args.update_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(report, baseline_file, indent=4)
+    elif args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline: dict[str, Any] = json.load(baseline_file)
+        regressions, missing = compare(results, baseline["results"],
+                                       args.tolerance, args.min_delta / 1000)
+        report.update(baseline=args.baseline, tolerance=args.tolerance,
+                      min_delta=args.min_delta, regressions=regressions,
+                      missing=missing)
+
+    print(format_table(results))
+    for result in results:
+        if result["error"]:
+            print(f"{result['width']}x{result['height']}: {result['error']}")
+    if args.baseline and not args.update_baseline:
+        for result in results:
+            if result["missing"]:
+                print(f"{result['width']}x{result['height']}"
+                      f" perfect={result['perfect']} icon={result['icon']}:"
+                      " not in the baseline")
+        print(f"{regressions} regressions over {args.tolerance:.0%}"
+              f" and {args.min_delta:g} ms, {missing} cases missing,"
+              f" against {args.baseline}")
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+
+    if regressions or (missing and not args.allow_missing):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Cold-start import benchmarks of the mazegen package.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.bench_import [--repeat 5] [--output FILE]
+
+Each import runs in a fresh interpreter with ``-X importtime``. The time
+of the best run is compared with the budget of the import, and imports
+that must work without a display are checked not to load the display or
+its MLX backend. The exit status is 1 if a check fails.
+"""
+from typing import Any
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+
+# Statement, budget in milliseconds and modules it must not load.
+IMPORTS: list[tuple[str, float, list[str]]] = [
+    ("import mazegen", 40.0, ["mazegen.display", "mlx"]),
+    ("from mazegen.maze_generation import MazeGenerator", 60.0,
+     ["mazegen.display", "mazegen.solver.arena", "mlx"]),
+    ("from mazegen.config import Config", 60.0, ["mazegen.display", "mlx"]),
+    ("from mazegen.solver import JunctionGraph", 80.0,
+     ["mazegen.display", "mlx"]),
+    ("from mazegen.display import HeadlessMlx", 60.0,
+     ["mazegen.display.display", "mlx"]),
+    ("from mazegen.display import Displayer", 150.0, ["mlx"]),
+    ("from mazegen.cli import main", 150.0, ["mazegen.display", "mlx"]),
+]
+
+
+def run_import(statement: str) -> tuple[float, set[str]]:
+    """Run an import in a new interpreter.
+
+    Parameters
+    ----------
+    statement : str
+        The import statement.
+
+    Returns
+    -------
+    tuple[float, set[str]]
+        Time of the imports done by the statement in seconds, from
+        ``-X importtime``, and the modules loaded once it ran.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    code = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, check=True)
+
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top level imports are not indented after the separator.
+        if name.startswith(" ") and not name.startswith("  "):
+            if cumulative.strip().isdigit():
+                total += int(cumulative)
+    return total / 1e6, set(process.stdout.split())
+
+
+def bench_imports(repeat: int,
+                  budget_scale: float = 1.0) -> list[dict[str, Any]]:
+    """Time every import of ``IMPORTS`` and check its modules.
+
+    Parameters
+    ----------
+    repeat : int
+        Number of runs of each import; the fastest is kept.
+    budget_scale : float, optional
+        Factor applied to every budget (default is 1.0).
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        For each import: its statement, best and budget times in seconds,
+        the forbidden modules it loaded and whether it passed.
+    """
+    _, startup_modules = run_import("pass")
+    results: list[dict[str, Any]] = []
+    for statement, budget, forbidden in IMPORTS:
+        times: list[float] = []
+        modules: set[str] = set()
+        for _ in range(repeat):
+            duration, modules = run_import(statement)
+            times.append(duration)
+        loaded = [name for name in forbidden
+                  if name in modules and name not in startup_modules]
+        best = min(times)
+        budget = budget * budget_scale / 1000
+        results.append({
+            "statement": statement,
+            "time": best,
+            "budget": budget,
+            "modules": len(modules - startup_modules),
+            "forbidden": loaded,
+            "passed": best <= budget and not loaded,
+        })
+    return results
+
+
+def main() -> None:
+    """Parse the arguments, run the benchmarks and print the results.
+
+    Returns
+    -------
+    None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="multiply every budget, for slow machines")
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    results = bench_imports(max(1, args.repeat), args.budget_scale)
+    for result in results:
+        status = "ok" if result["passed"] else "FAIL"
+        print(f"{status:4} {result['time'] * 1000:7.1f} ms"
+              f" / {result['budget'] * 1000:5.0f} ms"
+              f" {result['modules']:4} modules  {result['statement']}")
+        if result["forbidden"]:
+            print(f"     loads {', '.join(result['forbidden'])}")
+
+    if args.output:
+        report: dict[str, Any] = {
+            "benchmark": "import",
+            "python": platform.python_version(),
+            "repeat": args.repeat,
+            "budget_scale": args.budget_scale,
+            "results": results,
+        }
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+
+    if not all(result["passed"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Solver agent benchmarks run on many generated mazes.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.bench_solvers [--count 1000] [--size 50 50]
+                                       [--jobs 0] [--output FILE]
+
+A table of steps, time and memory per agent is printed, and the results
+are written as JSON to ``--output`` if given.
+"""
+from mazegen.solver import AGENTS, Arena
+from typing import Any
+import argparse
+import json
+import platform
+import time
+
+
+def main() -> None:
+    """Parse the arguments, run the arena and print the table.
+
+    Returns
+    -------
+    None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--size", type=int, nargs=2, default=[50, 50],
+                        metavar=("WIDTH", "HEIGHT"))
+    parser.add_argument("--imperfect", action="store_true")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--jobs", type=int, default=0)
+    parser.add_argument("--agents", nargs="+", default=list(AGENTS),
+                        choices=list(AGENTS))
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    width, height = args.size
+    tasks = [(width, height, (0, 0), (width - 1, height - 1),
+              not args.imperfect, seed, "")
+             for seed in range(args.seed, args.seed + args.count)]
+    arena = Arena(args.agents, args.jobs, not args.no_memory)
+
+    start = time.perf_counter()
+    results = arena.run(tasks)
+    duration = time.perf_counter() - start
+    summary = Arena.summarize(results)
+
+    print(Arena.format_table(summary, not args.no_memory))
+    print(f"{args.count} mazes of {width}x{height} in {duration:.2f} s")
+
+    if args.output:
+        report: dict[str, Any] = {
+            "benchmark": "solvers",
+            "python": platform.python_version(),
+            "width": width,
+            "height": height,
+            "perfect": not args.imperfect,
+            "count": args.count,
+            "seed": args.seed,
+            "duration": duration,
+            "summary": summary,
+            "results": results,
+        }
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
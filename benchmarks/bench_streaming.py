@@ -0,0 +1,246 @@
+"""End-to-end generation time with and without the streamed display.
+
+Usage (from the repository root)::
+
+    python -m benchmarks.bench_streaming [--sizes 50 100 200 300]
+                                         [--repeat 3] [--output FILE]
+                                         [--max-overhead 0.5]
+
+Each size is generated and shown on the headless MLX backend in two ways:
+
+- ``sequential``: ``create_full_maze()``, ``output_in_file()`` then
+  ``display()``, the window showing nothing until the maze is generated;
+- ``streaming``: a non-blocking ``GenerationWorker`` and
+  ``start_generation_display()``, as ``a_maze_ing.py`` does without
+  animation, until the full maze is displayed.
+
+The best time of each is printed with the streaming overhead, and the exit
+status is 1 if the overhead of a size is over ``--max-overhead``.
+"""
+from mazegen.display import Displayer, HeadlessMlx
+from mazegen.maze_generation import MazeGenerator, GenerationWorker
+from typing import Any, Callable
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+
+
+ICON_FILE: str = "src/default_icon.txt"
+
+
+def create_maze(size: int, seed: int) -> MazeGenerator:
+    """Create a square maze, not generated yet.
+
+    Parameters
+    ----------
+    size : int
+        Maze width and height in cells.
+    seed : int
+        Maze seed.
+
+    Returns
+    -------
+    MazeGenerator
+        The maze.
+    """
+    with open(ICON_FILE) as icon_file:
+        return MazeGenerator(size, size, (0, 0), (size - 1, size - 1),
+                             True, seed, icon_file)
+
+
+def create_displayer(maze: MazeGenerator, image_size: int) -> Displayer:
+    """Create a headless Displayer whose loop runs until it is idle.
+
+    Parameters
+    ----------
+    maze : MazeGenerator
+        Maze to display.
+    image_size : int
+        Image width and height in pixels.
+
+    Returns
+    -------
+    Displayer
+        The Displayer.
+    """
+    mlx = HeadlessMlx()
+    mlx.loop_iterations = sys.maxsize
+    window = (image_size, image_size)
+    return Displayer(window, window, maze, 5, mlx)
+
+
+def run_sequential(size: int, image_size: int, seed: int) -> None:
+    """Generate, write then display a maze.
+
+    Parameters
+    ----------
+    size : int
+        Maze width and height in cells.
+    image_size : int
+        Image width and height in pixels.
+    seed : int
+        Maze seed.
+
+    Returns
+    -------
+    None
+    """
+    maze = create_maze(size, seed)
+    displayer = create_displayer(maze, image_size)
+    maze.create_full_maze()
+    with open(os.devnull, "w") as output_file:
+        maze.output_in_file(output_file)
+    displayer.display(False)
+
+
+def run_streaming(size: int, image_size: int, seed: int) -> None:
+    """Display a maze while a worker generates and writes it.
+
+    Parameters
+    ----------
+    size : int
+        Maze width and height in cells.
+    image_size : int
+        Image width and height in pixels.
+    seed : int
+        Maze seed.
+
+    Raises
+    ------
+    RuntimeError
+        If the display finished before the maze.
+
+    Returns
+    -------
+    None
+    """
+    maze = create_maze(size, seed)
+    displayer = create_displayer(maze, image_size)
+    worker = GenerationWorker(maze, os.devnull, blocking=False).start()
+    displayer.start_generation_display(worker)
+    worker.join()
+    if not displayer.animation_finished or not worker.is_done():
+        raise RuntimeError("the display finished before the maze.")
+
+
+def time_run(function: Callable[[], Any]) -> float:
+    """Time one call of a function, after a garbage collection.
+
+    Parameters
+    ----------
+    function : Callable[[], Any]
+        Function to time.
+
+    Returns
+    -------
+    float
+        Duration in seconds.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def bench_size(size: int, image_size: int, repeat: int,
+               seed: int) -> dict[str, Any]:
+    """Time both ways of showing a maze of one size.
+
+    The runs alternate between the two, so that both see the same machine
+    load.
+
+    Parameters
+    ----------
+    size : int
+        Maze width and height in cells.
+    image_size : int
+        Image width and height in pixels.
+    repeat : int
+        Number of runs of each.
+    seed : int
+        Maze seed.
+
+    Returns
+    -------
+    dict[str, Any]
+        The size, the number of runs and min, mean and max duration in
+        seconds of each way, and the streaming overhead, relative to the
+        best sequential time.
+    """
+    runs: dict[str, Callable[[int, int, int], None]] = {
+        "sequential": run_sequential,
+        "streaming": run_streaming,
+    }
+    durations: dict[str, list[float]] = {name: [] for name in runs}
+    for _ in range(repeat):
+        for name, run in runs.items():
+            durations[name].append(time_run(
+                lambda: run(size, image_size, seed)))
+    result: dict[str, Any] = {"width": size, "height": size}
+    for name, times in durations.items():
+        result[name] = {
+            "calls": len(times),
+            "min": min(times),
+            "mean": sum(times) / len(times),
+            "max": max(times),
+        }
+    result["overhead"] = (result["streaming"]["min"]
+                          / result["sequential"]["min"] - 1)
+    return result
+
+
+def main() -> None:
+    """Parse the arguments, run the benchmarks and check the overhead.
+
+    Returns
+    -------
+    None
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[50, 100, 200, 300])
+    parser.add_argument("--image-size", type=int, default=800)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--max-overhead", type=float, default=0.5,
+                        help="allowed streaming slowdown, as a fraction of"
+                        " the sequential time")
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    results = [bench_size(size, args.image_size, max(1, args.repeat),
+                          args.seed)
+               for size in args.sizes]
+    report: dict[str, Any] = {
+        "benchmark": "streaming",
+        "python": platform.python_version(),
+        "image_size": args.image_size,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "max_overhead": args.max_overhead,
+        "results": results,
+    }
+
+    failed = 0
+    for result in results:
+        slow = result["overhead"] > args.max_overhead
+        failed += slow
+        print(f"{result['width']}x{result['height']}:"
+              f" sequential {result['sequential']['min'] * 1000:.1f} ms,"
+              f" streaming {result['streaming']['min'] * 1000:.1f} ms"
+              f" ({result['overhead']:+.0%}){' !' if slow else ''}")
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=4)
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
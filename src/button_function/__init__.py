@@ -3,11 +3,13 @@ from .path import change_path
 from .regenerate import regenerate_maze
 from .victory import victory_function
 from .seed_printer import print_seed
+from .solve import solve_maze
 
 __all__ = [
     "change_theme",
     "change_path",
     "regenerate_maze",
     "victory_function",
-    "print_seed"
+    "print_seed",
+    "solve_maze"
     ]
@@ -1,13 +1,15 @@
 from typing import Any
-from mazegen.maze_generation import MazeGenerator
+from mazegen.maze_generation import MazeGenerator, GenerationWorker
+from mazegen.display import Displayer
 
 
 def regenerate_maze(param: Any) -> None:
     """Generate a new maze and display it.
 
-    Creates a completely new maze with the given parameters, saves it to
-    a file, updates the displayer, and displays it either with animation
-    or static rendering.
+    Creates a completely new maze with the given parameters and generates
+    it in a background worker, which saves it to a file once done. The
+    displayer shows the new maze while it is generated, either animated or
+    as fast as possible.
 
     Parameters
     ----------
@@ -22,22 +24,25 @@ def regenerate_maze(param: Any) -> None:
         - perf : bool - Whether the maze should be perfect.
         - icon_name : str - Path to the icon file.
         - output_name : str - Path where the maze should be saved.
+        - seed : int, optional - Seed of the new maze (default is 0, for a
+          random one).
 
     Returns
     -------
     None
     """
-    displayer, animated, w, h, ent, ex, perf, icon_name, output_name = param
-    with open(output_name, "w") as output:
-        with open(icon_name, "r") as icon:
-            new_maze: MazeGenerator = MazeGenerator(
-                w, h, ent, ex, perf, 0, icon)
-            new_maze.create_full_maze()
-            new_maze.output_in_file(output)
+    displayer, animated, w, h, ent, ex, perf, icon_name, output_name = (
+        param[:9])
+    seed: int = param[9] if len(param) > 9 else 0
+    with open(icon_name, "r") as icon:
+        new_maze: MazeGenerator = MazeGenerator(
+            w, h, ent, ex, perf, seed, icon)
 
     displayer.set_maze(new_maze)
+    worker = GenerationWorker(
+        new_maze, output_name, blocking=animated).start()
+    displayer.clear(Displayer.VOID)
     if animated is True:
-        displayer.clear(0xFF000000)
-        displayer.start_animated_display(60)
+        displayer.start_animated_display(displayer.fps, False, worker)
     else:
-        displayer.display(False)
+        displayer.start_generation_display(worker, False)
@@ -0,0 +1,25 @@
+from mazegen.display import Displayer
+
+
+def solve_maze(param: tuple[Displayer, str]) -> None:
+    """Start or remove the solver animation.
+
+    Starts animating the frontier solver if it is not shown, otherwise
+    removes it from the maze.
+
+    Parameters
+    ----------
+    param : tuple
+        A tuple containing:
+        - displayer : Displayer - The Displayer instance to solve on.
+        - algorithm : str - Solver algorithm ("bfs" or "astar").
+
+    Returns
+    -------
+    None
+    """
+    displayer, algorithm = param
+    if displayer.is_solver_shown():
+        displayer.clear_solver()
+    else:
+        displayer.start_solver_animation(algorithm, displayer.fps)
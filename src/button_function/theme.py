@@ -19,6 +19,7 @@ def theme_purple(displayer: Displayer) -> None:
     displayer.set_color("entry", (180, 0, 255))
     displayer.set_color("exit", (230, 150, 255))
     displayer.set_color("path", (140, 70, 200))
+    displayer.set_color("frontier", (85, 35, 125))
     displayer.set_color("icon", (255, 220, 255))
 
 
@@ -39,6 +40,7 @@ def theme_blue(displayer: Displayer) -> None:
     displayer.set_color("entry", (0, 120, 255))
     displayer.set_color("exit", (120, 200, 255))
     displayer.set_color("path", (0, 80, 180))
+    displayer.set_color("frontier", (2, 45, 110))
     displayer.set_color("icon", (200, 230, 255))
 
 
@@ -59,6 +61,7 @@ def theme_yellow(displayer: Displayer) -> None:
     displayer.set_color("entry", (255, 200, 0))
     displayer.set_color("exit", (255, 240, 120))
     displayer.set_color("path", (200, 160, 0))
+    displayer.set_color("frontier", (120, 95, 0))
     displayer.set_color("icon", (255, 255, 200))
 
 
@@ -79,6 +82,7 @@ def theme_green(displayer: Displayer) -> None:
     displayer.set_color("entry", (0, 200, 80))
     displayer.set_color("exit", (120, 255, 180))
     displayer.set_color("path", (0, 140, 60))
+    displayer.set_color("frontier", (0, 85, 35))
     displayer.set_color("icon", (200, 255, 220))
 
 
@@ -99,6 +103,7 @@ def theme_orange(displayer: Displayer) -> None:
     displayer.set_color("entry", (255, 120, 0))
     displayer.set_color("exit", (255, 200, 120))
     displayer.set_color("path", (200, 90, 0))
+    displayer.set_color("frontier", (125, 55, 0))
     displayer.set_color("icon", (255, 230, 200))
 
 
@@ -119,6 +124,7 @@ def theme_red(displayer: Displayer) -> None:
     displayer.set_color("entry", (220, 0, 0))
     displayer.set_color("exit", (255, 120, 120))
     displayer.set_color("path", (180, 30, 30))
+    displayer.set_color("frontier", (110, 15, 15))
     displayer.set_color("icon", (255, 200, 200))
 
 
@@ -139,6 +145,7 @@ def theme_pink(displayer: Displayer) -> None:
     displayer.set_color("entry", (255, 0, 150))
     displayer.set_color("exit", (255, 150, 220))
     displayer.set_color("path", (200, 60, 140))
+    displayer.set_color("frontier", (120, 30, 85))
     displayer.set_color("icon", (255, 220, 240))
 
 
@@ -159,6 +166,7 @@ def theme_multicolor(displayer: Displayer) -> None:
     displayer.set_color("entry", (0, 200, 0))
     displayer.set_color("exit", (255, 0, 0))
     displayer.set_color("path", (255, 200, 0))
+    displayer.set_color("frontier", (137, 110, 10))
     displayer.set_color("icon", (200, 0, 255))
 
 
@@ -167,6 +175,8 @@ def change_theme(displayer: Displayer) -> Generator[None, None, None]:
 
     Creates a generator that cycles through all available color themes
     and applies them to the displayer when the generator is advanced.
+    Only the palette changes, so the image is recolored in place instead
+    of redrawing the maze.
 
     Parameters
     ----------
@@ -176,7 +186,7 @@ def change_theme(displayer: Displayer) -> Generator[None, None, None]:
     Yields
     ------
     None
-        On each iteration, applies the next theme and refreshes the display.
+        On each iteration, applies the next theme and recolors the display.
     """
     themes: list[Callable[[Any], Any]] = [theme_purple,
                                           theme_blue,
@@ -192,6 +202,7 @@ def change_theme(displayer: Displayer) -> Generator[None, None, None]:
 
     while True:
         themes[i % len_themes](displayer)
-        displayer.display(False)
+        displayer.apply_palette()
+        displayer.put_image()
         i += 1
         yield None
@@ -1,4 +1,4 @@
-from mazegen.display import Displayer
+from mazegen.display import Displayer, AssetError
 from typing import Any
 
 
@@ -48,7 +48,8 @@ def victory_function(param: tuple[Displayer, tuple[int, int]]) -> None:
     """Display a victory screen if the player reaches the exit.
 
     Creates and displays a victory image window when the player position
-    equals the maze exit position.
+    equals the maze exit position. The image is decoded on the first
+    victory only, then reused from the displayer assets.
 
     Parameters
     ----------
@@ -72,13 +73,12 @@ def victory_function(param: tuple[Displayer, tuple[int, int]]) -> None:
         mlx = displayer.get_mlx()
         mlx_ptr = displayer.get_mlx_ptr()
 
-        img = mlx.mlx_xpm_file_to_image(mlx_ptr, path)
-        img_ptr, x, y = img
+        try:
+            img_ptr, x, y = displayer.get_assets().get_image(path)
+        except AssetError:
+            raise ImageError("loading image failed.")
         win_ptr = mlx.mlx_new_window(mlx_ptr, x, y, "Victory !")
 
-        if img == (None, 0, 0):
-            close((mlx, mlx_ptr, win_ptr))
-            raise ImageError("loading image failed.")
         mlx.mlx_put_image_to_window(mlx_ptr, win_ptr, img_ptr, 0, 0)
         mlx.mlx_hook(win_ptr, 33, 1 << 17, close, (mlx, mlx_ptr, win_ptr))
         mlx.mlx_hook(win_ptr, 2, 1 << 0, key_press, (mlx, mlx_ptr, win_ptr))
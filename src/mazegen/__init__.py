@@ -1,7 +1,21 @@
-from . import config, display, maze_generation
+from mazegen.lazy import lazy_exports
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import config, display, maze_generation, solver
+
+# Subpackages are imported on first access: maze generation does not load
+# the display and its MLX backend.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "config": ".config",
+    "display": ".display",
+    "maze_generation": ".maze_generation",
+    "solver": ".solver",
+    })
 
 __all__ = [
     "config",
     "display",
-    "maze_generation"
+    "maze_generation",
+    "solver"
     ]
@@ -0,0 +1,4 @@
+from mazegen.cli import main
+import sys
+
+sys.exit(main())
@@ -0,0 +1,580 @@
+"""Command line interface of mazegen, usable without a display.
+
+Usage::
+
+    mazegen generate [CONFIG] [--set KEY=VALUE ...] [--count N] [--jobs N]
+                     [--format text|json] [--no-output]
+    mazegen solve MAZE_FILE ... [--agent NAME] [--format text|json]
+    mazegen validate MAZE_FILE ... [--format text|json]
+    mazegen render [CONFIG] [--set KEY=VALUE ...] [--output FILE]
+                   [--format apng|ppm] [--animated]
+    mazegen bench [CONFIG] [--set KEY=VALUE ...] [--count N] [--jobs N]
+                  [--agents NAME ...] [--memory] [--format text|json]
+
+``CONFIG`` is a configuration file with the keys of ``a_maze_ing.py``,
+including the sweep syntax of :class:`ConfigSweep`; ``--set`` overrides
+or adds one of its lines. The display and MLX are only imported by
+``render``, which draws on a headless backend.
+"""
+from mazegen.config import Config, ConfigSweep, create_config
+from mazegen.maze_generation.batch import GenerationTask, generate_batch
+from mazegen.solver.agents import AGENTS
+from mazegen.solver.compact import CompactMaze
+from mazegen.solver.junction import JunctionGraph
+from collections import deque
+from typing import Any, Iterator
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+
+# Output file letter of each wall bit, and wall bit of each letter.
+LETTERS: dict[int, str] = {
+    CompactMaze.NORTH: "N", CompactMaze.EST: "E",
+    CompactMaze.SOUTH: "S", CompactMaze.WEST: "W",
+}
+DIRECTIONS: dict[str, int] = {
+    letter: direction for direction, letter in LETTERS.items()}
+
+
+def load_sweep(config_file_name: str, settings: list[str]) -> ConfigSweep:
+    """Parse a configuration file and command line settings.
+
+    Parameters
+    ----------
+    config_file_name : str
+        Configuration file, empty for the defaults only.
+    settings : list[str]
+        ``KEY=VALUE`` lines, replacing the lines of the same keys.
+
+    Raises
+    ------
+    ConfigError
+        If the configuration is invalid.
+
+    Returns
+    -------
+    ConfigSweep
+        The configurations to run.
+    """
+    lines: list[str] = []
+    if config_file_name:
+        with open(config_file_name) as config_file:
+            lines = config_file.read().splitlines()
+    keys = {setting.partition("=")[0].strip() for setting in settings}
+    lines = [line for line in lines
+             if line.partition("=")[0].strip() not in keys] + settings
+    config = Config()
+    create_config(config)
+    return ConfigSweep(config, io.StringIO("\n".join(lines) + "\n"))
+
+
+def generation_tasks(sweep: ConfigSweep, count: int = 1,
+                     write: bool = True) -> Iterator[GenerationTask]:
+    """Turn the combinations of a sweep into generation tasks.
+
+    Each combination gives ``count`` mazes, with the consecutive seeds
+    from ``SEED * count`` (random seeds if ``SEED`` is 0), so that two
+    ``SEED`` values of a sweep never give the same maze. When there is more
+    than one maze, the index of each maze is added to its output file name,
+    before the extension.
+
+    Parameters
+    ----------
+    sweep : ConfigSweep
+        The configurations.
+    count : int, optional
+        Number of mazes per combination (default is 1).
+    write : bool, optional
+        Whether the mazes are written to their output files (default is
+        True).
+
+    Returns
+    -------
+    Iterator[GenerationTask]
+        The tasks, built as they are read.
+    """
+    total = len(sweep) * count
+    digits = len(str(total - 1))
+    index = 0
+    for config in sweep:
+        seed: int = config.get_value("SEED")
+        output_file_name: str = config.get_value("OUTPUT_FILE")
+        root, extension = os.path.splitext(output_file_name)
+        for number in range(count):
+            if not write:
+                output_file_name = ""
+            elif total > 1:
+                output_file_name = f"{root}_{index:0{digits}}{extension}"
+            yield (config.get_value("WIDTH"), config.get_value("HEIGHT"),
+                   config.get_value("ENTRY"), config.get_value("EXIT"),
+                   config.get_value("PERFECT"),
+                   seed * count + number if seed != 0 else 0,
+                   config.get_value("ICON_FILE"), output_file_name)
+            index += 1
+
+
+def print_record(record: dict[str, Any], fmt: str, text: str) -> None:
+    """Print a result as a JSON line or as text.
+
+    Parameters
+    ----------
+    record : dict[str, Any]
+        The result.
+    fmt : str
+        "json" or "text".
+    text : str
+        Text of the result.
+
+    Returns
+    -------
+    None
+    """
+    print(json.dumps(record) if fmt == "json" else text, flush=True)
+
+
+def command_generate(args: argparse.Namespace) -> int:
+    """Generate the mazes of a configuration, in worker processes.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The command line arguments.
+
+    Returns
+    -------
+    int
+        Exit status, 1 if a maze could not be generated.
+    """
+    sweep = load_sweep(args.config, args.set)
+    tasks = generation_tasks(sweep, args.count, not args.no_output)
+    failed = 0
+    start = time.perf_counter()
+    for result in generate_batch(tasks, args.jobs):
+        if result["error"]:
+            failed += 1
+            text = f"{result['output']}: {result['error']}"
+        else:
+            text = (f"{result['output'] or '-'}: {result['width']}x"
+                    f"{result['height']} seed {result['seed']},"
+                    f" path {result['path']}")
+        print_record(result, args.format, text)
+    if args.format == "text":
+        total = len(sweep) * args.count
+        print(f"{total - failed} mazes generated, {failed} failed"
+              f" in {time.perf_counter() - start:.2f} s")
+    return 1 if failed else 0
+
+
+def read_maze(content: str) -> tuple[CompactMaze, str]:
+    """Read a maze output file.
+
+    Parameters
+    ----------
+    content : str
+        Content of the file.
+
+    Raises
+    ------
+    ValueError
+        If the content is not a maze output file.
+
+    Returns
+    -------
+    tuple[CompactMaze, str]
+        The maze and the path letters written after it.
+    """
+    maze = CompactMaze.from_file(io.StringIO(content))
+    lines = content.split("\n")
+    if "" not in lines or len(lines[0]) != maze.width:
+        raise ValueError("invalid maze file.")
+    header = lines.index("")
+    if any(len(row) != maze.width for row in lines[:header]):
+        raise ValueError("rows of different lengths.")
+    path = lines[header + 3] if len(lines) > header + 3 else ""
+    return maze, path.strip()
+
+
+def path_letters(maze: CompactMaze, cells: list[int]) -> str:
+    """Return the output file letters of a path.
+
+    Parameters
+    ----------
+    maze : CompactMaze
+        The maze.
+    cells : list[int]
+        Consecutive cell indexes.
+
+    Returns
+    -------
+    str
+        One of "NESW" per move.
+    """
+    steps = {maze.move(0, direction): letter
+             for direction, letter in LETTERS.items()}
+    return "".join(steps[after - before]
+                   for before, after in zip(cells, cells[1:]))
+
+
+def command_solve(args: argparse.Namespace) -> int:
+    """Solve maze output files with an agent.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The command line arguments.
+
+    Returns
+    -------
+    int
+        Exit status, 1 if a maze could not be read or solved.
+    """
+    status = 0
+    for file_name in args.files:
+        record: dict[str, Any] = {"file": file_name, "agent": args.agent}
+        try:
+            with open(file_name) as maze_file:
+                maze, _ = read_maze(maze_file.read())
+        except (OSError, ValueError) as error:
+            status = 1
+            record["error"] = str(error)
+            print_record(record, args.format, f"{file_name}: {error}")
+            continue
+        agent = AGENTS[args.agent](maze)
+        start = time.perf_counter()
+        solved = agent.run()
+        path = path_letters(maze, agent.get_path()) if solved else ""
+        record.update(solved=solved, steps=agent.steps, length=len(path),
+                      time=time.perf_counter() - start, path=path)
+        if not solved:
+            status = 1
+        print_record(record, args.format,
+                     f"{file_name}: {len(path)} moves in {agent.steps}"
+                     f" steps, {path}" if solved
+                     else f"{file_name}: no path found")
+    return status
+
+
+def validate_maze(content: str) -> dict[str, Any]:
+    """Check a maze output file.
+
+    The walls have to be closed on the border and the same on both sides,
+    the entry and the exit inside the maze, and the path of the file a
+    shortest path from the entry to the exit.
+
+    Parameters
+    ----------
+    content : str
+        Content of the file.
+
+    Returns
+    -------
+    dict[str, Any]
+        Whether the maze is valid, the errors found, its size, whether it
+        is perfect and the lengths of its path and of a shortest path.
+    """
+    report: dict[str, Any] = {"valid": False, "errors": []}
+    errors: list[str] = report["errors"]
+    try:
+        maze, path = read_maze(content)
+    except ValueError as error:
+        errors.append(str(error))
+        return report
+    width, height, walls = maze.width, maze.height, maze.walls
+    report.update(width=width, height=height)
+
+    lines = content.split("\n")
+    header = lines.index("")
+    for name in ("entry", "exit"):
+        x, y = (int(value) for value in
+                lines[header + (1 if name == "entry" else 2)].split(","))
+        if not (0 <= x < width and 0 <= y < height):
+            errors.append(f"{name} ({x},{y}) is outside the maze.")
+    if errors:
+        return report
+    if maze.entry == maze.exit:
+        errors.append("entry and exit are the same cell.")
+
+    border = 0
+    mismatches = 0
+    for index in range(width * height):
+        x, y = maze.coords(index)
+        for direction, closed_at in ((CompactMaze.NORTH, y == 0),
+                                     (CompactMaze.WEST, x == 0),
+                                     (CompactMaze.SOUTH, y == height - 1),
+                                     (CompactMaze.EST, x == width - 1)):
+            if closed_at and maze.is_open(index, direction):
+                border += 1
+        if x + 1 < width and (bool(walls[index] & CompactMaze.EST)
+                              != bool(walls[index + 1] & CompactMaze.WEST)):
+            mismatches += 1
+        if y + 1 < height and (
+                bool(walls[index] & CompactMaze.SOUTH)
+                != bool(walls[index + width] & CompactMaze.NORTH)):
+            mismatches += 1
+    if border:
+        errors.append(f"{border} open border wall(s).")
+    if mismatches:
+        errors.append(f"{mismatches} wall(s) different on each side.")
+    if errors:
+        return report
+
+    # The cells reachable from the entry, and the passages between them.
+    seen = {maze.entry}
+    queue = deque([maze.entry])
+    passages = 0
+    while queue:
+        index = queue.popleft()
+        for neighbor in maze.neighbors(index):
+            passages += 1
+            if neighbor not in seen:
+                seen.add(neighbor)
+                queue.append(neighbor)
+    open_cells = sum(1 for cell_walls in walls if cell_walls & 15 != 15)
+    report["perfect"] = (len(seen) == open_cells
+                         and passages // 2 == len(seen) - 1)
+
+    shortest = JunctionGraph(maze).solve()
+    report["shortest"] = len(shortest) - 1
+    report["path"] = len(path)
+    if not shortest:
+        errors.append("the exit cannot be reached.")
+        return report
+    index = maze.entry
+    for letter in path:
+        move = DIRECTIONS.get(letter)
+        if move is None or not maze.is_open(index, move):
+            errors.append(f"the path goes through a wall at"
+                          f" {maze.coords(index)}.")
+            return report
+        index = maze.move(index, move)
+    if index != maze.exit:
+        errors.append("the path does not end at the exit.")
+    elif len(path) != report["shortest"]:
+        errors.append(f"the path has {len(path)} moves, the shortest has"
+                      f" {report['shortest']}.")
+    report["valid"] = not errors
+    return report
+
+
+def command_validate(args: argparse.Namespace) -> int:
+    """Validate maze output files.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The command line arguments.
+
+    Returns
+    -------
+    int
+        Exit status, 1 if a maze is invalid.
+    """
+    status = 0
+    for file_name in args.files:
+        try:
+            with open(file_name) as maze_file:
+                report = validate_maze(maze_file.read())
+        except OSError as error:
+            report = {"valid": False, "errors": [str(error)]}
+        report = {"file": file_name, **report}
+        if report["valid"]:
+            perfect = "perfect" if report["perfect"] else "imperfect"
+            text = (f"{file_name}: ok, {report['width']}x{report['height']}"
+                    f" {perfect}, path {report['path']}")
+        else:
+            status = 1
+            text = f"{file_name}: " + " ".join(report["errors"])
+        print_record(report, args.format, text)
+    return status
+
+
+def command_render(args: argparse.Namespace) -> int:
+    """Draw the maze of a configuration into an image file.
+
+    The display is imported here only, and drawn on a headless backend.
+    With ``--animated``, the whole generation animation is recorded.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The command line arguments.
+
+    Returns
+    -------
+    int
+        Exit status.
+    """
+    from mazegen.display import AnimationRecorder, Displayer, HeadlessMlx
+    from mazegen.display import VirtualClock, record_headless
+    from mazegen.maze_generation import GenerationWorker, MazeGenerator
+
+    config = next(iter(load_sweep(args.config, args.set)))
+    with open(config.get_value("ICON_FILE")) as icon_file:
+        maze = MazeGenerator(
+            config.get_value("WIDTH"), config.get_value("HEIGHT"),
+            config.get_value("ENTRY"), config.get_value("EXIT"),
+            config.get_value("PERFECT"), config.get_value("SEED"),
+            icon_file)
+    if not args.animated:
+        maze.create_full_maze()
+
+    clock = VirtualClock()
+    window_size, image_size = config.get_value("MAZE_SIZE")
+    displayer = Displayer(window_size, image_size, maze,
+                          config.get_value("WALL_THICKNESS"), HeadlessMlx(),
+                          clock, clock.sleep)
+    if config.get_value("CUSTOM_COLORS"):
+        for location in ("background", "walls", "icon", "entry", "exit",
+                         "path", "frontier"):
+            displayer.set_color(location,
+                                config.get_value(f"{location.upper()}_COLOR"))
+    displayer.set_toggle_path(config.get_value("TOGGLE_PATH"))
+
+    fps: int = config.get_value("FPS")
+    recorder = AnimationRecorder(args.output, args.format, fps=fps)
+    if args.animated:
+        displayer.set_animation_duration(
+            config.get_value("ANIMATION_DURATION"))
+        displayer.start_animated_display(
+            fps, False, GenerationWorker(maze).start())
+        record_headless(displayer, recorder)
+    else:
+        displayer.set_recorder(recorder)
+        displayer.display(False)
+        displayer.set_recorder(None)
+        recorder.close()
+    print(f"{args.output}: {recorder.written} frame(s) of"
+          f" {maze.get_width()}x{maze.get_height()}, seed {maze.get_seed()}")
+    return 0
+
+
+def command_bench(args: argparse.Namespace) -> int:
+    """Compare solver agents on the mazes of a configuration.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        The command line arguments.
+
+    Returns
+    -------
+    int
+        Exit status.
+    """
+    from mazegen.solver.arena import Arena
+
+    sweep = load_sweep(args.config, args.set)
+    tasks = [(width, height, entry, _exit, perfect, seed, icon_file)
+             for width, height, entry, _exit, perfect, seed, icon_file, _
+             in generation_tasks(sweep, args.count, False)]
+    arena = Arena(args.agents, args.jobs, args.memory)
+    start = time.perf_counter()
+    summary = Arena.summarize(arena.run(tasks))
+    duration = time.perf_counter() - start
+    if not args.memory:
+        for line in summary:
+            del line["memory"]
+    if args.format == "json":
+        print(json.dumps({"count": len(tasks), "duration": duration,
+                          "summary": summary}))
+    else:
+        print(Arena.format_table(summary, args.memory))
+        print(f"{len(tasks)} mazes in {duration:.2f} s")
+    return 0
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Build the parser of the command line.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser, with a subparser per command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="mazegen", description=__doc__.split("\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_config(command: argparse.ArgumentParser) -> None:
+        command.add_argument("config", nargs="?", default="",
+                             help="configuration file")
+        command.add_argument("--set", action="append", default=[],
+                             metavar="KEY=VALUE",
+                             help="override a configuration line")
+
+    generate = commands.add_parser("generate", help="generate mazes")
+    add_config(generate)
+    generate.add_argument("--count", type=int, default=1,
+                          help="mazes per configuration")
+    generate.add_argument("--jobs", type=int, default=0,
+                          help="worker processes, 0 for one per CPU")
+    generate.add_argument("--format", choices=("text", "json"),
+                          default="text")
+    generate.add_argument("--no-output", action="store_true",
+                          help="do not write the output files")
+    generate.set_defaults(function=command_generate)
+
+    solve = commands.add_parser("solve", help="solve maze files")
+    solve.add_argument("files", nargs="+", metavar="MAZE_FILE")
+    solve.add_argument("--agent", choices=list(AGENTS), default="junction")
+    solve.add_argument("--format", choices=("text", "json"), default="text")
+    solve.set_defaults(function=command_solve)
+
+    validate = commands.add_parser("validate", help="check maze files")
+    validate.add_argument("files", nargs="+", metavar="MAZE_FILE")
+    validate.add_argument("--format", choices=("text", "json"),
+                          default="text")
+    validate.set_defaults(function=command_validate)
+
+    render = commands.add_parser("render", help="draw a maze to an image")
+    add_config(render)
+    render.add_argument("--output", default="maze.png")
+    render.add_argument("--format", choices=("apng", "ppm"), default="apng")
+    render.add_argument("--animated", action="store_true",
+                        help="record the generation animation")
+    render.set_defaults(function=command_render)
+
+    bench = commands.add_parser("bench", help="compare solver agents")
+    add_config(bench)
+    bench.add_argument("--count", type=int, default=100,
+                       help="mazes per configuration")
+    bench.add_argument("--jobs", type=int, default=0,
+                       help="worker processes, 0 for one per CPU")
+    bench.add_argument("--agents", nargs="+", choices=list(AGENTS),
+                       default=list(AGENTS))
+    bench.add_argument("--memory", action="store_true",
+                       help="measure the peak memory of each agent, which"
+                       " slows them down")
+    bench.add_argument("--format", choices=("text", "json"), default="text")
+    bench.set_defaults(function=command_bench)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a command.
+
+    Parameters
+    ----------
+    argv : list[str] | None, optional
+        The arguments, without the program name (default is None, for
+        ``sys.argv``).
+
+    Returns
+    -------
+    int
+        Exit status: 0 on success, 1 if a maze failed, 2 on errors.
+    """
+    args = create_parser().parse_args(argv)
+    if getattr(args, "count", 1) < 1:
+        print("mazegen: --count has to be positive.", file=sys.stderr)
+        return 2
+    try:
+        status: int = args.function(args)
+    except Exception as error:
+        print(f"mazegen: {error}", file=sys.stderr)
+        return 2
+    return status
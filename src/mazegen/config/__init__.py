@@ -1,3 +1,17 @@
-from .config import Config
+from mazegen.lazy import lazy_exports
+from typing import TYPE_CHECKING
 
-__all__ = ["Config"]
+if TYPE_CHECKING:
+    from .config import Config
+    from .watcher import ConfigWatcher
+    from .sweep import ConfigSweep
+    from .defaults import create_config
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Config": ".config",
+    "ConfigWatcher": ".watcher",
+    "ConfigSweep": ".sweep",
+    "create_config": ".defaults",
+    })
+
+__all__ = ["Config", "ConfigWatcher", "ConfigSweep", "create_config"]
@@ -1,6 +1,11 @@
 from typing import TextIO
 from typing import Any
+from typing import Callable
 from typing import Iterator
+import copy
+
+
+Parser = Callable[[str, str], Any]
 
 
 class ConfigError(Exception):
@@ -27,11 +32,17 @@ class Config():
     This class provides utilities to register configuration parameters,
     parse them from a file, validate their types, and retrieve their values.
 
+    Each type specification is compiled once into a parser (see
+    :meth:`compile_type`), shared by every instance registering the same
+    specification.
+
     Attributes
     ----------
     commentary_str : str
         The prefix string used to identify comment lines (default is "#").
     """
+    __compiled: dict[str, tuple[Any, Parser]] = {}
+
     def __init__(self) -> None:
         """Initialize an empty configuration registry.
 
@@ -43,7 +54,7 @@ class Config():
         None
         """
         self.__config: dict[str, Any] = {}
-        self.__config = {}
+        self.__parsers: dict[str, Parser] = {}
         self.__commentary_str: str = "#"
 
     def set_commentary_str(self, commentary_str: str) -> None:
@@ -101,8 +112,9 @@ class Config():
             * nested_types is a list of type specifications (one per element),
             * separator is the string used to split the input value
 
-        This method automatically appends an internal boolean flag indicating
-        whether the parameter has already been set.
+        This method stores a copy of ``param`` with an internal boolean flag
+        appended, indicating whether the parameter has already been set. The
+        type specification is compiled here, once.
 
         Parameters
         ----------
@@ -113,6 +125,11 @@ class Config():
             A list containing the default value and its associated type
             specification.
 
+        Raises
+        ------
+        ConfigError
+            If the type specification is malformed.
+
         Returns
         -------
         None
@@ -129,8 +146,26 @@ class Config():
         ...      [tuple, 3, [[int], [int], [int]], ","]])
         """
         config = self.get_config()
-        param.append(False)
-        config.update({name: param})
+        self.__parsers[name] = Config.compile_type(param[1])
+        config.update({name: [param[0], param[1], False]})
+
+    def copy(self) -> "Config":
+        """Return an independent copy of the configuration.
+
+        The parameters, their values and compiled parsers are copied; the
+        values themselves are shared.
+
+        Returns
+        -------
+        Config
+            The new configuration.
+        """
+        config = Config()
+        config.__commentary_str = self.__commentary_str
+        config.__parsers = self.__parsers.copy()
+        config.__config = {name: list(parameter)
+                           for name, parameter in self.__config.items()}
+        return config
 
     def get_config(self) -> dict[str, list[Any]]:
         """Return the internal configuration dictionary.
@@ -146,8 +181,10 @@ class Config():
         """Parse a configuration file and update parameter values.
 
         Each non-empty and non-comment line must follow the format:
-        `PARAMETER=VALUE`. The value is validated and converted
-        according to its declared type specification.
+        `PARAMETER=VALUE`. The value is validated and converted by the
+        compiled parser of its type specification. A parameter may be
+        declared once per file; parsing another file overrides the values
+        it declares.
 
         Parameters
         ----------
@@ -166,18 +203,21 @@ class Config():
         None
         """
         config = self.get_config()
-        parameters = config.keys()
+        parsers = self.__parsers
+        commentary_str = self.get_commentary_str()
+        declared: set[str] = set()
         for line in self.get_next_line(file):
-            if line == "\n" or line.startswith(self.get_commentary_str()):
+            if line == "\n" or line.startswith(commentary_str):
                 continue
             parameter, value = self.get_unprocessed_value(line)
-            if parameter in parameters:
-                new_value = self.apply_types(parameter, config[parameter],
-                                             value)
-                config[parameter][0] = new_value
-                config[parameter][2] = True
-            else:
+            parser = parsers.get(parameter)
+            if parser is None:
                 raise ConfigError(f"Unknown parameter: {parameter}")
+            if parameter in declared:
+                raise ConfigError(f"Double declaration for \"{parameter}\"")
+            declared.add(parameter)
+            config[parameter][0] = parser(value, parameter)
+            config[parameter][2] = True
 
         self.check_config()
 
@@ -206,19 +246,9 @@ class Config():
         """Convert a configuration parameter value to its declared type.
 
         This method validates and converts a string value according to the
-        type specification stored in ``parameter_list``. Supported types are:
-
-        - bool: accepts the strings "True" or "False" (not case-insensitive).
-        - simple types: any callable type such as int, str or float.
-        - tuple: a structured tuple with:
-            * a fixed number of elements,
-            * a list of nested type specifications,
-            * a separator used to split the input string.
-
-        Tuple types can be nested recursively (e.g., tuple of tuples).
-
-        The method also ensures that a parameter is not declared more than
-        once.
+        type specification stored in ``parameter_list``, with its compiled
+        parser (see :meth:`compile_type`). It also ensures that a parameter
+        is not declared more than once.
 
         Parameters
         ----------
@@ -244,81 +274,131 @@ class Config():
         ConfigError
             If the parameter is declared more than once.
             If the value does not match the expected type specification.
-            If a tuple has an invalid number of elements.
-            If a boolean value is not "True" or "False".
         """
-        already_processed = parameter_list[2]
-        separator: str = ""
-        if already_processed is True:
+        if parameter_list[2] is True:
             raise ConfigError(f"Double declaration for \"{parameter}\"")
+        return Config.compile_type(parameter_list[1])(value, parameter)
 
-        real_type = parameter_list[1]
-        if real_type[0] == bool:
-            if value.capitalize() == "True":
-                value = True
-            elif value.capitalize() == "False":
-                value = False
-            else:
-                raise (ConfigError(
-                    f"invalid argument \"{value}\" for {parameter}"))
-
-        elif real_type[0] == tuple:
-            separator = real_type[3]
-            new_value = value.split(separator)
-
-            n_types = real_type[1]
-            if n_types != len(new_value):
-                raise (ConfigError(
-                    f"invalid argument \"{value}\" for {parameter}"
-                    )
-                )
+    @staticmethod
+    def compile_type(real_type: list[Any]) -> Parser:
+        """Compile a type specification into a parser.
 
-            types = real_type[2]
-            if n_types != len(types):
-                raise (ConfigError(
-                    f"invalid argument \"{value}\" for {parameter}"
-                    )
-                )
+        Supported types are:
 
-            value = []
-            for i, nested_real_type in enumerate(types):
-                type_list: list[Any] = []
-                type_list.append(None)
-                type_list.append(nested_real_type)
-                type_list.append(False)
-                value.append(self.apply_types(parameter,
-                                              type_list, new_value[i]))
-            value = tuple(value)
-
-        elif real_type[0] == dict:
-            separator = real_type[2]
-            real_type.insert(1, len(value.split(separator)))
-            real_type[0] = tuple
-            tuple_value: tuple[Any] = self.apply_types(
-                    parameter, parameter_list, value
-                )
-            list_value: list[tuple[Any]] = list(tuple_value)
-
-            for element in list_value:
-                if len(element) != 2:
-                    raise ConfigError(
-                            f"invalid argument \"{value}\" for {parameter}"
-                        )
-
-            result: dict[Any, Any] = {}
-            for element in list_value:
-                if not isinstance(element, (list, tuple)) or len(element) != 2:
-                    raise ConfigError(
-                        f"invalid argument \"{value}\" for {parameter}"
-                    )
-                k, v = element[0], element[1]
-                result[k] = v
-            value = result
-
-        else:
-            value = real_type[0](value)
-
-        return value
+        - bool: accepts the strings "True" or "False" (not case-insensitive).
+        - simple types: any callable type such as int, str or float.
+        - tuple: a structured tuple with:
+            * a fixed number of elements,
+            * a list of nested type specifications,
+            * a separator used to split the input string.
+        - dict: ``[dict, nested_types, separator]``, one ``key:value``
+          entry per nested type specification, each parsed into a 2-tuple.
+
+        Tuple types can be nested recursively (e.g., tuple of tuples). The
+        specification is only read: parsers are cached by its content, so
+        that equal specifications share the same parser.
+
+        Parameters
+        ----------
+        real_type : list[Any]
+            The type specification.
+
+        Returns
+        -------
+        Callable[[str, str], Any]
+            Function converting a raw string value, given with the name of
+            its parameter for error reporting.
+
+        Raises
+        ------
+        ConfigError
+            If the type specification is malformed.
+        """
+        # The repr is a cheap key; equality with a private copy of the
+        # specification confirms the hit.
+        key = repr(real_type)
+        cached = Config.__compiled.get(key)
+        if cached is not None and cached[0] == real_type:
+            return cached[1]
+        parser = Config.__build_parser(real_type)
+        Config.__compiled[key] = (copy.deepcopy(real_type), parser)
+        return parser
+
+    @staticmethod
+    def __build_parser(real_type: list[Any]) -> Parser:
+        """Build the parser of a type specification, see :meth:`compile_type`.
+
+        Parameters
+        ----------
+        real_type : list[Any]
+            The type specification.
+
+        Returns
+        -------
+        Callable[[str, str], Any]
+            The parser.
+
+        Raises
+        ------
+        ConfigError
+            If the type specification is malformed.
+        """
+        def invalid(value: str, parameter: str) -> ConfigError:
+            return ConfigError(f"invalid argument \"{value}\" for {parameter}")
+
+        try:
+            kind = real_type[0]
+            if kind == tuple:
+                n_types, types, separator = real_type[1:4]
+            elif kind == dict:
+                types, separator = real_type[1:3]
+                n_types = len(types)
+            items = [Config.compile_type(nested_real_type)
+                     for nested_real_type in (types if kind in (tuple, dict)
+                                              else [])]
+        except (TypeError, ValueError, IndexError):
+            raise ConfigError(f"invalid type specification: {real_type}")
+
+        if kind == bool:
+            def parse_bool(value: str, parameter: str) -> bool:
+                if value.capitalize() == "True":
+                    return True
+                if value.capitalize() == "False":
+                    return False
+                raise invalid(value, parameter)
+            return parse_bool
+
+        if kind == tuple:
+            valid = n_types == len(items)
+
+            def parse_tuple(value: str, parameter: str) -> tuple[Any, ...]:
+                new_value = value.split(separator)
+                if not valid or len(new_value) != n_types:
+                    raise invalid(value, parameter)
+                return tuple([item(element, parameter)
+                              for item, element in zip(items, new_value)])
+            return parse_tuple
+
+        if kind == dict:
+            def parse_dict(value: str, parameter: str) -> dict[Any, Any]:
+                new_value = value.split(separator)
+                if len(new_value) != n_types:
+                    raise invalid(value, parameter)
+                result: dict[Any, Any] = {}
+                for item, element in zip(items, new_value):
+                    entry = item(element, parameter)
+                    if not isinstance(entry, (list, tuple)) or len(entry) != 2:
+                        raise invalid(value, parameter)
+                    result[entry[0]] = entry[1]
+                return result
+            return parse_dict
+
+        def parse_simple(value: str, parameter: str) -> Any:
+            try:
+                return kind(value)
+            except (TypeError, ValueError):
+                raise invalid(value, parameter)
+        return parse_simple
 
     @staticmethod
     def get_next_line(file: TextIO) -> Iterator[str]:
@@ -0,0 +1,81 @@
+from mazegen.config.config import Config
+
+
+def create_config(config: Config) -> None:
+    """
+    Register all configuration parameters with their default values and types.
+
+    Sets up the complete configuration schema for the A-Maze-Ing application,
+    including maze generation parameters, display settings, colors, and player
+    customization options. It is shared by ``a_maze_ing.py`` and the
+    ``mazegen`` command.
+
+    Parameters
+    ----------
+    config : Config
+        The Config instance to register parameters into.
+
+    Returns
+    -------
+    None
+    """
+    config.add_parameter("WIDTH", [20, [int]])
+    config.add_parameter("HEIGHT", [15, [int]])
+    config.add_parameter("ENTRY", [(0, 0), [tuple, 2, [[int], [int]], ","]])
+    config.add_parameter("EXIT", [(19, 14), [tuple, 2, [[int], [int]], ","]])
+    config.add_parameter("OUTPUT_FILE", ["maze.txt", [str]])
+    config.add_parameter("PERFECT", [True, [bool]])
+    config.add_parameter("SEED", [0, [int]])
+    config.add_parameter("ICON_FILE", ["src/default_icon.txt", [str]])
+    config.add_parameter("TOGGLE_PATH", [False, [bool]])
+    config.add_parameter("MAZE_SIZE", [((0, 0), (0, 0)), [
+        tuple, 2, [
+            [tuple, 2, [[int], [int]], ","], [tuple, 2, [[int], [int]], ","]
+            ], " "
+        ]])
+    config.add_parameter("WALL_THICKNESS", [5, [int]])
+
+    config.add_parameter("CUSTOM_COLORS", [False, [bool]])
+    config.add_parameter("BACKGROUND_COLOR", [
+            (255, 255, 255), [tuple, 3, [[int], [int], [int]], ","]
+        ])
+    config.add_parameter("WALLS_COLOR", [
+            (0, 0, 0), [tuple, 3, [[int], [int], [int]], ","]
+        ])
+    config.add_parameter("ICON_COLOR", [
+            (0, 0, 0), [tuple, 3, [[int], [int], [int]], ","]
+        ])
+    config.add_parameter("ENTRY_COLOR", [
+            (0, 255, 0), [tuple, 3, [[int], [int], [int]], ","]
+        ])
+    config.add_parameter("EXIT_COLOR", [
+            (255, 0, 0), [tuple, 3, [[int], [int], [int]], ","]
+        ])
+    config.add_parameter("PATH_COLOR", [
+            (0, 0, 255), [tuple, 3, [[int], [int], [int]], ","]
+        ])
+    config.add_parameter("FRONTIER_COLOR", [
+            (250, 214, 165), [tuple, 3, [[int], [int], [int]], ","]
+        ])
+    config.add_parameter("SOLVER", ["bfs", [str]])
+
+    config.add_parameter("ANIMATED", [False, [bool]])
+    config.add_parameter("FPS", [60, [int]])
+    config.add_parameter("ANIMATION_DURATION", [5.0, [float]])
+    config.add_parameter("SPACING", [42, [int]])
+    config.add_parameter("STATS_LOG_INTERVAL", [0.0, [float]])
+    config.add_parameter("KEY_REPEAT_RATE", [30, [int]])
+    config.add_parameter("AUTO_WALK_SPEED", [20.0, [float]])
+    config.add_parameter("PROFILE", [False, [bool]])
+    config.add_parameter("PROFILE_FILE", ["", [str]])
+
+    config.add_parameter("CUSTOM_PLAYER_FILE", ["", [str]])
+    config.add_parameter("AUTO_ADJUST_PLAYER", [True, [bool]])
+    config.add_parameter("CUSTOM_PLAYER_COLORS", [{"r": (255, 0, 0)}, [
+        dict, [
+            [tuple, 2, [[str], [tuple, 3, [[int], [int], [int]], ","]], ":"],
+            [tuple, 2, [[str], [tuple, 3, [[int], [int], [int]], ","]], ":"],
+            [tuple, 2, [[str], [tuple, 3, [[int], [int], [int]], ","]], ":"],
+            [tuple, 2, [[str], [tuple, 3, [[int], [int], [int]], ","]], ":"],
+            ], " "
+        ]])
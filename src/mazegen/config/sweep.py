@@ -0,0 +1,183 @@
+from mazegen.config.config import Config, ConfigError
+from typing import Any, Iterator, Sequence, TextIO
+import re
+
+
+class ConfigSweep():
+    """Configuration file describing many runs, one per combination.
+
+    On top of the syntax of :meth:`Config.parse_file`, a value may list
+    several alternatives separated by ``|``, each parsed with the type of
+    its parameter (``PERFECT=True|False``, ``ENTRY=0,0|5,5``). Parameters
+    of type ``[int]`` also accept inclusive ranges, with an optional step:
+    ``SEED=1..10000``, ``WIDTH=10..1000:step=10``; ranges and single
+    values can be mixed (``WIDTH=10..50:step=10|100``).
+
+    Iterating over a sweep yields one :class:`Config` per combination, the
+    last swept parameter of the file varying first. Combinations are built
+    one at a time and ranges are kept as ``range`` objects, so memory does
+    not depend on the number of combinations.
+
+    Attributes
+    ----------
+    RANGE : re.Pattern[str]
+        Pattern of a range of integers.
+    """
+    RANGE: re.Pattern[str] = re.compile(
+        r"(-?\d+)\.\.(-?\d+)(?::step=(-?\d+))?")
+
+    def __init__(self, config: Config, file: TextIO) -> None:
+        """Parse a sweep file.
+
+        Parameters
+        ----------
+        config : Config
+            Configuration with the parameters registered, left unchanged.
+        file : TextIO
+            The file to parse.
+
+        Raises
+        ------
+        ConfigError
+            If a line or a value is invalid, if a parameter is declared
+            twice or if a required parameter is missing.
+
+        Returns
+        -------
+        None
+        """
+        self.__template = config.copy()
+        self.__axes: list[tuple[str, list[Sequence[Any]]]] = []
+        parameters = self.__template.get_config()
+        commentary_str = self.__template.get_commentary_str()
+        declared: set[str] = set()
+        for line in Config.get_next_line(file):
+            if line == "\n" or line.startswith(commentary_str):
+                continue
+            # Split on the first "=" only, steps contain one.
+            parameter, equal, value = line.partition("=")
+            if not equal:
+                raise ConfigError(f"undefined config line : {line}")
+            parameter, value = parameter.strip(), value.strip()
+            if parameter not in parameters:
+                raise ConfigError(f"Unknown parameter: {parameter}")
+            if parameter in declared:
+                raise ConfigError(f"Double declaration for \"{parameter}\"")
+            declared.add(parameter)
+            segments = self.__parse_values(parameter, value)
+            if len(segments) == 1 and len(segments[0]) == 1:
+                parameters[parameter][0] = segments[0][0]
+                parameters[parameter][2] = True
+            else:
+                self.__axes.append((parameter, segments))
+
+        swept = {name for name, _ in self.__axes}
+        missing = [name for name, parameter in parameters.items()
+                   if parameter[0] is None and name not in swept]
+        if missing:
+            raise ConfigError(f"missing value(s): {missing}")
+
+    def __parse_values(self, parameter: str,
+                       value: str) -> list[Sequence[Any]]:
+        """Parse the alternatives of a value.
+
+        Parameters
+        ----------
+        parameter : str
+            The name of the parameter.
+        value : str
+            The raw value.
+
+        Raises
+        ------
+        ConfigError
+            If an alternative is invalid.
+
+        Returns
+        -------
+        list[Sequence[Any]]
+            A ``range`` per range and a 1-tuple per single value.
+        """
+        type_spec = self.__template.get_config()[parameter][1]
+        parser = Config.compile_type(type_spec)
+        segments: list[Sequence[Any]] = []
+        for alternative in value.split("|"):
+            alternative = alternative.strip()
+            match = ConfigSweep.RANGE.fullmatch(alternative)
+            if match is None or type_spec != [int]:
+                segments.append((parser(alternative, parameter),))
+                continue
+            start, stop = int(match[1]), int(match[2])
+            step = int(match[3]) if match[3] is not None else (
+                1 if stop >= start else -1)
+            if step == 0:
+                raise ConfigError(f"null step in \"{value}\" for {parameter}")
+            segments.append(range(start, stop + (1 if step > 0 else -1),
+                                  step))
+        return segments
+
+    def __len__(self) -> int:
+        """Return the number of combinations.
+
+        Returns
+        -------
+        int
+            Product of the number of values of each swept parameter.
+        """
+        count = 1
+        for _, segments in self.__axes:
+            count *= sum(len(segment) for segment in segments)
+        return count
+
+    def get_swept_parameters(self) -> list[str]:
+        """Return the parameters taking more than one value.
+
+        Returns
+        -------
+        list[str]
+            Names, in the order of the file.
+        """
+        return [name for name, _ in self.__axes]
+
+    def __iter__(self) -> Iterator[Config]:
+        """Iterate over the combinations.
+
+        Returns
+        -------
+        Iterator[Config]
+            A new configuration per combination.
+        """
+        for values in self.__combinations(0, {}):
+            config = self.__template.copy()
+            parameters = config.get_config()
+            for name, value in values.items():
+                parameters[name][0] = value
+                parameters[name][2] = True
+            yield config
+
+    def __combinations(self, axis: int,
+                       values: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        """Yield the values of the swept parameters, from an axis on.
+
+        The same dictionary is updated and yielded for every combination.
+
+        Parameters
+        ----------
+        axis : int
+            First swept parameter to vary.
+        values : dict[str, Any]
+            Values of the previous swept parameters.
+
+        Returns
+        -------
+        Iterator[dict[str, Any]]
+            Values of all the swept parameters.
+        """
+        if axis == len(self.__axes):
+            yield values
+            return
+        name, segments = self.__axes[axis]
+        for segment in segments:
+            for value in segment:
+                values[name] = value
+                yield from self.__combinations(axis + 1, values)
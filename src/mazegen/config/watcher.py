@@ -0,0 +1,184 @@
+from mazegen.config.config import Config, ConfigError
+from typing import Any, Callable
+import os
+import time
+
+
+class ConfigWatcher():
+    """Re-parse a configuration file when it changes on disk.
+
+    The modification time and size of the file are checked at most once per
+    ``interval`` seconds by :meth:`poll`, cheap enough to be called at every
+    frame. On change, the file is parsed into a new :class:`Config`; if it
+    is invalid, the previous one is kept.
+
+    Each parameter is given the kind of work its change requires, from the
+    cheapest to the most expensive, and :meth:`classify` returns the most
+    expensive kind among the changed parameters:
+
+    - ``SETTING``: a value read later, nothing to redraw;
+    - ``RECOLOR``: only the palette changes;
+    - ``REDRAW``: the maze has to be drawn again;
+    - ``REGENERATE``: a new maze has to be generated.
+
+    Parameters of kind ``RESTART`` cannot be applied to a running program,
+    see :meth:`get_restart_parameters`.
+
+    Attributes
+    ----------
+    SETTING, RECOLOR, REDRAW, REGENERATE : int
+        Kinds of changes, in increasing cost.
+    RESTART : int
+        Kind of the parameters read only at startup.
+    config : Config
+        The last valid configuration.
+    error : str
+        Error of the last parse, empty if it succeeded.
+    """
+    SETTING: int = 0
+    RECOLOR: int = 1
+    REDRAW: int = 2
+    REGENERATE: int = 3
+    RESTART: int = 4
+
+    def __init__(self, path: str, create_config: Callable[[Config], Any],
+                 kinds: dict[str, int], config: Config | None = None,
+                 interval: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize a watcher.
+
+        Parameters
+        ----------
+        path : str
+            Configuration file.
+        create_config : Callable[[Config], Any]
+            Function registering the parameters of a new :class:`Config`.
+        kinds : dict[str, int]
+            Kind of change of each parameter; parameters missing from it
+            require ``REGENERATE``.
+        config : Config | None, optional
+            The configuration already parsed from ``path`` (default is None,
+            to parse it now).
+        interval : float, optional
+            Minimum time between two checks, in seconds (default is 0.5).
+        clock : Callable[[], float], optional
+            Monotonic clock (default is ``time.monotonic``).
+
+        Raises
+        ------
+        ConfigError
+            If ``config`` is None and the file is invalid.
+
+        Returns
+        -------
+        None
+        """
+        self.__path = path
+        self.__create_config = create_config
+        self.__kinds = kinds
+        self.__interval = interval
+        self.__clock = clock
+        self.__next_check: float = clock() + interval
+        self.__stamp: tuple[int, int] | None = self.__get_stamp()
+        self.config: Config = config if config is not None else self.load()
+        self.error: str = ""
+
+    def __get_stamp(self) -> tuple[int, int] | None:
+        """Return the modification time and size of the file.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            Modification time in nanoseconds and size in bytes, None if the
+            file cannot be read.
+        """
+        try:
+            stat = os.stat(self.__path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> Config:
+        """Parse the file into a new configuration.
+
+        Raises
+        ------
+        ConfigError
+            If the file is invalid.
+        OSError
+            If the file cannot be read.
+
+        Returns
+        -------
+        Config
+            The new configuration.
+        """
+        config = Config()
+        self.__create_config(config)
+        with open(self.__path) as config_file:
+            config.parse_file(config_file)
+        return config
+
+    def poll(self) -> dict[str, Any]:
+        """Re-parse the file if it changed since the last check.
+
+        Returns
+        -------
+        dict[str, Any]
+            New value of each changed parameter, empty if the file did not
+            change or is invalid (see ``error``).
+        """
+        now = self.__clock()
+        if now < self.__next_check:
+            return {}
+        self.__next_check = now + self.__interval
+        stamp = self.__get_stamp()
+        if stamp is None or stamp == self.__stamp:
+            return {}
+        self.__stamp = stamp
+        try:
+            config = self.load()
+        except (ConfigError, OSError) as error:
+            self.error = str(error)
+            return {}
+        self.error = ""
+        changed = {
+            name: config.get_value(name) for name in config.get_config()
+            if config.get_value(name) != self.config.get_value(name)}
+        self.config = config
+        return changed
+
+    def classify(self, changed: dict[str, Any]) -> int:
+        """Return the kind of work required by changed parameters.
+
+        Parameters
+        ----------
+        changed : dict[str, Any]
+            Changed parameters, as returned by :meth:`poll`.
+
+        Returns
+        -------
+        int
+            The most expensive kind of change, -1 if nothing changed that
+            can be applied.
+        """
+        kinds = [self.__kinds.get(name, ConfigWatcher.REGENERATE)
+                 for name in changed]
+        return max((kind for kind in kinds if kind != ConfigWatcher.RESTART),
+                   default=-1)
+
+    def get_restart_parameters(self, changed: dict[str, Any]) -> list[str]:
+        """Return the changed parameters that require a restart.
+
+        Parameters
+        ----------
+        changed : dict[str, Any]
+            Changed parameters, as returned by :meth:`poll`.
+
+        Returns
+        -------
+        list[str]
+            Names of the parameters of kind ``RESTART``.
+        """
+        return [name for name in changed
+                if self.__kinds.get(name) == ConfigWatcher.RESTART]
@@ -1,7 +1,44 @@
-from .display import Displayer
-from .button import Button
+from mazegen.lazy import lazy_exports
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .display import Displayer
+    from .button import Button
+    from .headless import HeadlessMlx
+    from .scheduler import FrameScheduler
+    from .recorder import AnimationRecorder, VirtualClock, RecorderError
+    from .recorder import record_headless
+    from .assets import AssetManager, AssetError
+    from .replay import RunRecord, Ghost, ReplayError
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Displayer": ".display",
+    "Button": ".button",
+    "HeadlessMlx": ".headless",
+    "FrameScheduler": ".scheduler",
+    "AnimationRecorder": ".recorder",
+    "VirtualClock": ".recorder",
+    "RecorderError": ".recorder",
+    "record_headless": ".recorder",
+    "AssetManager": ".assets",
+    "AssetError": ".assets",
+    "RunRecord": ".replay",
+    "Ghost": ".replay",
+    "ReplayError": ".replay",
+    })
 
 __all__ = [
         "Displayer",
-        "Button"
+        "Button",
+        "HeadlessMlx",
+        "FrameScheduler",
+        "AnimationRecorder",
+        "VirtualClock",
+        "RecorderError",
+        "record_headless",
+        "AssetManager",
+        "AssetError",
+        "RunRecord",
+        "Ghost",
+        "ReplayError"
     ]
@@ -0,0 +1,179 @@
+from typing import Any
+import os
+
+
+class AssetError(Exception):
+    """Exception raised when an asset cannot be loaded."""
+    def __init__(self, message: str = "undefined"):
+        """Initialize the exception with a custom message.
+
+        Parameters
+        ----------
+        message : str, optional
+            Human-readable error message. Default is 'undefined'.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(f"Asset error: {message}")
+
+
+class AssetManager():
+    """Load images and sprites once and keep them for the whole run.
+
+    Assets are loaded lazily, on first use, then cached:
+
+    - images, decoded by MLX from XPM files, by path;
+    - sprites, text files where each character is a pixel, by path, read
+      again when the file was modified since;
+    - scaled sprites, by path and target size.
+    """
+    def __init__(self, mlx: Any, mlx_ptr: Any) -> None:
+        """Initialize an empty cache.
+
+        Parameters
+        ----------
+        mlx : Mlx | HeadlessMlx
+            MLX backend decoding the images.
+        mlx_ptr : Any
+            MLX context pointer.
+
+        Returns
+        -------
+        None
+        """
+        self.__mlx = mlx
+        self.__mlx_ptr = mlx_ptr
+        self.__images: dict[str, tuple[Any, int, int]] = {}
+        self.__sprites: dict[str, list[str]] = {}
+        self.__sprite_mtimes: dict[str, int] = {}
+        self.__scaled: dict[tuple[str, int, int], list[str]] = {}
+
+    def get_image(self, path: str) -> tuple[Any, int, int]:
+        """Return an XPM image, decoding it on first use.
+
+        Parameters
+        ----------
+        path : str
+            Path of the XPM file.
+
+        Raises
+        ------
+        AssetError
+            If MLX cannot load the image.
+
+        Returns
+        -------
+        tuple[Any, int, int]
+            MLX image pointer, width and height.
+        """
+        image = self.__images.get(path)
+        if image is None:
+            image = self.__mlx.mlx_xpm_file_to_image(self.__mlx_ptr, path)
+            if image is None or image[0] is None:
+                raise AssetError(f"loading image '{path}' failed.")
+            self.__images[path] = image
+        return image
+
+    def add_sprite(self, name: str, text: str) -> list[str]:
+        """Register a sprite from its text, replacing any sprite of that name.
+
+        Parameters
+        ----------
+        name : str
+            Name of the sprite, usually the path it was read from.
+        text : str
+            One row of characters per line, empty lines are ignored.
+
+        Returns
+        -------
+        list[str]
+            The sprite rows.
+        """
+        rows = [row for row in text.split("\n") if row != ""]
+        self.__sprites[name] = rows
+        self.__sprite_mtimes.pop(name, None)
+        for key in [key for key in self.__scaled if key[0] == name]:
+            del self.__scaled[key]
+        return rows
+
+    def get_sprite(self, path: str) -> list[str]:
+        """Return a sprite, reading it on first use.
+
+        A sprite read from a file is read again, and its resized versions
+        dropped, when the modification time of the file changed. Sprites
+        registered with :meth:`add_sprite` are returned as they are.
+
+        Parameters
+        ----------
+        path : str
+            Path of the sprite text file.
+
+        Returns
+        -------
+        list[str]
+            The sprite rows.
+        """
+        rows = self.__sprites.get(path)
+        if rows is not None:
+            mtime = self.__sprite_mtimes.get(path)
+            try:
+                if mtime is None or os.stat(path).st_mtime_ns == mtime:
+                    return rows
+            except OSError:
+                # Removed since it was read: keep what was loaded.
+                return rows
+        with open(path, "r") as sprite_file:
+            mtime = os.fstat(sprite_file.fileno()).st_mtime_ns
+            rows = self.add_sprite(path, sprite_file.read())
+        self.__sprite_mtimes[path] = mtime
+        return rows
+
+    def get_scaled_sprite(self, name: str, width: int,
+                          height: int) -> list[str]:
+        """Return a sprite resized with nearest neighbour sampling.
+
+        Parameters
+        ----------
+        name : str
+            Name or path of the sprite.
+        width : int
+            Target width in pixels.
+        height : int
+            Target height in pixels.
+
+        Returns
+        -------
+        list[str]
+            The resized rows, empty if the sprite is empty.
+        """
+        key = (name, width, height)
+        scaled = self.__scaled.get(key)
+        if scaled is not None:
+            return scaled
+        rows = self.get_sprite(name)
+        src_h = len(rows)
+        src_w = min((len(row) for row in rows), default=0)
+        scaled = []
+        if src_h > 0 and src_w > 0:
+            columns = [min(src_w - 1, x * src_w // width)
+                       for x in range(width)]
+            for y in range(height):
+                row = rows[min(src_h - 1, y * src_h // height)]
+                scaled.append("".join([row[x] for x in columns]))
+        self.__scaled[key] = scaled
+        return scaled
+
+    def release(self) -> None:
+        """Destroy the cached images and forget every asset.
+
+        Returns
+        -------
+        None
+        """
+        for image, _, _ in self.__images.values():
+            self.__mlx.mlx_destroy_image(self.__mlx_ptr, image)
+        self.__images.clear()
+        self.__sprites.clear()
+        self.__scaled.clear()
@@ -1,12 +1,24 @@
-from mlx import Mlx  # type: ignore
-from typing import Any
+from typing import TYPE_CHECKING, Any, ContextManager
+from collections import deque
+from contextlib import nullcontext
 import math
+import sys
 import time
-from typing import TextIO, cast, Callable
+from typing import TextIO, Callable, Iterator, cast
 from mazegen.maze_generation.maze import MazeGenerator
 from mazegen.maze_generation.cell import Cell
+from mazegen.maze_generation.worker import GenerationWorker
+from mazegen.solver.frontier import FrontierSolver
 from mazegen.display.button import Button
 from mazegen.display.button import ButtonText
+from mazegen.display.stats import FrameStats
+from mazegen.display.scheduler import FrameScheduler
+from mazegen.display.recorder import AnimationRecorder
+from mazegen.display.assets import AssetManager
+from mazegen.display.replay import Ghost, ReplayError, RunRecord
+
+if TYPE_CHECKING:
+    from mazegen.profiler import PhaseProfiler
 
 
 class PlayerError(Exception):
@@ -44,12 +56,95 @@ class Displayer():
 
     Manages the window, image, colors and rendering of cells, walls,
     path, entry and exit.
+
+    Every pixel is drawn twice: once as a 32-bit color in the MLX image and
+    once as an 8-bit palette index in a semantic index image. Changing a
+    color only updates the palette, then the whole MLX image is rebuilt
+    from the index image with a lookup table, without walking the maze.
+
+    Attributes
+    ----------
+    BACKGROUND, WALLS, ICON, ENTRY, EXIT, PATH, FRONTIER, GHOST : int
+        Palette indexes of the colors set with :meth:`set_color`.
+    VOID : int
+        Palette index of pixels that were never drawn (always black).
+    PLAYER : int
+        First palette index used by the custom player colors.
+    LOD_CELL_SIZE : int
+        Below this cell size (in pixels) the maze is drawn from a mipmap of
+        its wall coverage instead of cell by cell.
+    ANIMATION_BUDGET : float
+        Fraction of the frame time the animation may spend revealing cells.
+    STREAM_FPS : int
+        Frame rate of :meth:`start_generation_display`.
+    STREAM_BUDGET : float
+        Fraction of the frame time :meth:`start_generation_display` may
+        spend drawing cells, the rest is left to the generation.
+    KEY_REPEAT_RATE : int
+        Default maximum number of moves per second while an arrow key is
+        held.
+    AUTO_WALK_SPEED : float
+        Default speed of the auto-walk, in cells per second.
+    MOVES : dict[int, tuple[str, int, int]]
+        Wall crossed and (dx, dy) offset of each arrow key in move mode.
+    DEFAULT_COLORS : dict[str, tuple[int, int, int]]
+        Color of each location before any :meth:`set_color`.
     """
+    BACKGROUND: int = 0
+    WALLS: int = 1
+    ICON: int = 2
+    ENTRY: int = 3
+    EXIT: int = 4
+    PATH: int = 5
+    VOID: int = 6
+    FRONTIER: int = 7
+    GHOST: int = 8
+    PLAYER: int = 16
+
+    LOD_CELL_SIZE: int = 4
+    ANIMATION_BUDGET: float = 0.75
+    STREAM_FPS: int = 60
+    STREAM_BUDGET: float = 0.05
+    KEY_REPEAT_RATE: int = 30
+    AUTO_WALK_SPEED: float = 20.0
+
+    MOVES: dict[int, tuple[str, int, int]] = {
+        65361: ("WEST", -1, 0),
+        65362: ("NORTH", 0, -1),
+        65363: ("EST", 1, 0),
+        65364: ("SOUTH", 0, 1),
+    }
+
+    DEFAULT_COLORS: dict[str, tuple[int, int, int]] = {
+        "walls": (0, 0, 0),
+        "background": (239, 233, 244),
+        "icon": (0, 0, 0),
+        "entry": (88, 99, 248),
+        "exit": (88, 99, 248),
+        "path": (95, 191, 249),
+        "frontier": (250, 214, 165),
+        "ghost": (190, 190, 190),
+    }
+
+    LOCATIONS: dict[str, int] = {
+        "background": BACKGROUND,
+        "walls": WALLS,
+        "icon": ICON,
+        "entry": ENTRY,
+        "exit": EXIT,
+        "path": PATH,
+        "frontier": FRONTIER,
+        "ghost": GHOST,
+    }
+
     def __init__(self,
                  window_size: tuple[int, int],
                  image_size: tuple[int, int],
                  maze: MazeGenerator,
-                 wall_thickness: int) -> None:
+                 wall_thickness: int,
+                 mlx: Any = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Any] = time.sleep) -> None:
         """
         Initialize a Displayer.
 
@@ -63,13 +158,27 @@ class Displayer():
             MazeGenerator object to display.
         wall_thickness : int
             Wall size percentage.
+        mlx : Mlx | HeadlessMlx, optional
+            MLX backend to use (default is a new ``Mlx`` instance, the
+            ``mlx`` module being imported only then). Pass a
+            :class:`HeadlessMlx` to render without a display.
+        clock : Callable[[], float], optional
+            Monotonic clock timing the animations (default is
+            ``time.monotonic``).
+        sleep : Callable[[float], Any], optional
+            Function waiting between two frames (default is
+            ``time.sleep``). With a :class:`VirtualClock` as clock and its
+            ``sleep``, animations run faster than real time.
 
         Returns
         -------
         None
         """
 
-        mlx = Mlx()
+        if mlx is None:
+            # Imported here so that headless users do not need MLX.
+            from mlx import Mlx  # type: ignore
+            mlx = Mlx()
         mlx_ptr = mlx.mlx_init()
 
         _, screen_size_x, screen_size_y = mlx.mlx_get_screen_size(mlx_ptr)
@@ -86,21 +195,40 @@ class Displayer():
         self.__maze = maze
 
         self.animation_finished: bool = True
+        self.animation_duration: float = 0.0
+        self.fps: int = Displayer.STREAM_FPS
+        self.__worker: GenerationWorker | None = None
+        self.__streaming: bool = False
+        self.__dirty: set[tuple[int, int]] = set()
+        self.first: bool = False
+        self.visited: set[tuple[int, int]] = set()
+        self.stack: list[tuple[int, int]] = []
+        self.__animation: Callable[[], bool] | None = None
+        self.key_repeat_rate: int = Displayer.KEY_REPEAT_RATE
+        self.__pending_moves: deque[int] = deque()
+        self.__next_move: tuple[int, float] = (0, 0.0)
+        self.show_hint: bool = False
+        self.auto_walk_speed: float = Displayer.AUTO_WALK_SPEED
+        self.__hint_coords: tuple[int, int] | None = None
+        self.__auto_walk: tuple[float, int] | None = None
+        self.run_file: str = ""
+        self.__run: RunRecord | None = None
+        self.__run_start: float = 0.0
+        self.__ghosts: list[Ghost] = []
+        self.__ghosts_start: float = 0.0
 
         window_x, window_y = self.get_window_size()
         image_x, image_y = self.get_image_size()
 
-        height: int = maze.get_height()
-        width: int = maze.get_width()
-
-        if width >= height:
-            size = image_x // width
-        elif width < height:
-            size = image_y // height
-        self.__cell_size = size
-
-        self.x_offset = (image_x - size * width) // 2
-        self.y_offset = (image_y - size * height) // 2
+        self.__cell_size: int = 1
+        self.__lod_level: int | None = None
+        self.__mipmaps: list[list[bytes]] = []
+        self.x_offset: int = 0
+        self.y_offset: int = 0
+        self.camera_x: float = 0.0
+        self.camera_y: float = 0.0
+        self.follow_camera: bool = False
+        self.reset_camera()
 
         win_ptr = mlx.mlx_new_window(mlx_ptr, window_x, window_y, "A-Maze-ing")
         mlx.mlx_hook(win_ptr, 33, 1 << 17, self.close, None)
@@ -112,21 +240,23 @@ class Displayer():
         self.__mlx_ptr = mlx_ptr
         self.__win_ptr = win_ptr
         self.__new_img = new_img
+        self.__clock = clock
+        self.__assets = AssetManager(mlx, mlx_ptr)
+        self.__scheduler = FrameScheduler(mlx, mlx_ptr, clock, sleep)
 
-        if wall_thickness <= 0 or wall_thickness > 50:
-            raise WallThicknessError(
-                "wall_thickness has to be between 1 and 50")
-        div = round(1 / wall_thickness * 100)
-        self.__div = div
+        data, bpp, size_line, _ = mlx.mlx_get_data_addr(new_img)
+        self.__data: memoryview = data.cast('B')
+        self.__bpp: int = bpp
+        self.__size_line: int = size_line
 
-        self.set_color("walls", (0, 0, 0))
-        self.set_color("background", (239, 233, 244))
-        self.set_color("icon",  (0, 0, 0))
-        self.set_color("entry", (88, 99, 248))
-        self.set_color("exit", (88, 99, 248))
-        self.set_color("path", (95, 191, 249))
+        self.__palette: list[int] = [0xFF000000] * 256
+        self.__index_img: bytearray = (
+            bytearray([Displayer.VOID]) * (image_x * image_y)
+        )
 
-        self.need_refresh: bool = False
+        self.__div: int = 1
+        self.set_wall_thickness(wall_thickness)
+        self.reset_colors()
 
         self.set_toggle_path(False)
 
@@ -142,10 +272,30 @@ class Displayer():
         self.button_printer_y: int = self.spacing
 
         self.custom_player: list[list[int | None]] | None = None
+        self.custom_player_source: list[list[int | None]] | None = None
         self.auto_adjust_player: bool = True
         self.custom_player_colors: dict[str, tuple[int, int, int]] = {}
+        self.__player_sprite: str = ""
+        self.__player_indexes: dict[str, int] = {}
+        self.__player_grids: dict[int, list[list[int | None]]] = {}
+        self.__player_spans: dict[
+            tuple[int, tuple[int, ...]],
+            tuple[list[list[int | None]],
+                  list[tuple[int, int, bytes, bytes]]]] = {}
         self.function_player: list[Any] | None = None
 
+        self.stats: FrameStats | None = None
+        self.recorder: AnimationRecorder | None = None
+        self.profiler: "PhaseProfiler | None" = None
+        self.show_stats: bool = False
+        self.__overlay_stats: bool = False
+
+        self.__solver_layers: Iterator[list[tuple[int, int]]] | None = None
+        self.__solver: FrontierSolver | None = None
+        self.__solver_explored: set[tuple[int, int]] = set()
+        self.__solver_path: list[tuple[int, int]] = []
+        self.__solver_trace: set[tuple[int, int]] = set()
+
     def set_maze(self, new: MazeGenerator) -> None:
         """Set a new maze to display.
 
@@ -154,569 +304,2207 @@ class Displayer():
         new : MazeGenerator
             The new MazeGenerator object to display.
         """
+        if self.__worker is not None:
+            self.__worker.cancel()
+            self.__worker = None
         self.__maze = new
+        self.__hint_coords = None
+        self.__auto_walk = None
+        self.__run = None
+        self.__ghosts = []
+        self.clear_solver(False)
+        self.__mipmaps = []
+        self.reset_camera()
+        self.fit_custom_player()
+
+    def reset_camera(self) -> None:
+        """Zoom so that the whole maze fits the image and center it.
 
-    def set_function(self, funct: Callable[[Any], Any],
-                     param: tuple[Any, Any]) -> None:
-        """Set a function and its parameters to be called on key events.
+        Returns
+        -------
+        None
+        """
+        maze = self.get_maze()
+        image_x, image_y = self.get_image_size()
+        width: int = maze.get_width()
+        height: int = maze.get_height()
+
+        self.set_camera((width / 2, height / 2),
+                        min(image_x / width, image_y / height))
+
+    def set_camera(self, center: tuple[float, float],
+                   scale: float | None = None) -> None:
+        """Move the camera and optionally change the zoom.
+
+        The camera is described by the maze coordinates (in cells) shown at
+        the center of the image and by the scale, in pixels per cell. The
+        center is clamped to the maze so that it never leaves the image.
+
+        Scales of at least ``LOD_CELL_SIZE`` are rounded down to a whole
+        cell size and drawn cell by cell. Smaller scales are rounded down to
+        ``2 / 2 ** level`` and drawn from the mipmap of that level.
 
         Parameters
         ----------
-        funct : Callable
-            The function to call.
-        param : tuple[Any, Any]
-            The parameters to pass to the function.
+        center : tuple[float, float]
+            Maze coordinates (x, y) to show at the center of the image.
+        scale : float, optional
+            New scale in pixels per cell. The current zoom is kept if None.
+
+        Returns
+        -------
+        None
         """
-        self.function_player = [funct, param]
+        maze = self.get_maze()
+        image_x, image_y = self.get_image_size()
+        width: int = maze.get_width()
+        height: int = maze.get_height()
 
-    def set_spacing(self, spacing: int) -> None:
-        """Set the spacing between buttons.
+        if scale is not None:
+            scale = min(scale, float(image_x), float(image_y))
+            if scale >= Displayer.LOD_CELL_SIZE:
+                self.__cell_size = int(scale)
+                self.__lod_level = None
+            else:
+                max_level = (2 * max(width, height)).bit_length()
+                level = 0
+                while 2 / (1 << level) > scale and level < max_level:
+                    level += 1
+                self.__lod_level = level
+                self.__cell_size = max(1, 2 >> level)
 
-        Parameters
-        ----------
-        spacing : int
-            The spacing value (must be > 0).
+        center_x, center_y = center
+        self.camera_x = min(max(center_x, 0.0), float(width))
+        self.camera_y = min(max(center_y, 0.0), float(height))
 
-        Raises
-        ------
-        SpacingError
-            If spacing is not greater than 0.
+        scale = self.get_scale()
+        self.x_offset = (image_x - round(2 * self.camera_x * scale)) // 2
+        self.y_offset = (image_y - round(2 * self.camera_y * scale)) // 2
+
+    def get_scale(self) -> float:
+        """Return the current zoom in pixels per cell.
+
+        Returns
+        -------
+        float
+            Pixels per cell, lower than 1 when a pixel covers many cells.
         """
-        if spacing <= 0:
-            raise SpacingError("Spacing must be greater than 0.")
+        if self.__lod_level is None:
+            return float(self.__cell_size)
+        return 2 / (1 << self.__lod_level)
 
-        if spacing > 50:
-            raise SpacingError("Spacing must be lower than 50.")
+    def get_lod_level(self) -> int | None:
+        """Return the mipmap level used for rendering.
 
-        self.spacing = spacing
-        self.button_printer_x = spacing
-        self.button_printer_y = spacing
+        Returns
+        -------
+        int | None
+            The mipmap level, or None if cells are drawn one by one.
+        """
+        return self.__lod_level
 
-    def set_custom_player_colors(self,
-                                 colors: dict[str, tuple[int, int, int]]
-                                 ) -> None:
-        """Set custom colors for the player icon.
+    def cell_to_pixel(self, coords: tuple[int, int]) -> tuple[int, int]:
+        """Return the image position of the top-left corner of a cell.
 
         Parameters
         ----------
-        colors : dict[str, tuple]
-            Dictionary mapping characters to RGB color tuples.
+        coords : tuple[int, int]
+            Cell coordinates as (x, y).
+
+        Returns
+        -------
+        tuple[int, int]
+            Pixel coordinates (x, y), possibly outside the image.
         """
-        self.custom_player_colors = colors
+        x, y = coords
+        level = self.__lod_level
+        if level is None:
+            size = self.__cell_size
+            return (x * size + self.x_offset, y * size + self.y_offset)
+        return ((2 * x >> level) + self.x_offset,
+                (2 * y >> level) + self.y_offset)
 
-    def set_auto_adjust_player(self, auto_adjust_player: bool) -> None:
-        """Enable or disable automatic resizing of the player icon.
+    def get_visible_cells(self) -> tuple[range, range]:
+        """Return the cells that intersect the image.
+
+        Returns
+        -------
+        tuple[range, range]
+            Ranges of visible x and y cell coordinates.
+        """
+        maze = self.get_maze()
+        image_x, image_y = self.get_image_size()
+        level = self.__lod_level
+
+        if level is None:
+            size = self.__cell_size
+            x_start = max(0, -self.x_offset // size)
+            y_start = max(0, -self.y_offset // size)
+            x_end = (image_x - self.x_offset + size - 1) // size
+            y_end = (image_y - self.y_offset + size - 1) // size
+        else:
+            x_start = max(0, (-self.x_offset << level) // 2)
+            y_start = max(0, (-self.y_offset << level) // 2)
+            x_end = ((image_x - self.x_offset) << level) // 2 + 1
+            y_end = ((image_y - self.y_offset) << level) // 2 + 1
+
+        x_end = min(maze.get_width(), x_end)
+        y_end = min(maze.get_height(), y_end)
+        return (range(x_start, max(x_start, x_end)),
+                range(y_start, max(y_start, y_end)))
+
+    def is_visible(self, coords: tuple[int, int]) -> bool:
+        """Check whether a cell intersects the image.
 
         Parameters
         ----------
-        auto_adjust_player : bool
-            Whether to auto-adjust the player icon size.
+        coords : tuple[int, int]
+            Cell coordinates as (x, y).
 
-        Raises
-        ------
-        ValueError
-            If auto_adjust_player is not a boolean.
+        Returns
+        -------
+        bool
+            True if at least one pixel of the cell is in the image.
         """
-        if not isinstance(auto_adjust_player, bool):
-            raise ValueError("auto_adjust_player has to be a bool.")
-        self.auto_adjust_player = auto_adjust_player
+        size = self.get_cell_size()
+        image_x, image_y = self.get_image_size()
+        pixel_x, pixel_y = self.cell_to_pixel(coords)
+        return (-size < pixel_x < image_x and -size < pixel_y < image_y)
 
-    def set_toggle_path(self, toggle: bool) -> None:
-        """Enable or disable the display of the shortest path.
+    def scroll(self, dx: float, dy: float) -> None:
+        """Move the camera by a fraction of the image and redraw.
 
         Parameters
         ----------
-        toggle : bool
-            Whether to show the shortest path.
+        dx : float
+            Horizontal move, as a fraction of the image width.
+        dy : float
+            Vertical move, as a fraction of the image height.
 
-        Raises
-        ------
-        ValueError
-            If toggle is not a boolean.
+        Returns
+        -------
+        None
         """
-        if not isinstance(toggle, bool):
-            raise ValueError("toggle has to be a bool.")
-        self.toggle_path = toggle
+        image_x, image_y = self.get_image_size()
+        scale = self.get_scale()
+        self.follow_camera = False
+        self.set_camera((self.camera_x + dx * image_x / scale,
+                         self.camera_y + dy * image_y / scale))
+        self.refresh_view()
 
-    def set_color(self, location: str,
-                  rgb: tuple[int, int, int]) -> bool:
-        """Set a color for a specific UI location.
+    def zoom(self, factor: float) -> None:
+        """Multiply the scale by ``factor`` and redraw.
+
+        The camera center stays on the same maze coordinates, or on the
+        player when the follow-camera is enabled.
 
         Parameters
         ----------
-        location : str
-            One of "background", "walls", "entry", "exit", "path", or "icon".
-        rgb : tuple[int, int, int]
-            RGB values (0-255) for the color.
+        factor : float
+            Zoom factor (greater than 1 to zoom in, lower to zoom out).
+
+        Returns
+        -------
+        None
+        """
+        scale = self.get_scale()
+        new_scale = scale * factor
+        if self.__lod_level is None and round(new_scale) == scale:
+            new_scale = scale + (1 if factor > 1 else -1)
+        self.set_camera((self.camera_x, self.camera_y), new_scale)
+        if self.follow_camera and self.move_mode:
+            self.center_on_player()
+        self.fit_custom_player()
+        self.refresh_view()
+
+    def center_on_player(self) -> bool:
+        """Center the camera on the player.
 
         Returns
         -------
         bool
-            True if the color was applied, False if the location is unknown.
+            True if the camera moved, False otherwise.
         """
+        x, y = self.player_pos
+        old_offsets = (self.x_offset, self.y_offset)
+        self.set_camera((x + 0.5, y + 0.5))
+        return (self.x_offset, self.y_offset) != old_offsets
 
-        red, green, blue = rgb
+    def refresh_view(self) -> None:
+        """Redraw the visible part of the maze after a camera change.
 
-        red = abs(red) % 256
-        green = abs(green) % 256
-        blue = abs(blue) % 256
+        Returns
+        -------
+        None
+        """
+        if not self.animation_finished:
+            self.clear(Displayer.VOID)
+        self.display(False)
 
-        color: int = (0xFF << 24) | (red << 16) | (green << 8) | blue
+    def get_mipmap(self, level: int) -> list[bytes]:
+        """Return a mipmap level of the wall coverage, building it if needed.
 
-        match location:
-            case "background":
-                self.__background_color = color
-                return True
-            case "walls":
-                self.__walls_color = color
-                return True
-            case "entry":
-                self.__entry_color = color
-                return True
-            case "exit":
-                self.__exit_color = color
-                return True
-            case "path":
-                self.__path_color = color
-                return True
-            case "icon":
-                self.__icon_color = color
-                return True
-            case _:
-                return False
+        Level 0 has one texel per wall, post and cell interior, so a maze of
+        W x H cells gives (2W + 1) x (2H + 1) texels: 255 where there is a
+        wall (or an icon cell) and 0 elsewhere. Each next level halves both
+        dimensions and stores the average coverage of 2 x 2 texels. Levels
+        are cached until the maze changes.
 
-    def get_window_size(self) -> tuple[int, int]:
-        """Return the window size.
+        Parameters
+        ----------
+        level : int
+            Mipmap level (0 is the finest).
 
         Returns
         -------
-        tuple[int, int]
-            Window size as (x, y).
+        list[bytes]
+            Rows of coverage values (0 to 255).
         """
-        return self.__window_size
+        mipmaps = self.__mipmaps
+        if not mipmaps:
+            mipmaps.append(self.__build_coverage())
+
+        while len(mipmaps) <= level:
+            rows = mipmaps[-1]
+            n_rows = len(rows)
+            next_rows: list[bytes] = []
+            for i in range(0, n_rows, 2):
+                top = rows[i]
+                bottom = rows[i + 1] if i + 1 < n_rows else top
+                if len(top) % 2:
+                    top += top[-1:]
+                    bottom += bottom[-1:]
+                next_rows.append(bytes([
+                    (a + b + c + d) >> 2 for a, b, c, d in zip(
+                        top[0::2], top[1::2], bottom[0::2], bottom[1::2])
+                ]))
+            mipmaps.append(next_rows)
+        return mipmaps[level]
+
+    def __build_coverage(self) -> list[bytes]:
+        """Build the finest wall coverage level of the mipmap.
 
-    def get_mlx(self) -> Mlx:
-        """Return the MLX instance.
+        Returns
+        -------
+        list[bytes]
+            (2H + 1) rows of (2W + 1) coverage values.
+        """
+        maze = self.get_maze()
+        width: int = maze.get_width()
+        full: int = 255
+
+        rows: list[bytes] = []
+        for row in maze.get_matrix():
+            top = bytearray([full]) * (2 * width + 1)
+            middle = bytearray(2 * width + 1)
+            for x, cell in enumerate(row):
+                if not cell.get_wall("NORTH"):
+                    top[2 * x + 1] = 0
+                if cell.get_wall("WEST"):
+                    middle[2 * x] = full
+                if cell.is_icon():
+                    middle[2 * x + 1] = full
+            if row[-1].get_wall("EST"):
+                middle[2 * width] = full
+            rows.append(bytes(top))
+            rows.append(bytes(middle))
+
+        bottom = bytearray([full]) * (2 * width + 1)
+        for x, cell in enumerate(maze.get_matrix()[-1]):
+            if not cell.get_wall("SOUTH"):
+                bottom[2 * x + 1] = 0
+        rows.append(bytes(bottom))
+        return rows
+
+    def __display_lod(self) -> None:
+        """Draw the visible part of the maze from the mipmap.
+
+        Every pixel shows one texel of the current mipmap level. Coverage is
+        turned into wall or background indexes with a 4 x 4 ordered dither,
+        one ``bytes.translate`` per row and column phase, then the whole image
+        is colored with :meth:`apply_palette`.
 
         Returns
         -------
-        Mlx
-            The MLX instance used for window and image operations.
+        None
         """
-        return self.__mlx
+        level = cast(int, self.__lod_level)
+        rows = self.get_mipmap(level)
+        image_x, image_y = self.get_image_size()
+        index_img = self.__index_img
+        x_offset = self.x_offset
+        y_offset = self.y_offset
+
+        bayer = [[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]]
+        tables: list[list[bytes]] = [
+            [bytes(Displayer.WALLS if value > threshold * 16 + 8
+                   else Displayer.BACKGROUND for value in range(256))
+             for threshold in bayer_row]
+            for bayer_row in bayer
+        ]
+        empty_row = bytes((Displayer.BACKGROUND,)) * image_x
+
+        for pixel_y in range(image_y):
+            texel_y = pixel_y - y_offset
+            start = pixel_y * image_x
+            if texel_y < 0 or texel_y >= len(rows):
+                index_img[start:start + image_x] = empty_row
+                continue
+            row = rows[texel_y]
+            left = max(0, x_offset)
+            texel_x = left - x_offset
+            length = max(0, min(image_x - left, len(row) - texel_x))
+            segment = row[texel_x:texel_x + length]
+            indexes = bytearray(length)
+            phases = tables[pixel_y & 3]
+            for k in range(4):
+                indexes[k::4] = segment[k::4].translate(
+                    phases[(left + k) & 3])
+            index_img[start:start + image_x] = empty_row
+            index_img[start + left:start + left + length] = indexes
+
+        self.apply_palette()
+
+    def enable_stats(self, log_interval: float = 0.0,
+                     log: Callable[[str], Any] = print) -> FrameStats:
+        """Start collecting frame timings.
+
+        While disabled (the default), the only cost is one attribute check
+        per frame.
 
-    def get_new_img(self) -> Any:
-        """Return the MLX image used for rendering.
+        Parameters
+        ----------
+        log_interval : float, optional
+            Seconds between two log lines, 0 disables logging (default).
+        log : Callable[[str], Any], optional
+            Function called with each log line (default is ``print``).
 
         Returns
         -------
-        Any
-            The MLX image object (implementation-specific).
+        FrameStats
+            The statistics being collected.
         """
-        return self.__new_img
+        self.stats = FrameStats(log_interval, log)
+        self.__overlay_stats = False
+        return self.stats
 
-    def get_maze(self) -> MazeGenerator:
-        """Return the maze to display.
+    def disable_stats(self) -> None:
+        """Stop collecting frame timings and hide the overlay.
 
         Returns
         -------
-        MazeGenerator
-            The MazeGenerator instance being displayed.
+        None
         """
-        return self.__maze
+        self.stats = None
+        self.show_stats = False
+        self.__overlay_stats = False
 
-    def get_image_size(self) -> tuple[int, int]:
-        """Return the image size.
+    def set_recorder(self, recorder: AnimationRecorder | None) -> None:
+        """Record the uploaded frames, or stop recording with None.
+
+        Parameters
+        ----------
+        recorder : AnimationRecorder | None
+            Recorder called with the image at each upload.
 
         Returns
         -------
-        tuple[int, int]
-            Image size as (x, y).
+        None
         """
-        return self.__image_size
+        self.recorder = recorder
 
-    def get_cell_size(self) -> int:
-        """Return the size (in pixels) of a single maze cell.
+    def set_profiler(self, profiler: "PhaseProfiler | None") -> None:
+        """Record the first frames in a profiler, or stop with None.
+
+        The first upload is marked ``"first upload"``, and the first frame
+        of an animation and the first full frame are recorded as the
+        phases ``"first animation frame"`` and ``"first full frame"``.
+
+        Parameters
+        ----------
+        profiler : PhaseProfiler | None
+            The startup profiler.
 
         Returns
         -------
-        int
-            Cell size in pixels.
+        None
         """
-        return self.__cell_size
+        self.profiler = profiler
 
-    def get_mlx_ptr(self) -> Any:
-        """Return the raw MLX context pointer.
+    def __first_phase(self, name: str) -> ContextManager[None]:
+        """Return a context manager recording the first run of a phase.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
 
         Returns
         -------
-        Any
-            Low-level MLX context pointer required by the wrapper.
+        ContextManager[None]
+            A phase of the profiler, or a no-op without profiler.
         """
-        return self.__mlx_ptr
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name, once=True)
 
-    def get_win_ptr(self) -> Any:
-        """Return the MLX window pointer.
+    def set_stats_log_interval(self, log_interval: float) -> None:
+        """Log the frame statistics periodically, or stop logging them.
+
+        The statistics shown by the overlay are kept: a positive interval
+        only changes how often they are logged, and with 0 they are only
+        disabled if the overlay is hidden.
+
+        Parameters
+        ----------
+        log_interval : float
+            Seconds between two log lines, 0 or less to stop logging.
 
         Returns
         -------
-        Any
-            Low-level MLX window pointer.
+        None
         """
-        return self.__win_ptr
+        stats = self.stats
+        if log_interval > 0:
+            if stats is None:
+                self.enable_stats(log_interval)
+            else:
+                stats.log_interval = log_interval
+                self.__overlay_stats = False
+        elif stats is not None:
+            if self.show_stats:
+                stats.log_interval = 0.0
+                self.__overlay_stats = True
+            else:
+                self.disable_stats()
 
-    def get_div(self) -> int:
-        """Return the divider used to compute wall thickness.
+    def get_stats(self) -> FrameStats | None:
+        """Return the frame statistics.
 
         Returns
         -------
-        int
-            Divider value used when drawing walls.
+        FrameStats | None
+            The statistics, or None if they are disabled.
         """
-        return self.__div
+        return self.stats
 
-    def get_background_color(self) -> int:
-        """Return the background color.
+    def toggle_stats_overlay(self) -> None:
+        """Show or hide the frame statistics in the window.
+
+        Showing the overlay enables the statistics if needed; hiding it
+        disables them again if they were enabled by the overlay.
 
         Returns
         -------
-        int
-            Color as a 32-bit integer (0xAARRGGBB).
+        None
         """
-        return self.__background_color
+        self.show_stats = not self.show_stats
+        if self.show_stats and self.stats is None:
+            self.enable_stats()
+            self.__overlay_stats = True
+        elif not self.show_stats and self.__overlay_stats:
+            self.disable_stats()
 
-    def get_walls_color(self) -> int:
-        """Return the wall color.
+    def print_stats(self) -> None:
+        """Write the frame statistics over the main window.
+
+        Returns
+        -------
+        None
+        """
+        if self.stats is None:
+            return
+        mlx = self.get_mlx()
+        background = self.get_background_color()
+        color = ButtonText.text_color_contrast(
+            ((background >> 16) & 0xFF, (background >> 8) & 0xFF,
+             background & 0xFF))
+        for i, line in enumerate(self.stats.format_line().split(" ")):
+            mlx.mlx_string_put(self.get_mlx_ptr(), self.get_win_ptr(),
+                               5, 15 + 15 * i, color, line)
+
+    def set_animation_duration(self, duration: float) -> None:
+        """Set the target duration of the animated display.
+
+        Parameters
+        ----------
+        duration : float
+            Duration in seconds. With 0 or less (the default), one cell is
+            revealed per frame.
+
+        Returns
+        -------
+        None
+        """
+        self.animation_duration = duration
+
+    def set_fps(self, fps: int) -> None:
+        """Set the frame rate, applied at once to a running animation.
+
+        Parameters
+        ----------
+        fps : int
+            Target frames per second, at least 1.
+
+        Returns
+        -------
+        None
+        """
+        self.fps = max(1, fps)
+        if self.__scheduler.is_running():
+            self.__scheduler.start(self.__run_frame, self.fps)
+
+    def set_key_repeat_rate(self, rate: int) -> None:
+        """Set the maximum move rate while an arrow key is held.
+
+        Repeated presses of the same arrow key arriving faster than this
+        rate are dropped, so the player stops as soon as the key is
+        released instead of catching up with queued events.
+
+        Parameters
+        ----------
+        rate : int
+            Moves per second. With 0 or less, every key event moves.
+
+        Returns
+        -------
+        None
+        """
+        self.key_repeat_rate = rate
+
+    def set_auto_walk_speed(self, speed: float) -> None:
+        """Set the speed of the auto-walk.
+
+        Parameters
+        ----------
+        speed : float
+            Cells per second. With 0 or less, the player jumps to the exit
+            at the next frame.
+
+        Returns
+        -------
+        None
+        """
+        self.auto_walk_speed = speed
+
+    def set_run_file(self, path: str) -> None:
+        """Set the file of the recorded runs.
+
+        Each run reaching the exit in move mode is saved to it, and R
+        replays it as a ghost.
+
+        Parameters
+        ----------
+        path : str
+            Run file, empty to disable saving.
+
+        Returns
+        -------
+        None
+        """
+        self.run_file = path
+
+    def set_function(self, funct: Callable[[Any], Any],
+                     param: tuple[Any, Any]) -> None:
+        """Set a function and its parameters to be called on key events.
+
+        Parameters
+        ----------
+        funct : Callable
+            The function to call.
+        param : tuple[Any, Any]
+            The parameters to pass to the function.
+        """
+        self.function_player = [funct, param]
+
+    def set_spacing(self, spacing: int) -> None:
+        """Set the spacing between buttons.
+
+        Parameters
+        ----------
+        spacing : int
+            The spacing value (must be > 0).
+
+        Raises
+        ------
+        SpacingError
+            If spacing is not greater than 0.
+        """
+        if spacing <= 0:
+            raise SpacingError("Spacing must be greater than 0.")
+
+        if spacing > 50:
+            raise SpacingError("Spacing must be lower than 50.")
+
+        self.spacing = spacing
+        self.button_printer_x = spacing
+        self.button_printer_y = spacing
+
+    def set_custom_player_colors(self,
+                                 colors: dict[str, tuple[int, int, int]]
+                                 ) -> None:
+        """Set custom colors for the player icon.
+
+        Parameters
+        ----------
+        colors : dict[str, tuple]
+            Dictionary mapping characters to RGB color tuples.
+        """
+        self.custom_player_colors = colors
+
+    def set_auto_adjust_player(self, auto_adjust_player: bool) -> None:
+        """Enable or disable automatic resizing of the player icon.
+
+        Parameters
+        ----------
+        auto_adjust_player : bool
+            Whether to auto-adjust the player icon size.
+
+        Raises
+        ------
+        ValueError
+            If auto_adjust_player is not a boolean.
+        """
+        if not isinstance(auto_adjust_player, bool):
+            raise ValueError("auto_adjust_player has to be a bool.")
+        self.auto_adjust_player = auto_adjust_player
+
+    def set_wall_thickness(self, wall_thickness: int) -> None:
+        """Set the wall thickness, as a percentage of the cell size.
+
+        The maze is not redrawn, see :meth:`display`.
+
+        Parameters
+        ----------
+        wall_thickness : int
+            Wall thickness, between 1 and 50.
+
+        Raises
+        ------
+        WallThicknessError
+            If wall_thickness is not between 1 and 50.
+
+        Returns
+        -------
+        None
+        """
+        if wall_thickness <= 0 or wall_thickness > 50:
+            raise WallThicknessError(
+                "wall_thickness has to be between 1 and 50")
+        self.__div = round(1 / wall_thickness * 100)
+
+    def set_watcher(self, watcher: Callable[[], Any] | None,
+                    interval: float = 0.5) -> None:
+        """Set a function called periodically, e.g. to poll a file.
+
+        The watcher is called from the loop hook at its own rate, whether
+        frames are drawn or not: once nothing is animated, the frame
+        scheduler stops drawing and only wakes up to call it.
+
+        Parameters
+        ----------
+        watcher : Callable[[], Any] | None
+            Function called without argument, None to remove it.
+        interval : float, optional
+            Time between two calls, in seconds (default is 0.5).
+
+        Returns
+        -------
+        None
+        """
+        self.__scheduler.set_idle(watcher, interval)
+
+    def set_toggle_path(self, toggle: bool) -> None:
+        """Enable or disable the display of the shortest path.
+
+        Parameters
+        ----------
+        toggle : bool
+            Whether to show the shortest path.
+
+        Raises
+        ------
+        ValueError
+            If toggle is not a boolean.
+        """
+        if not isinstance(toggle, bool):
+            raise ValueError("toggle has to be a bool.")
+        self.toggle_path = toggle
+
+    def set_color(self, location: str,
+                  rgb: tuple[int, int, int]) -> bool:
+        """Set a color for a specific UI location.
+
+        Parameters
+        ----------
+        location : str
+            One of "background", "walls", "entry", "exit", "path", or "icon".
+        rgb : tuple[int, int, int]
+            RGB values (0-255) for the color.
+
+        Returns
+        -------
+        bool
+            True if the color was applied, False if the location is unknown.
+
+        Notes
+        -----
+        Only the palette is updated. Pixels already drawn keep their old
+        color until :meth:`apply_palette` is called.
+        """
+
+        red, green, blue = rgb
+
+        red = abs(red) % 256
+        green = abs(green) % 256
+        blue = abs(blue) % 256
+
+        color: int = (0xFF << 24) | (red << 16) | (green << 8) | blue
+
+        index: int | None = Displayer.LOCATIONS.get(location)
+        if index is None:
+            return False
+        self.__palette[index] = color
+        return True
+
+    def reset_colors(self) -> None:
+        """Set every location back to its default color.
+
+        Returns
+        -------
+        None
+        """
+        for location, rgb in Displayer.DEFAULT_COLORS.items():
+            self.set_color(location, rgb)
+
+    def get_window_size(self) -> tuple[int, int]:
+        """Return the window size.
+
+        Returns
+        -------
+        tuple[int, int]
+            Window size as (x, y).
+        """
+        return self.__window_size
+
+    def get_mlx(self) -> Any:
+        """Return the MLX instance.
+
+        Returns
+        -------
+        Mlx
+            The MLX instance used for window and image operations.
+        """
+        return self.__mlx
+
+    def get_assets(self) -> AssetManager:
+        """Return the asset cache of the display.
+
+        Returns
+        -------
+        AssetManager
+            Images and sprites loaded for this display.
+        """
+        return self.__assets
+
+    def get_new_img(self) -> Any:
+        """Return the MLX image used for rendering.
+
+        Returns
+        -------
+        Any
+            The MLX image object (implementation-specific).
+        """
+        return self.__new_img
+
+    def get_maze(self) -> MazeGenerator:
+        """Return the maze to display.
+
+        Returns
+        -------
+        MazeGenerator
+            The MazeGenerator instance being displayed.
+        """
+        return self.__maze
+
+    def get_image_size(self) -> tuple[int, int]:
+        """Return the image size.
+
+        Returns
+        -------
+        tuple[int, int]
+            Image size as (x, y).
+        """
+        return self.__image_size
+
+    def get_cell_size(self) -> int:
+        """Return the size (in pixels) of a single maze cell.
+
+        When the maze is drawn from the mipmap, this is the size of the
+        pixel block covering a cell (1 or 2 pixels).
+
+        Returns
+        -------
+        int
+            Cell size in pixels.
+        """
+        return self.__cell_size
+
+    def get_mlx_ptr(self) -> Any:
+        """Return the raw MLX context pointer.
+
+        Returns
+        -------
+        Any
+            Low-level MLX context pointer required by the wrapper.
+        """
+        return self.__mlx_ptr
+
+    def get_win_ptr(self) -> Any:
+        """Return the MLX window pointer.
+
+        Returns
+        -------
+        Any
+            Low-level MLX window pointer.
+        """
+        return self.__win_ptr
+
+    def get_div(self) -> int:
+        """Return the divider used to compute wall thickness.
+
+        Returns
+        -------
+        int
+            Divider value used when drawing walls.
+        """
+        return self.__div
+
+    def get_wall_thickness(self) -> int:
+        """Return the wall thickness in pixels at the current zoom.
+
+        Walls are never thinner than one pixel, so they stay visible on
+        small cells.
+
+        Returns
+        -------
+        int
+            Wall thickness in pixels.
+        """
+        return max(1, self.get_cell_size() // self.get_div())
+
+    def get_background_color(self) -> int:
+        """Return the background color.
+
+        Returns
+        -------
+        int
+            Color as a 32-bit integer (0xAARRGGBB).
+        """
+        return self.__palette[Displayer.BACKGROUND]
+
+    def get_walls_color(self) -> int:
+        """Return the wall color.
+
+        Returns
+        -------
+        int
+            Color as a 32-bit integer (0xAARRGGBB).
+        """
+        return self.__palette[Displayer.WALLS]
+
+    def get_entry_color(self) -> int:
+        """Return the entry cell color.
+
+        Returns
+        -------
+        int
+            Color as a 32-bit integer (0xAARRGGBB).
+        """
+        return self.__palette[Displayer.ENTRY]
+
+    def get_exit_color(self) -> int:
+        """Return the exit cell color.
+
+        Returns
+        -------
+        int
+            Color as a 32-bit integer (0xAARRGGBB).
+        """
+        return self.__palette[Displayer.EXIT]
+
+    def get_icon_color(self) -> int:
+        """Return the central icon color.
+
+        Returns
+        -------
+        int
+            Color as a 32-bit integer (0xAARRGGBB).
+        """
+        return self.__palette[Displayer.ICON]
+
+    def get_path_color(self) -> int:
+        """Return the path color.
+
+        Returns
+        -------
+        int
+            Color as a 32-bit integer (0xAARRGGBB).
+        """
+        return self.__palette[Displayer.PATH]
+
+    def get_palette(self) -> list[int]:
+        """Return the palette used to color the index image.
+
+        Returns
+        -------
+        list[int]
+            256 colors as 32-bit integers (0xAARRGGBB), one per index.
+        """
+        return self.__palette
+
+    def get_index_img(self) -> bytearray:
+        """Return the semantic index image.
+
+        Returns
+        -------
+        bytearray
+            One palette index per pixel, row by row, with no padding.
+        """
+        return self.__index_img
+
+    def display(self, loop: bool = True) -> None:
+        """Display the complete maze in the MLX window.
+
+        Renders all cells, walls, path, entry and exit, then puts the image
+        to the window and optionally starts the MLX event loop. When cells
+        are smaller than ``LOD_CELL_SIZE`` pixels, walls are drawn from the
+        cached mipmap instead.
+
+        Parameters
+        ----------
+        loop : bool, optional
+            Whether to start the MLX event loop (default is True).
+
+        Returns
+        -------
+        None
+        """
+        if not self.animation_finished:
+            self.__refresh_animation()
+            self.put_image()
+            return
+
+        maze = self.get_maze()
+        mlx = self.get_mlx()
+        mlx_ptr = self.get_mlx_ptr()
+        with self.__first_phase("first full frame"):
+            stats = self.stats
+            if stats is not None:
+                stats.start_frame("display")
+
+            visible_x, visible_y = self.get_visible_cells()
+            if self.__lod_level is not None:
+                self.__display_lod()
+            else:
+                self.clear(Displayer.BACKGROUND)
+
+                for x in visible_x:
+                    for y in visible_y:
+                        coords: tuple[int, int] = (x, y)
+                        cell: Cell = maze.get_cell(coords)
+                        walls = cell.get_state_walls(True)
+                        if (cell.is_icon()):
+                            self.print_cell(coords, Displayer.ICON)
+                        self.print_walls(coords, walls, Displayer.WALLS)
+
+            if stats is not None:
+                stats.cells += len(visible_x) * len(visible_y)
+                stats.mark("maze")
+            self.print_solver()
+            self.print_path()
+            if stats is not None:
+                stats.mark("path")
+            self.print_entry()
+            self.print_exit()
+            if self.move_mode:
+                self.print_ghosts()
+                self.print_player(Displayer.WALLS)
+            self.__hint_coords = None
+            self.print_hint()
+            if stats is not None:
+                stats.mark("markers")
+            self.put_image()
+            if stats is not None:
+                stats.mark("upload")
+                stats.end_frame()
+        if loop:
+            mlx.mlx_loop(mlx_ptr)
+
+    def put_image(self) -> None:
+        """Put the maze image to the main window.
+
+        Returns
+        -------
+        None
+        """
+        mlx = self.get_mlx()
+        mlx.mlx_put_image_to_window(
+            self.get_mlx_ptr(), self.get_win_ptr(), self.get_new_img(), 0, 0)
+        if self.stats is not None:
+            self.stats.add_upload(len(self.__data))
+            if self.show_stats:
+                self.print_stats()
+        if self.recorder is not None:
+            self.recorder.capture(self.__data, *self.get_image_size())
+        if self.profiler is not None:
+            self.profiler.mark("first upload")
+
+    def apply_palette(self) -> None:
+        """Recolor the whole image from the index image and the palette.
+
+        Each color channel is rebuilt with one ``bytes.translate`` pass over
+        the index image, so the cost does not depend on the maze at all.
+        Call it after :meth:`set_color` to recolor what is already drawn,
+        then :meth:`put_image` to show the result.
+
+        Returns
+        -------
+        None
+        """
+        data = self.__data
+        size_line = self.__size_line
+        index_img = self.__index_img
+        image_x, image_y = self.get_image_size()
+        row_bytes = image_x * 4
+
+        tables: list[bytes] = [
+            bytes((color >> shift) & 0xFF for color in self.__palette)
+            for shift in (0, 8, 16, 24)
+        ]
+
+        if size_line == row_bytes:
+            for channel, table in enumerate(tables):
+                data[channel:image_y * row_bytes:4] = \
+                    index_img.translate(table)
+            return
+
+        for y in range(image_y):
+            row = index_img[y * image_x:(y + 1) * image_x]
+            start = y * size_line
+            for channel, table in enumerate(tables):
+                data[start + channel:start + row_bytes:4] = \
+                    row.translate(table)
+
+    def fill_rect(self, pixel_x: int, pixel_y: int, width: int, height: int,
+                  index: int) -> None:
+        """Fill a rectangle of the image with a palette color.
+
+        The rectangle is clipped to the image, then written one row slice at
+        a time in both the MLX image and the index image.
+
+        Parameters
+        ----------
+        pixel_x : int
+            Left position in pixels.
+        pixel_y : int
+            Top position in pixels.
+        width : int
+            Rectangle width in pixels.
+        height : int
+            Rectangle height in pixels.
+        index : int
+            Palette index of the fill color.
+
+        Returns
+        -------
+        None
+        """
+        image_x, image_y = self.get_image_size()
+        x_start = max(pixel_x, 0)
+        x_end = min(pixel_x + width, image_x)
+        y_start = max(pixel_y, 0)
+        y_end = min(pixel_y + height, image_y)
+        if x_start >= x_end or y_start >= y_end:
+            return
+
+        data = self.__data
+        index_img = self.__index_img
+        size_line = self.__size_line
+        n_bytes = self.__bpp // 8
+        length = x_end - x_start
+
+        color_row = (
+            self.__palette[index].to_bytes(4, 'little') * length
+        )
+        index_row = bytes((index,)) * length
+
+        for y in range(y_start, y_end):
+            offset = y * size_line + x_start * n_bytes
+            data[offset:offset + length * 4] = color_row
+            offset = y * image_x + x_start
+            index_img[offset:offset + length] = index_row
+
+    def clear(self, index: int) -> None:
+        """Clear the image with a solid palette color.
+
+        Parameters
+        ----------
+        index : int
+            Palette index of the fill color (e.g. ``Displayer.BACKGROUND``).
+
+        Returns
+        -------
+        None
+        """
+        image_width, image_height = self.get_image_size()
+
+        self.__data[:] = \
+            self.__palette[index].to_bytes(self.__bpp // 8, 'little') \
+            * (len(self.__data) // (self.__bpp // 8))
+        self.__index_img[:] = \
+            bytes((index,)) * (image_width * image_height)
+
+    def key_press(self, keycode: int, _: None) -> None:
+        """Handle keyboard input events.
+
+        Processes keyboard input for player movement, mode toggling, and
+        window closing. Supports movement in four directions when in move mode.
+
+        The camera is controlled with W/A/S/D (or the arrows outside move
+        mode) to scroll, +/- to zoom, C to fit the whole maze and F to
+        toggle the follow-camera, which keeps the player centered. I shows
+        or hides the frame statistics overlay. H shows or hides the hint
+        towards the exit and G starts or stops the auto-walk. R replays the
+        last saved run as a ghost, racing a new run of the player.
+
+        Parameters
+        ----------
+        keycode : int
+            The key code of the pressed key.
+        _ : None
+            Unused callback argument from MLX.
+
+        Returns
+        -------
+        None
+        """
+        esc = 65307
+        move_mode = 109
+        left, up, right, down = Displayer.MOVES
+        scroll_keys: dict[int, tuple[float, float]] = {
+            97: (-0.25, 0), 119: (0, -0.25), 100: (0.25, 0), 115: (0, 0.25),
+        }
+        if not self.move_mode:
+            scroll_keys.update({
+                left: (-0.25, 0), up: (0, -0.25),
+                right: (0.25, 0), down: (0, 0.25),
+            })
+        zoom_in = (61, 43, 65451)
+        zoom_out = (45, 65453)
+        fit = 99
+        follow = 102
+        stats_overlay = 105
+        hint = 104
+        auto_walk = 103
+        replay = 114
+
+        stats = self.stats
+        if stats is not None:
+            stats.start_frame("key")
+
+        if keycode == esc:
+            self.close(None)
+
+        if self.move_mode and keycode in Displayer.MOVES:
+            self.queue_move(keycode)
+            if stats is not None:
+                stats.cancel_frame()
+            return
+
+        if keycode in scroll_keys:
+            self.scroll(*scroll_keys[keycode])
+        elif keycode in zoom_in:
+            self.zoom(2)
+        elif keycode in zoom_out:
+            self.zoom(0.5)
+        elif keycode == fit:
+            self.follow_camera = False
+            self.reset_camera()
+            self.fit_custom_player()
+            self.refresh_view()
+        elif keycode == follow:
+            self.follow_camera = not self.follow_camera
+            if self.move_mode and self.center_on_player():
+                self.refresh_view()
+        elif keycode == stats_overlay:
+            self.toggle_stats_overlay()
+        elif keycode == hint:
+            self.toggle_hint()
+        elif keycode == auto_walk:
+            if self.is_auto_walking():
+                self.stop_auto_walk()
+            else:
+                self.start_auto_walk()
+        elif keycode == replay:
+            self.load_ghost()
+
+        if keycode == move_mode:
+            self.set_move_mode(not self.move_mode)
+
+        if stats is not None:
+            stats.mark("input")
+        if self.function_player:
+            self.function_player[0](self.function_player[1])
+            if stats is not None:
+                stats.mark("callback")
+        self.put_image()
+        if stats is not None:
+            stats.mark("upload")
+            stats.end_frame()
+
+    def set_move_mode(self, move_mode: bool) -> None:
+        """Enter or leave move mode.
+
+        Entering it puts the player on the entry, starts recording a new
+        run and restarts the ghosts. Pending moves and the auto-walk are
+        cancelled either way.
+
+        Parameters
+        ----------
+        move_mode : bool
+            True to enter move mode, False to leave it.
+
+        Returns
+        -------
+        None
+        """
+        self.move_mode = move_mode
+        self.__pending_moves.clear()
+        self.__auto_walk = None
+        self.__run = None
+        if move_mode:
+            self.player_pos = self.get_maze().get_entry()
+            self.__run = RunRecord(self.fps, self.player_pos)
+            self.__run_start = self.__clock()
+            self.__restart_ghosts()
+            if self.follow_camera and self.center_on_player():
+                self.refresh_view()
+            self.print_ghosts()
+            self.print_player(Displayer.WALLS)
+            self.print_hint()
+        else:
+            self.display(False)
+
+    def add_ghost(self, record: RunRecord) -> None:
+        """Add a ghost replaying a run.
+
+        The ghosts start with the player, each time move mode is entered.
+
+        Parameters
+        ----------
+        record : RunRecord
+            The run to replay.
+
+        Returns
+        -------
+        None
+        """
+        self.__ghosts.append(Ghost(record))
+
+    def load_ghost(self, path: str = "") -> bool:
+        """Add a ghost replaying a saved run, then restart move mode.
+
+        Parameters
+        ----------
+        path : str, optional
+            Run file (default is the file set with :meth:`set_run_file`).
+
+        Returns
+        -------
+        bool
+            False if the run file cannot be read.
+        """
+        try:
+            record = RunRecord.load(path or self.run_file)
+        except (OSError, ReplayError):
+            return False
+        self.add_ghost(record)
+        self.set_move_mode(True)
+        return True
+
+    def clear_ghosts(self) -> None:
+        """Remove all the ghosts.
+
+        Returns
+        -------
+        None
+        """
+        ghosts = self.__ghosts
+        self.__ghosts = []
+        for ghost in ghosts:
+            self.print_previous_cell(ghost.position)
+        if self.move_mode:
+            self.print_player(Displayer.WALLS)
+
+    def get_ghosts(self) -> list[Ghost]:
+        """Return the ghosts.
+
+        Returns
+        -------
+        list[Ghost]
+            The ghosts, in the order they were added.
+        """
+        return self.__ghosts
+
+    def get_run(self) -> RunRecord | None:
+        """Return the run being recorded.
+
+        Returns
+        -------
+        RunRecord | None
+            The moves since move mode was entered, None outside move mode
+            and once the exit is reached.
+        """
+        return self.__run
+
+    def print_ghosts(self) -> None:
+        """Draw the ghosts, as squares of the ghost color.
+
+        Returns
+        -------
+        None
+        """
+        size = self.get_cell_size()
+        square = max(1, size // 3)
+        for ghost in self.__ghosts:
+            pixel_x, pixel_y = self.cell_to_pixel(ghost.position)
+            self.fill_rect(pixel_x + size // 3, pixel_y + size // 3,
+                           square, square, Displayer.GHOST)
+
+    def __restart_ghosts(self) -> None:
+        """Put the ghosts back at the start of their run.
+
+        Returns
+        -------
+        None
+        """
+        if not self.__ghosts:
+            return
+        for ghost in self.__ghosts:
+            self.print_previous_cell(ghost.position)
+        self.__ghosts = [Ghost(ghost.record) for ghost in self.__ghosts]
+        self.__ghosts_start = self.__clock()
+        if not self.__scheduler.is_running():
+            self.__scheduler.start(self.__run_frame, self.fps)
+
+    def __advance_ghosts(self) -> bool:
+        """Replay the ghost moves due at this frame, without uploading.
+
+        Only the cells left by the ghosts are redrawn.
+
+        Returns
+        -------
+        bool
+            Whether a ghost moved.
+        """
+        elapsed = self.__clock() - self.__ghosts_start
+        left: list[tuple[int, int]] = []
+        for ghost in self.__ghosts:
+            position = ghost.position
+            if ghost.advance(elapsed):
+                left.append(position)
+        if not left:
+            return False
+        for coords in left:
+            self.print_previous_cell(coords)
+        if self.__hint_coords in left:
+            self.print_hint()
+        self.print_ghosts()
+        self.print_player(Displayer.WALLS)
+        return True
+
+    def __record_moves(self, moves: list[str]) -> None:
+        """Add moves to the run, and save it once the exit is reached.
+
+        Parameters
+        ----------
+        moves : list[str]
+            Directions of the moves applied at this frame.
+
+        Returns
+        -------
+        None
+        """
+        run = self.__run
+        if run is None:
+            return
+        frame = int((self.__clock() - self.__run_start) * run.fps)
+        for direction in moves:
+            run.add_move(frame, direction)
+        if self.player_pos == self.get_maze().get_exit():
+            self.__run = None
+            if self.run_file:
+                run.save(self.run_file)
+
+    def toggle_hint(self) -> None:
+        """Show or hide the hint towards the exit in move mode.
+
+        Returns
+        -------
+        None
+        """
+        self.show_hint = not self.show_hint
+        self.print_hint()
+
+    def print_hint(self) -> None:
+        """Mark the cell of the next move towards the exit.
+
+        The move is read from the hint table of the maze (see
+        :meth:`MazeGenerator.get_hint_table`), in constant time. The
+        previous mark is erased first. Nothing is drawn when hints are
+        hidden, outside move mode or on the exit.
+
+        Returns
+        -------
+        None
+        """
+        previous = self.__hint_coords
+        self.__hint_coords = None
+        if previous is not None:
+            self.print_previous_cell(previous)
+            if previous == self.player_pos and self.move_mode:
+                self.print_player(Displayer.WALLS)
+        if not (self.show_hint and self.move_mode):
+            return
+        direction = self.get_maze().get_hint(self.player_pos)
+        if direction is None:
+            return
+        coords = MazeGenerator.get_coords_by_dir(self.player_pos, direction)
+        size = self.get_cell_size()
+        mark = max(1, size // 5)
+        pixel_x, pixel_y = self.cell_to_pixel(coords)
+        offset = (size - mark) // 2
+        self.fill_rect(pixel_x + offset, pixel_y + offset, mark, mark,
+                       Displayer.EXIT)
+        self.__hint_coords = coords
+
+    def start_auto_walk(self) -> None:
+        """Walk the player to the exit along the hint table.
+
+        Enters move mode if needed. The player moves ``auto_walk_speed``
+        cells per second, in the same per-frame batches as the arrow keys,
+        until it reaches the exit or an arrow key is pressed.
+
+        Returns
+        -------
+        None
+        """
+        if not self.move_mode:
+            self.set_move_mode(True)
+        self.__pending_moves.clear()
+        self.__auto_walk = (self.__clock(), 0)
+        if not self.__scheduler.is_running():
+            self.__scheduler.start(self.__run_frame, self.fps)
+
+    def stop_auto_walk(self) -> None:
+        """Stop the auto-walk, the player stays where it is.
+
+        Returns
+        -------
+        None
+        """
+        self.__auto_walk = None
+
+    def is_auto_walking(self) -> bool:
+        """Return whether the auto-walk is running.
+
+        Returns
+        -------
+        bool
+            True until the player reaches the exit or the walk is stopped.
+        """
+        return self.__auto_walk is not None
+
+    def __queue_auto_walk(self) -> None:
+        """Queue the auto-walk moves due since it started.
+
+        Returns
+        -------
+        None
+        """
+        if self.__auto_walk is None:
+            return
+        start, queued = self.__auto_walk
+        maze = self.get_maze()
+        speed = self.auto_walk_speed
+        due = maze.get_width() * maze.get_height()
+        if speed > 0:
+            due = int((self.__clock() - start) * speed) - queued
+        keys = {move[0]: keycode
+                for keycode, move in Displayer.MOVES.items()}
+        coords = self.player_pos
+        direction = maze.get_hint(coords)
+        while due > 0 and direction is not None:
+            self.__pending_moves.append(keys[direction])
+            coords = MazeGenerator.get_coords_by_dir(coords, direction)
+            direction = maze.get_hint(coords)
+            queued += 1
+            due -= 1
+        if direction is None:
+            self.__auto_walk = None
+        else:
+            self.__auto_walk = (start, queued)
+
+    def queue_move(self, keycode: int) -> bool:
+        """Queue a player move, applied at the next frame.
+
+        All the moves queued during a frame are applied at once, with a
+        single redraw and upload. A held key repeating faster than the key
+        repeat rate (see :meth:`set_key_repeat_rate`) is coalesced.
+
+        Parameters
+        ----------
+        keycode : int
+            Arrow key code, one of ``MOVES``.
 
         Returns
         -------
-        int
-            Color as a 32-bit integer (0xAARRGGBB).
+        bool
+            False if the move was dropped.
         """
-        return self.__walls_color
-
-    def get_entry_color(self) -> int:
-        """Return the entry cell color.
+        self.__auto_walk = None
+        now = self.__clock()
+        last_keycode, due = self.__next_move
+        if keycode == last_keycode and now < due:
+            return False
+        if keycode != last_keycode:
+            due = now
+        rate = self.key_repeat_rate
+        interval = 1 / rate if rate > 0 else 0.0
+        # Keep a steady grid, so that events jittering around the rate are
+        # not dropped one out of two.
+        self.__next_move = (keycode, max(due, now - interval) + interval)
+        self.__pending_moves.append(keycode)
+        if not self.__scheduler.is_running():
+            self.__scheduler.start(self.__run_frame, self.fps)
+        return True
+
+    def __apply_moves(self) -> bool:
+        """Apply the queued player moves, then redraw and upload once.
+
+        Moves stop at the maze exit, so that ``function_player`` sees the
+        player on it. The moves are recorded in the current run.
 
         Returns
         -------
-        int
-            Color as a 32-bit integer (0xAARRGGBB).
+        bool
+            Whether the player moved and the image was uploaded.
         """
-        return self.__entry_color
+        pending = self.__pending_moves
+        stats = self.stats
+        if stats is not None:
+            stats.start_frame("move")
 
-    def get_exit_color(self) -> int:
-        """Return the exit cell color.
+        maze = self.get_maze()
+        exit_coords = maze.get_exit()
+        trail: list[tuple[int, int]] = []
+        moves: list[str] = []
+        while pending and self.player_pos != exit_coords:
+            wall, dx, dy = Displayer.MOVES[pending.popleft()]
+            x, y = self.player_pos
+            if not maze.get_cell((x, y)).get_wall(wall):
+                trail.append((x, y))
+                moves.append(wall)
+                self.player_pos = x + dx, y + dy
+        if self.player_pos == exit_coords:
+            pending.clear()
+        if not trail:
+            if stats is not None:
+                stats.cancel_frame()
+            return False
+        self.__record_moves(moves)
+
+        if self.follow_camera and self.center_on_player():
+            self.refresh_view()
+        else:
+            for coords in dict.fromkeys(trail):
+                self.print_previous_cell(coords)
+            self.print_ghosts()
+            self.print_player(Displayer.WALLS)
+            self.print_hint()
+            if stats is not None:
+                stats.cells += len(trail) + 1
+        if stats is not None:
+            stats.mark("input")
+        if self.function_player:
+            self.function_player[0](self.function_player[1])
+            if stats is not None:
+                stats.mark("callback")
+        self.put_image()
+        if stats is not None:
+            stats.mark("upload")
+            stats.end_frame()
+        return True
 
-        Returns
-        -------
-        int
-            Color as a 32-bit integer (0xAARRGGBB).
-        """
-        return self.__exit_color
+    def __run_frame(self) -> bool:
+        """Frame function of the scheduler.
 
-    def get_icon_color(self) -> int:
-        """Return the central icon color.
+        Runs one frame of the current animation, if any, moves the ghosts,
+        then applies the queued player moves, including those of the
+        auto-walk. The image is uploaded at most once for the moves.
 
         Returns
         -------
-        int
-            Color as a 32-bit integer (0xAARRGGBB).
+        bool
+            False once there is nothing left to animate, replay, walk or
+            apply.
         """
-        return self.__icon_color
+        animation = self.__animation
+        if animation is not None:
+            with self.__first_phase("first animation frame"):
+                running = animation()
+            if not running and self.__animation is animation:
+                self.__animation = None
+        if self.__auto_walk is not None:
+            if self.move_mode:
+                self.__queue_auto_walk()
+            else:
+                self.__auto_walk = None
+        replaying = self.move_mode and any(
+            not ghost.is_finished() for ghost in self.__ghosts)
+        ghosts_moved = replaying and self.__advance_ghosts()
+        if self.__pending_moves and self.move_mode:
+            if not self.__apply_moves() and ghosts_moved:
+                self.put_image()
+        else:
+            self.__pending_moves.clear()
+            if ghosts_moved:
+                self.put_image()
+        return (self.__animation is not None or bool(self.__pending_moves)
+                or self.__auto_walk is not None or replaying)
 
-    def get_path_color(self) -> int:
-        """Return the path color.
+    def print_previous_cell(self, coords: tuple[int, int]) -> None:
+        """Redraw a cell the player just left.
+
+        Parameters
+        ----------
+        coords : tuple[int, int]
+            Cell coordinates as (x, y).
 
         Returns
         -------
-        int
-            Color as a 32-bit integer (0xAARRGGBB).
+        None
         """
-        return self.__path_color
+        maze = self.get_maze()
+        cell = maze.get_cell(coords)
+        cell_dict: dict[Any, Any] = {
+            maze.get_exit(): Displayer.EXIT,
+            maze.get_entry(): Displayer.ENTRY,
+        }
+
+        cell_index = Displayer.BACKGROUND
+        if (maze.is_in_shortest_path(cell)
+                and self.toggle_path and self.animation_finished):
+            cell_index = Displayer.PATH
+
+        elif coords in self.__solver_explored:
+            cell_index = Displayer.FRONTIER
+            if coords in self.__solver_trace:
+                cell_index = Displayer.PATH
+
+        if cell_dict.get(coords) and self.animation_finished:
+            cell_index = cell_dict[coords]
+        self.print_cell(coords, cell_index)
+        self.print_walls(coords, cell.get_state_walls(True), Displayer.WALLS)
+
+    def start_animated_display(self, fps: int, loop: bool = True,
+                               worker: GenerationWorker | None = None
+                               ) -> None:
+        """Start an animated display of the maze.
 
-    def display(self, loop: bool = True) -> None:
-        """Display the complete maze in the MLX window.
+        Creates an animated visualization of the maze generation algorithm
+        and starts the MLX event loop.
 
-        Renders all cells, walls, path, entry and exit, then puts the image
-        to the window and optionally starts the MLX event loop.
+        With a started ``worker``, the animation follows the events of the
+        generation running in the worker thread, in the order the cells are
+        carved. Otherwise the maze must already be generated and is revealed
+        with a depth-first walk from the entry.
+
+        Each frame reveals as many cells as needed to finish within the
+        animation duration (see :meth:`set_animation_duration`), or a single
+        cell if no duration is set, as long as they fit in
+        ``ANIMATION_BUDGET`` of the frame time. The image is uploaded once
+        per frame.
 
         Parameters
         ----------
+        fps : int
+            Target frames per second for the animation.
         loop : bool, optional
-            Whether to start the MLX event loop (default is True).
+            Whether to start the MLX event loop (default is True). Use False
+            when the loop is already running, e.g. from a button callback.
+        worker : GenerationWorker | None, optional
+            Worker generating the displayed maze (default is None).
 
         Returns
         -------
         None
         """
-        if not self.animation_finished:
-            self.need_refresh = True
-            self.__animate_display()
-            return
-
-        maze = self.get_maze()
-        height: int = maze.get_height()
-        width: int = maze.get_width()
-        mlx = self.get_mlx()
-        mlx_ptr = self.get_mlx_ptr()
-        win_ptr = self.get_win_ptr()
-        new_img = self.get_new_img()
-        background_color = self.get_background_color()
-        icon_color = self.get_icon_color()
-        walls_color = self. get_walls_color()
-
-        self.clear(background_color)
-
-        for x in range(width):
-            for y in range(height):
-                coords: tuple[int, int] = (x, y)
-                cell: Cell = maze.get_cell(coords)
-                walls = cell.get_state_walls(True)
-                if (cell.is_icon()):
-                    self.print_cell(coords, icon_color)
-                self.print_walls(coords, walls, walls_color)
+        if self.__worker is not None and self.__worker is not worker:
+            self.__worker.cancel()
+        if worker is not None and worker.get_maze() is not self.get_maze():
+            self.set_maze(worker.get_maze())
+        self.__worker = worker
+        self.__streaming = False
+        self.__dirty = set()
+        self.fps = max(1, fps)
+        self.animation_start = self.__clock()
+        self.first = True
+        self.visited = set()
+        self.stack = [self.get_maze().get_entry()]
+        self.animation_finished = False
 
-        self.print_path()
-        self.print_entry()
-        self.print_exit()
-        if self.move_mode:
-            self.print_player(self.get_walls_color())
-        mlx.mlx_put_image_to_window(mlx_ptr, win_ptr, new_img, 0, 0)
+        self.__animation = self.__animate_display
+        self.__scheduler.start(self.__run_frame, self.fps)
         if loop:
-            mlx.mlx_loop(mlx_ptr)
+            self.get_mlx().mlx_loop(self.get_mlx_ptr())
+
+    def start_generation_display(self, worker: GenerationWorker,
+                                 loop: bool = True) -> None:
+        """Display a maze while a worker generates it.
 
-    def clear(self, color: int) -> None:
-        """Clear the image with a solid color.
+        Unlike :meth:`start_animated_display`, every frame draws all the
+        cells carved since the previous one, so the window shows the maze
+        without waiting for the generation. Use a non-blocking worker, the
+        generation then never waits for the display.
 
         Parameters
         ----------
-        color : int
-            Fill color as a 32-bit integer (0xAARRGGBB).
+        worker : GenerationWorker
+            Started worker generating the maze.
+        loop : bool, optional
+            Whether to start the MLX event loop (default is True).
 
         Returns
         -------
         None
         """
-        mlx = self.get_mlx()
-        new_img = self.get_new_img()
+        self.start_animated_display(Displayer.STREAM_FPS, False, worker)
+        self.__streaming = True
+        if loop:
+            self.get_mlx().mlx_loop(self.get_mlx_ptr())
 
-        buf, bpp, size_line, endian = mlx.mlx_get_data_addr(new_img)
+    def start_solver_animation(self, algorithm: str = FrontierSolver.BFS,
+                               fps: int = 60, loop: bool = False) -> bool:
+        """Animate a frontier solver on the displayed maze.
 
-        addr: memoryview[int] = buf.cast('B')
+        Each frame draws whole frontier layers of the search, as many as the
+        animation duration and ``ANIMATION_BUDGET`` allow, then the path is
+        traced back from the exit to the entry.
 
-        image_width, image_height = self.get_image_size()
+        Parameters
+        ----------
+        algorithm : str, optional
+            One of ``FrontierSolver.ALGORITHMS`` (default is BFS).
+        fps : int, optional
+            Target frames per second (default is 60).
+        loop : bool, optional
+            Whether to start the MLX event loop (default is False, as the
+            solver is usually started from a running loop).
+
+        Returns
+        -------
+        bool
+            False if the maze is still being generated or animated.
+        """
+        if not self.animation_finished:
+            return False
 
-        addr[:] = \
-            color.to_bytes(bpp // 8, 'little') \
-            * (image_width * image_height)
+        self.clear_solver(False)
+        self.__solver = FrontierSolver(self.get_maze(), algorithm)
+        self.__solver_layers = self.__solver.layers()
+        self.fps = max(1, fps)
+        self.animation_start = self.__clock()
 
-    def key_press(self, keycode: int, _: None) -> None:
-        """Handle keyboard input events.
+        self.__animation = self.__animate_solver
+        self.__scheduler.start(self.__run_frame, self.fps)
+        if loop:
+            self.get_mlx().mlx_loop(self.get_mlx_ptr())
+        return True
 
-        Processes keyboard input for player movement, mode toggling, and
-        window closing. Supports movement in four directions when in move mode.
+    def clear_solver(self, redraw: bool = True) -> None:
+        """Stop the solver animation and remove it from the maze.
 
         Parameters
         ----------
-        keycode : int
-            The key code of the pressed key.
-        _ : None
-            Unused callback argument from MLX.
+        redraw : bool, optional
+            Whether to redraw the maze (default is True).
 
         Returns
         -------
         None
         """
-        esc = 65307
-        move_mode = 109
-        left = 65361
-        up = 65362
-        right = 65363
-        down = 65364
-
-        if keycode == esc:
-            self.close(None)
-
-        maze = self.get_maze()
-
-        mlx = self.get_mlx()
-        mlx_ptr = self.get_mlx_ptr()
-        win_ptr = self.get_win_ptr()
-        new_img = self.get_new_img()
-        if keycode == move_mode:
-            self.move_mode = not self.move_mode
-            if self.move_mode:
-                self.player_pos = maze.get_entry()
-                self.print_player(self.get_walls_color())
-            else:
-                self.display(False)
+        if self.__animation == self.__animate_solver:
+            self.__animation = None
+        self.__solver = None
+        self.__solver_layers = None
+        self.__solver_explored = set()
+        self.__solver_path = []
+        self.__solver_trace = set()
+        if redraw:
+            self.display(False)
+
+    def is_solver_shown(self) -> bool:
+        """Return whether a solver animation is running or displayed.
 
-        if self.move_mode is True and keycode in range(65361, 65365):
-            x, y = self.player_pos
-            cell = maze.get_cell(self.player_pos)
-
-            if keycode == left and not cell.get_wall("WEST"):
-                self.player_pos = x - 1, y
-            elif keycode == up and not cell.get_wall("NORTH"):
-                self.player_pos = x, y - 1
-            elif keycode == right and not cell.get_wall("EST"):
-                self.player_pos = x + 1, y
-            elif keycode == down and not cell.get_wall("SOUTH"):
-                self.player_pos = x, y + 1
-            if (x, y) != self.player_pos:
-                cell_dict: dict[Any, Any] = {
-                    maze.get_exit(): self.get_exit_color(),
-                    maze.get_entry(): self.get_entry_color(),
-                }
-
-                cell_color = self.get_background_color()
-                if (maze.is_in_shortest_path(cell)
-                        and self.toggle_path and self.animation_finished):
-                    cell_color = self.get_path_color()
-
-                if cell_dict.get((x, y)) and self.animation_finished:
-                    cell_color = cell_dict[(x, y)]
-                self.print_cell((x, y), cell_color)
-                self.print_walls(
-                    (x, y), cell.get_state_walls(True),
-                    self.get_walls_color())
-                self.print_player(self.get_walls_color())
+        Returns
+        -------
+        bool
+            True if solver cells are drawn over the maze.
+        """
+        return self.__solver is not None
 
-        if self.function_player:
-            self.function_player[0](self.function_player[1])
-        mlx.mlx_put_image_to_window(mlx_ptr, win_ptr, new_img, 0, 0)
+    def print_solver(self) -> None:
+        """Draw the cells explored by the solver and the traced path.
 
-    def start_animated_display(self, fps: int) -> None:
-        """Start an animated display of the maze.
+        Returns
+        -------
+        None
+        """
+        if self.__solver is None:
+            return
+        maze = self.get_maze()
+        for coords in self.__solver_explored:
+            if not self.is_visible(coords):
+                continue
+            index = Displayer.FRONTIER
+            if coords in self.__solver_trace:
+                index = Displayer.PATH
+            self.print_cell(coords, index)
+            walls = maze.get_cell(coords).get_state_walls(True)
+            self.print_walls(coords, walls, Displayer.WALLS)
 
-        Creates an animated visualization of the maze generation algorithm
-        and starts the MLX event loop.
+    def __animate_solver(self) -> bool:
+        """Draw one frame of the solver animation.
 
-        Parameters
-        ----------
-        fps : int
-            Target frames per second for the animation.
+        Called by the frame scheduler once per frame.
 
         Returns
         -------
-        None
+        bool
+            False once the path is fully traced.
         """
-        mlx = self.get_mlx()
-        mlx_ptr = self.get_mlx_ptr()
+        solver = self.__solver
+        if solver is None or (self.__solver_layers is None
+                              and not self.__solver_path):
+            return False
+        now = self.__clock()
+        frame_delay = self.__scheduler.get_frame_delay()
 
-        self.fps = fps
-        self.timestamp = time.time()
-        self.first = True
-        self.animation_finished = False
+        stats = self.stats
+        if stats is not None:
+            stats.start_frame("solver")
+
+        maze = self.get_maze()
+        explored = self.__solver_explored
+        deadline = now + frame_delay * Displayer.ANIMATION_BUDGET
+        batch_size = self.__animation_batch_size(len(explored))
+        per_cell = self.animation_duration > 0
+        drawn = 0
+        steps = 0
+        layers = self.__solver_layers
+        while layers is not None and steps < batch_size:
+            layer = next(layers, None)
+            if layer is None:
+                self.__solver_layers = layers = None
+                self.__solver_path = solver.get_path()
+                break
+            for coords in layer:
+                explored.add(coords)
+                if self.is_visible(coords):
+                    self.print_cell(coords, Displayer.FRONTIER)
+                    walls = maze.get_cell(coords).get_state_walls(True)
+                    self.print_walls(coords, walls, Displayer.WALLS)
+            drawn += len(layer)
+            steps += len(layer) if per_cell else 1
+            if self.__clock() >= deadline:
+                break
 
-        mlx.mlx_loop_hook(mlx_ptr, self.__animate_display, None)
-        mlx.mlx_loop(mlx_ptr)
+        path = self.__solver_path
+        while layers is None and path and steps < batch_size:
+            coords = path.pop()
+            self.__solver_trace.add(coords)
+            if self.is_visible(coords):
+                self.print_cell(coords, Displayer.PATH)
+                walls = maze.get_cell(coords).get_state_walls(True)
+                self.print_walls(coords, walls, Displayer.WALLS)
+            drawn += 1
+            steps += 1
+            if self.__clock() >= deadline:
+                break
 
-    def __animate_display(self, _: None = None) -> None:
-        """Internal callback used by MLX to update the animated display.
+        self.print_entry()
+        self.print_exit()
+        if self.move_mode:
+            self.print_player(Displayer.WALLS)
+        self.put_image()
+        if stats is not None:
+            stats.cells += drawn
+            stats.mark("step")
+            stats.end_frame()
+        return layers is not None or bool(path)
 
-        This method is called repeatedly by the MLX event loop to animate
-        the maze generation process. It updates the display incrementally
-        to show the maze generation in real-time.
+    def __animation_batch_size(self, done: int) -> int:
+        """Return the number of cells to reveal in the current frame.
 
         Parameters
         ----------
-        _ : None, optional
-            Unused callback argument provided by the MLX loop.
+        done : int
+            Number of cells already revealed.
 
         Returns
         -------
-        None
+        int
+            Cells needed to finish on time, at least 1.
         """
         maze = self.get_maze()
-        height: int = maze.get_height()
-        width: int = maze.get_width()
-        mlx = self.get_mlx()
-        mlx_ptr = self.get_mlx_ptr()
-        win_ptr = self.get_win_ptr()
-        new_img = self.get_new_img()
-        background_color = self.get_background_color()
-        icon_color = self.get_icon_color()
-        walls_color = self.get_walls_color()
-
-        if self.first or self.need_refresh:
-            for x in range(width):
-                for y in range(height):
-                    coords: tuple[int, int] = (x, y)
-                    cell: Cell = maze.get_cell(coords)
-                    if cell.is_icon():
-                        self.print_cell(coords, icon_color)
-                        walls = cell.get_state_walls(True)
-                        self.print_walls(coords, walls, walls_color)
-            mlx.mlx_put_image_to_window(mlx_ptr, win_ptr, new_img, 0, 0)
+        remaining_cells = maze.get_width() * maze.get_height() - done
+        if self.__streaming:
+            return max(1, remaining_cells)
+        duration = self.animation_duration
+        if duration <= 0:
+            return 1
+        elapsed = self.__clock() - self.animation_start
+        remaining_frames = max(1.0, (duration - elapsed) * self.fps)
+        return max(1, math.ceil(remaining_cells / remaining_frames))
+
+    def __animation_step(self) -> bool:
+        """Reveal the next cell of the animation, without uploading it.
+
+        Returns
+        -------
+        bool
+            False if there is no cell left to reveal.
+        """
+        maze = self.get_maze()
+        stack = self.stack
+        visited = self.visited
+
+        while stack:
+            coords = stack.pop()
+            if coords in visited:
+                continue
+            visited.add(coords)
+
+            cell = maze.get_cell(coords)
+            if self.is_visible(coords):
+                self.print_cell(coords, Displayer.BACKGROUND)
+                walls = cell.get_state_walls(True)
+                self.print_walls(coords, walls, Displayer.WALLS)
 
-            entry_coords: tuple[int, int] = maze.get_entry()
+            directions = cell.get_state_walls(False)
+            if isinstance(directions, str):
+                directions = [directions]
 
-            if not self.need_refresh:
-                self.visited: set[tuple[int, int]] = set()
-                self.stack: list[tuple[int, int]] = [entry_coords]
+            for direction in directions:
+                next_coords: tuple[int, int] = (
+                    maze.get_coords_by_dir(coords, direction)
+                )
+                if next_coords not in visited:
+                    stack.append(next_coords)
+            return True
+        return False
 
-        if self.fps <= 0:
-            self.fps = 1
-        frame_delay = 1 / self.fps
+    def __generation_step(self, worker: GenerationWorker,
+                          dirty: set[tuple[int, int]]) -> str | None:
+        """Apply the next generation event of a worker.
 
-        if self.need_refresh:
-            self.need_refresh = False
+        Parameters
+        ----------
+        worker : GenerationWorker
+            Worker generating the maze.
+        dirty : set[tuple[int, int]]
+            Cells to redraw at the end of the frame, updated in place.
 
-            if hasattr(self, 'visited') and self.visited:
-                for coords in self.visited:
-                    cell = maze.get_cell(coords)
-                    if cell.is_icon():
-                        self.print_cell(coords, icon_color)
-                        walls = cell.get_state_walls(True)
-                        self.print_walls(coords, walls, walls_color)
-                    else:
-                        self.print_cell(coords, background_color)
-                        walls = cell.get_state_walls(True)
-                        self.print_walls(coords, walls, walls_color)
+        Returns
+        -------
+        str | None
+            Kind of the event, or None if no event is pending.
+        """
+        events = worker.get_events(1)
+        if not events:
+            return None
+        kind, coords, direction = events[0]
+
+        if direction is not None:
+            next_coords = self.get_maze().get_coords_by_dir(coords, direction)
+            self.visited.add(coords)
+            self.visited.add(next_coords)
+            dirty.add(coords)
+            dirty.add(next_coords)
+        return kind
+
+    def __generation_drain(self, worker: GenerationWorker,
+                           dirty: set[tuple[int, int]]
+                           ) -> tuple[str | None, int]:
+        """Apply every pending generation event of a worker.
 
-                mlx.mlx_put_image_to_window(mlx_ptr, win_ptr, new_img, 0, 0)
+        Parameters
+        ----------
+        worker : GenerationWorker
+            Worker generating the maze.
+        dirty : set[tuple[int, int]]
+            Cells to redraw at the end of the frame, updated in place.
 
-        if time.time() - self.timestamp >= frame_delay or self.first:
-            self.timestamp = time.time()
-        else:
-            return
+        Returns
+        -------
+        tuple[str | None, int]
+            Kind of the last event, or None if no event was pending, and
+            the number of cells revealed.
+        """
+        get_coords_by_dir = self.get_maze().get_coords_by_dir
+        kind: str | None = None
+        cells: list[tuple[int, int]] = []
+        for kind, coords, direction in worker.get_events(sys.maxsize):
+            if direction is not None:
+                cells.append(coords)
+                cells.append(get_coords_by_dir(coords, direction))
+        self.visited.update(cells)
+        dirty.update(cells)
+        return kind, len(cells) // 2
+
+    def __refresh_animation(self) -> None:
+        """Redraw the visible cells already revealed by the animation.
 
-        if len(self.stack) or self.first:
-            actual_len: int = len(self.visited)
-            while len(self.visited) == actual_len:
-                coords = self.stack.pop()
-                if coords in self.visited:
+        Returns
+        -------
+        None
+        """
+        maze = self.get_maze()
+        visited = self.visited
+        visible_x, visible_y = self.get_visible_cells()
+        for x in visible_x:
+            for y in visible_y:
+                coords: tuple[int, int] = (x, y)
+                cell: Cell = maze.get_cell(coords)
+                if coords in visited:
+                    self.print_cell(coords, Displayer.BACKGROUND)
+                elif cell.is_icon():
+                    self.print_cell(coords, Displayer.ICON)
+                else:
                     continue
-                self.visited.add(coords)
+                walls = cell.get_state_walls(True)
+                self.print_walls(coords, walls, Displayer.WALLS)
 
-                cell = maze.get_cell(coords)
+    def __animate_display(self) -> bool:
+        """Draw one frame of the animated display.
 
-                self.print_cell(coords, background_color)
-                walls = cell.get_state_walls(True)
-                self.print_walls(coords, walls, walls_color)
+        Called by the frame scheduler once per frame, it reveals a batch of
+        cells and uploads the image.
 
-                mlx.mlx_put_image_to_window(mlx_ptr, win_ptr, new_img, 0,
-                                            0)
+        Raises
+        ------
+        Exception
+            The error raised by the generation worker, if any.
+
+        Returns
+        -------
+        bool
+            False once the animation is finished.
+        """
+        stats = self.stats
+        if stats is not None:
+            stats.start_frame("animation")
+
+        if self.first:
+            self.first = False
+            self.__refresh_animation()
+            if stats is not None:
+                stats.mark("refresh")
+
+        now = self.__clock()
+        frame_delay = self.__scheduler.get_frame_delay()
+
+        worker = self.__worker
+        if worker is not None:
+            dirty = self.__dirty
+            draw_deadline: float | None = None
+            if self.__streaming:
+                # Nothing is paced: take every pending event, so that the
+                # queue never fills up and the worker never waits, and
+                # only draw for a small part of the frame, as drawing
+                # competes with the generation thread. The cells left are
+                # drawn at the next frames.
+                kind, revealed = self.__generation_drain(worker, dirty)
+                draw_deadline = now + frame_delay * Displayer.STREAM_BUDGET
+            else:
+                # Half of the budget for the events, half to draw their
+                # cells.
+                deadline = now + frame_delay * Displayer.ANIMATION_BUDGET / 2
+                batch_size = self.__animation_batch_size(len(self.visited))
+                revealed = 0
+                kind = self.__generation_step(worker, dirty)
+                while kind is not None and kind != MazeGenerator.DONE:
+                    if kind != MazeGenerator.BACKTRACK:
+                        revealed += 1
+                    if revealed >= batch_size or self.__clock() >= deadline:
+                        break
+                    kind = self.__generation_step(worker, dirty)
 
-                directions = cell.get_state_walls(False)
-                if isinstance(directions, str):
-                    directions = [directions]
+            maze = self.get_maze()
+            if kind == MazeGenerator.DONE:
+                # The whole maze is drawn once the animation is finished.
+                dirty.clear()
+            while dirty:
+                coords = dirty.pop()
+                if self.is_visible(coords):
+                    cell = maze.get_cell(coords)
+                    self.print_cell(coords, Displayer.BACKGROUND)
+                    walls = cell.get_state_walls(True)
+                    self.print_walls(coords, walls, Displayer.WALLS)
+                    if (draw_deadline is not None
+                            and self.__clock() >= draw_deadline):
+                        break
+            if stats is not None:
+                stats.cells += revealed
+                stats.mark("step")
+            if kind == MazeGenerator.DONE:
+                self.__worker = None
+                self.stack.clear()
+                error = worker.get_error()
+                if error is not None:
+                    self.animation_finished = True
+                    self.__animation = None
+                    self.__scheduler.stop()
+                    if stats is not None:
+                        stats.end_frame()
+                    raise error
+            else:
+                self.put_image()
+                if stats is not None:
+                    stats.end_frame()
+                return True
 
-                for direction in directions:
-                    next_coords: tuple[int, int] = (
-                        maze.get_coords_by_dir(coords, direction)
-                    )
-                    if next_coords not in self.visited:
-                        self.stack.append(next_coords)
-                self.first = False
-        else:
-            if self.animation_finished:
-                return
-            self.animation_finished = True
-            self.display()
-            mlx.mlx_put_image_to_window(mlx_ptr, win_ptr, new_img, 0, 0)
+        if self.stack:
+            deadline = now + frame_delay * Displayer.ANIMATION_BUDGET
+            batch_size = self.__animation_batch_size(len(self.visited))
+            revealed = 0
+            while revealed < batch_size and self.__animation_step():
+                revealed += 1
+                if self.__clock() >= deadline:
+                    break
+            self.put_image()
+            if stats is not None:
+                stats.cells += revealed
+                stats.mark("step")
+                stats.end_frame()
+            return True
+        self.animation_finished = True
+        self.display(False)
+        if stats is not None:
+            stats.end_frame()
+        return False
 
     @staticmethod
     def put_pixel(data: bytearray, x: int, y: int, color: int,
@@ -758,18 +2546,16 @@ class Displayer():
         """
         maze = self.get_maze()
         entry = maze.get_entry()
-        entry_color = self.get_entry_color()
-        walls_color = self.get_walls_color()
 
-        self.print_cell(entry, entry_color)
+        self.print_cell(entry, Displayer.ENTRY)
 
         cell: Cell = maze.get_cell(entry)
         walls = cell.get_state_walls(False)
-        self.print_walls(entry, walls, entry_color)
+        self.print_walls(entry, walls, Displayer.ENTRY)
         walls = cell.get_state_walls(True)
-        self.print_walls(entry, walls, walls_color)
+        self.print_walls(entry, walls, Displayer.WALLS)
         if self.move_mode:
-            self.print_player(self.get_background_color())
+            self.print_player(Displayer.BACKGROUND)
 
     def print_exit(self) -> None:
         """Display the maze exit cell.
@@ -782,31 +2568,36 @@ class Displayer():
         """
         maze = self.get_maze()
         exit = maze.get_exit()
-        exit_color = self.get_exit_color()
-        walls_color = self.get_walls_color()
 
-        self.print_cell(exit, exit_color)
+        self.print_cell(exit, Displayer.EXIT)
 
         cell: Cell = maze.get_cell(exit)
         walls = cell.get_state_walls(False)
-        self.print_walls(exit, walls, exit_color)
+        self.print_walls(exit, walls, Displayer.EXIT)
         walls = cell.get_state_walls(True)
-        self.print_walls(exit, walls, walls_color)
+        self.print_walls(exit, walls, Displayer.WALLS)
         if self.move_mode:
-            self.print_player(self.get_background_color())
+            self.print_player(Displayer.BACKGROUND)
 
-    def set_custom_player(self, player_file: TextIO) -> None:
+    def set_custom_player(self, player_file: TextIO | str) -> None:
         """Load and set a custom player icon from a file.
 
         Reads a player icon from a text file where each character represents
         a pixel. Characters '0' and ' ' are treated as transparent. Other
         characters are mapped to colors using custom_player_colors dictionary.
+        Each of these colors is stored in the palette from ``PLAYER`` on, so
+        the icon itself only holds palette indexes.
         If auto_adjust_player is True, the icon is resized to fit cell size.
 
+        The icon is kept by the asset manager (see :meth:`get_assets`): a
+        path is only read again once the file is modified, and resized
+        icons are cached by size.
+
         Parameters
         ----------
-        player_file : TextIO
-            A file object opened in read mode containing the player icon.
+        player_file : TextIO | str
+            A file object opened in read mode containing the player icon,
+            or its path.
 
         Raises
         ------
@@ -818,12 +2609,13 @@ class Displayer():
         -------
         None
         """
-        player_txt: str = player_file.read(-1)
-        player_rows: list[str] = player_txt.split("\n")
-
-        for row in player_rows:
-            if row == "":
-                player_rows.remove(row)
+        assets = self.__assets
+        if isinstance(player_file, str):
+            name = player_file
+            player_rows = assets.get_sprite(name)
+        else:
+            name = str(getattr(player_file, "name", "<player>"))
+            player_rows = assets.add_sprite(name, player_file.read(-1))
 
         player_height: int = len(player_rows)
         player_width: int = 0
@@ -831,7 +2623,6 @@ class Displayer():
             player_width = len(player_rows[0])
             for row in player_rows:
                 if len(row) != player_width:
-                    player_rows.clear()
                     raise PlayerError(
                         "player line length has to stay the same."
                     )
@@ -840,67 +2631,75 @@ class Displayer():
                 and not self.auto_adjust_player):
             raise PlayerError("player too big.")
 
-        player_txt = player_txt.replace("\n", "")
-
-        self.custom_player = []
-
-        for y in range(player_height):
-            custom_player_row: list[int | None] = []
-            for x in range(player_width):
-                char: str = player_txt[y * player_width + x]
-                if char not in ["0", " "]:
-                    rgb: tuple[int, int, int] = cast(
-                        tuple[int, int, int],
-                        self.custom_player_colors.get(char)
-                        )
-                    if rgb is not None:
-                        red, green, blue = rgb
-
-                        red = abs(red) % 256
-                        green = abs(green) % 256
-                        blue = abs(blue) % 256
-
-                        custom_color: int = (
-                            (0xFF << 24) | (red << 16) | (green << 8) | blue
-                        )
-                        custom_player_row.append(custom_color)
-                    else:
-                        custom_player_row.append(self.get_walls_color())
-                else:
-                    custom_player_row.append(None)
-            self.custom_player.append(custom_player_row)
+        player_indexes: dict[str, int] = {}
+        palette = self.__palette
+        for i, (char, rgb) in enumerate(self.custom_player_colors.items()):
+            index: int = Displayer.PLAYER + i
+            if index >= len(palette):
+                raise PlayerError("too many player colors.")
+            red, green, blue = rgb
+
+            red = abs(red) % 256
+            green = abs(green) % 256
+            blue = abs(blue) % 256
+
+            palette[index] = (
+                (0xFF << 24) | (red << 16) | (green << 8) | blue
+            )
+            player_indexes[char] = index
+
+        self.__player_sprite = name
+        self.__player_indexes = player_indexes
+        self.__player_grids.clear()
+        self.__player_spans.clear()
+        self.custom_player = self.__sprite_indexes(player_rows)
+        self.custom_player_source = self.custom_player
+        self.fit_custom_player()
+
+    def __sprite_indexes(self, rows: list[str]) -> list[list[int | None]]:
+        """Map the characters of player icon rows to palette indexes.
+
+        Parameters
+        ----------
+        rows : list[str]
+            Rows of the icon, one character per pixel.
+
+        Returns
+        -------
+        list[list[int | None]]
+            Palette index of each pixel, None where it is transparent.
+        """
+        indexes: dict[str, int | None] = {"0": None, " ": None}
+        for char in set("".join(rows)) - indexes.keys():
+            indexes[char] = self.__player_indexes.get(char, Displayer.WALLS)
+        return [[indexes[char] for char in row] for row in rows]
+
+    def fit_custom_player(self) -> None:
+        """Resize the custom player icon to the current cell size.
 
-        if not self.auto_adjust_player:
+        Does nothing if no custom player is set or if auto_adjust_player is
+        False. The icon is always resized from the loaded source so that
+        zooming in and out does not degrade it.
+
+        Returns
+        -------
+        None
+        """
+        source = self.custom_player_source
+        if source is None or not self.auto_adjust_player:
             return
 
         cell_size: int = self.get_cell_size()
-        expected_x_size: int = math.ceil(cell_size * 0.75)
-        expected_y_size: int = math.ceil(cell_size * 0.75)
+        expected_size: int = math.ceil(cell_size * 0.75)
 
-        src_h = player_height
-        src_w = player_width
-        tgt_h = expected_y_size
-        tgt_w = expected_x_size
+        grid = self.__player_grids.get(expected_size)
+        if grid is None:
+            grid = self.__sprite_indexes(self.__assets.get_scaled_sprite(
+                self.__player_sprite, expected_size, expected_size))
+            self.__player_grids[expected_size] = grid
+        self.custom_player = grid if grid else None
 
-        if src_h == 0 or src_w == 0:
-            self.custom_player = None
-        else:
-            resized: list[list[Any]] = []
-            for ty in range(tgt_h):
-                src_y = min(src_h - 1, int(ty * src_h / tgt_h))
-                row_list: list[int | None] = []
-                for tx in range(tgt_w):
-                    src_x = min(src_w - 1, int(tx * src_w / tgt_w))
-                    try:
-                        val = self.custom_player[src_y][src_x]
-                    except Exception:
-                        val = None
-                    row_list.append(val)
-                resized.append(row_list)
-
-            self.custom_player = resized
-
-    def print_player(self, color: int) -> None:
+    def print_player(self, index: int) -> None:
         """Draw the player icon at the current player position.
 
         Renders the player as either a custom icon (if set) or a default
@@ -908,82 +2707,136 @@ class Displayer():
 
         Parameters
         ----------
-        color : int
-            Fallback color for the player (used if no custom player is set)
-            as a 32-bit integer (0xAARRGGBB).
+        index : int
+            Palette index of the fallback color for the player (used if no
+            custom player is set).
 
         Returns
         -------
         None
         """
-        x, y = self.player_pos
         size = self.get_cell_size()
-
-        mlx = self.get_mlx()
-        new_img = self.get_new_img()
-        data, bpb, size_line, endian = mlx.mlx_get_data_addr(new_img)
+        cell_x, cell_y = self.cell_to_pixel(self.player_pos)
 
         if self.custom_player is not None:
-            player_offset_x: int = (size - len(self.custom_player)) // 2
-            player_offset_y: int = (size - len(self.custom_player[0])) // 2
-            for pixel_y, row in enumerate(self.custom_player):
-                for pixel_x, custom_color in enumerate(row):
-                    if custom_color is not None:
-                        Displayer.put_pixel(
-                            data,
-                            (pixel_x + x * size + self.x_offset
-                                + player_offset_x),
-                            (pixel_y + y * size + self.y_offset
-                                + player_offset_y),
-                            custom_color, bpb, size_line
-                            )
+            self.__blit_spans(self.__player_sprite_spans(size),
+                              cell_x, cell_y)
         else:
-            pixel_x = x * size + size // 3
-            pixel_y = y * size + size // 3
-
-            for y in range(pixel_y, pixel_y + size // 3):
-                for x in range(pixel_x, pixel_x + size // 3):
-                    Displayer.put_pixel(
-                        data,
-                        x + self.x_offset,
-                        y + self.y_offset,
-                        color, bpb, size_line
-                    )
+            square = max(1, size // 3)
+            self.fill_rect(cell_x + size // 3, cell_y + size // 3,
+                           square, square, index)
+
+    def __player_sprite_spans(self, size: int
+                              ) -> list[tuple[int, int, bytes, bytes]]:
+        """Return the custom player compiled into opaque row spans.
+
+        Each run of consecutive opaque pixels of a row becomes one span,
+        holding its palette indexes and colors ready to be copied. Spans
+        are cached by cell size and player colors.
+
+        Parameters
+        ----------
+        size : int
+            Cell size in pixels.
+
+        Returns
+        -------
+        list[tuple[int, int, bytes, bytes]]
+            (y, x, indexes, colors) of each span, relative to the top left
+            corner of the cell.
+        """
+        sprite = self.custom_player
+        if sprite is None:
+            return []
+        palette = self.__palette
+        first = Displayer.PLAYER
+        colors = (palette[Displayer.WALLS],
+                  *palette[first:first + len(self.__player_indexes)])
+        key = (size, colors)
+        cached = self.__player_spans.get(key)
+        if cached is not None and cached[0] is sprite:
+            return cached[1]
+
+        offset_x: int = (size - len(sprite)) // 2
+        offset_y: int = (size - len(sprite[0])) // 2
+        spans: list[tuple[int, int, bytes, bytes]] = []
+        for pixel_y, row in enumerate(sprite):
+            pixel_x = 0
+            while pixel_x < len(row):
+                if row[pixel_x] is None:
+                    pixel_x += 1
+                    continue
+                start = pixel_x
+                while pixel_x < len(row) and row[pixel_x] is not None:
+                    pixel_x += 1
+                indexes = cast(list[int], row[start:pixel_x])
+                spans.append((
+                    pixel_y + offset_y, start + offset_x, bytes(indexes),
+                    b"".join([palette[index].to_bytes(4, 'little')
+                              for index in indexes])))
+        self.__player_spans[key] = (sprite, spans)
+        return spans
+
+    def __blit_spans(self, spans: list[tuple[int, int, bytes, bytes]],
+                     pixel_x: int, pixel_y: int) -> None:
+        """Copy compiled spans to the image, one slice write per span.
+
+        Spans are clipped to the image.
 
-    def print_cell(self, coords: tuple[int, int], color: int) -> None:
+        Parameters
+        ----------
+        spans : list[tuple[int, int, bytes, bytes]]
+            (y, x, indexes, colors) of each span.
+        pixel_x : int
+            Left position of the spans origin in pixels.
+        pixel_y : int
+            Top position of the spans origin in pixels.
+
+        Returns
+        -------
+        None
+        """
+        image_x, image_y = self.get_image_size()
+        data = self.__data
+        index_img = self.__index_img
+        size_line = self.__size_line
+        for span_y, span_x, indexes, colors in spans:
+            y = pixel_y + span_y
+            if y < 0 or y >= image_y:
+                continue
+            x = pixel_x + span_x
+            start = max(0, -x)
+            end = min(len(indexes), image_x - x)
+            if start >= end:
+                continue
+            if start or end < len(indexes):
+                indexes = indexes[start:end]
+                colors = colors[start * 4:end * 4]
+            offset = y * size_line + (x + start) * 4
+            data[offset:offset + len(colors)] = colors
+            offset = y * image_x + x + start
+            index_img[offset:offset + len(indexes)] = indexes
+
+    def print_cell(self, coords: tuple[int, int], index: int) -> None:
         """Draw a filled cell at the given coordinates.
 
         Parameters
         ----------
         coords : tuple[int, int]
             Cell coordinates as (x, y).
-        color : int
-            Fill color as a 32-bit integer (0xAARRGGBB).
+        index : int
+            Palette index of the fill color.
 
         Returns
         -------
         None
         """
-        x, y = coords
         size = self.get_cell_size()
-        pixel_x = x * size
-        pixel_y = y * size
-        mlx = self.get_mlx()
-        new_img = self.get_new_img()
-        data, bpb, size_line, endian = mlx.mlx_get_data_addr(new_img)
-        for y in range(pixel_y, pixel_y + size):
-            for x in range(pixel_x, pixel_x + size):
-                Displayer.put_pixel(
-                    data,
-                    x + self.x_offset,
-                    y + self.y_offset,
-                    color,
-                    bpb,
-                    size_line
-                )
+        pixel_x, pixel_y = self.cell_to_pixel(coords)
+        self.fill_rect(pixel_x, pixel_y, size, size, index)
 
     def print_west_east(self, pixel_x_start: int,
-                        pixel_y_start: int, walls_color: int) -> None:
+                        pixel_y_start: int, index: int) -> None:
         """Draw a vertical wall (west or east) for a cell.
 
         Parameters
@@ -992,24 +2845,19 @@ class Displayer():
             Starting X position in pixels.
         pixel_y_start : int
             Starting Y position in pixels.
-        walls_color : int
-            Wall color as a 32-bit integer.
+        index : int
+            Palette index of the wall color.
 
         Returns
         -------
         None
         """
         size = self.get_cell_size()
-        new_img = self.get_new_img()
-        div = self.get_div()
-        mlx = self.get_mlx()
-        data, bpb, size_line, endian = mlx.mlx_get_data_addr(new_img)
-        for y in range(pixel_y_start, pixel_y_start + size):
-            for x in range(pixel_x_start, pixel_x_start + size // div):
-                Displayer.put_pixel(data, x, y, walls_color, bpb, size_line)
+        thickness = self.get_wall_thickness()
+        self.fill_rect(pixel_x_start, pixel_y_start, thickness, size, index)
 
     def print_north_south(self, pixel_x_start: int,
-                          pixel_y_start: int, walls_color: int) -> None:
+                          pixel_y_start: int, index: int) -> None:
         """Draw a horizontal wall (north or south) for a cell.
 
         Parameters
@@ -1018,54 +2866,52 @@ class Displayer():
             Starting X position in pixels.
         pixel_y_start : int
             Starting Y position in pixels.
-        walls_color : int
-            Wall color as a 32-bit integer.
+        index : int
+            Palette index of the wall color.
 
         Returns
         -------
         None
         """
         size = self.get_cell_size()
-        new_img = self.get_new_img()
-        div = self.get_div()
-        mlx = self.get_mlx()
-        data, bpb, size_line, endian = mlx.mlx_get_data_addr(new_img)
-        for y in range(pixel_y_start, pixel_y_start + size // div):
-            for x in range(pixel_x_start, pixel_x_start + size):
-                Displayer.put_pixel(data, x, y, walls_color, bpb, size_line)
+        thickness = self.get_wall_thickness()
+        self.fill_rect(pixel_x_start, pixel_y_start, size, thickness, index)
 
     def print_walls(self, coords: tuple[int, int], walls: list[str],
-                    color: int) -> None:
+                    index: int) -> None:
         """Draw all walls for a cell according to the provided directions.
 
+        Walls are skipped when the maze is drawn from the mipmap, as they
+        would be thinner than a pixel.
+
         Parameters
         ----------
         coords : tuple[int, int]
             Cell coordinates as (x, y).
         walls : list[str]
             List of wall directions (e.g. "NORTH", "SOUTH", "WEST", "EST").
-        color : int
-            Wall color as a 32-bit integer.
+        index : int
+            Palette index of the wall color.
 
         Returns
         -------
         None
         """
-        x, y = coords
+        if self.__lod_level is not None:
+            return
+
         size = self.get_cell_size()
-        div = self.get_div()
-        add_to_coord = math.ceil(size * (div-1)/div)
-        pixel_x = x * size + self.x_offset
-        pixel_y = y * size + self.y_offset
+        add_to_coord = size - self.get_wall_thickness()
+        pixel_x, pixel_y = self.cell_to_pixel(coords)
 
         if "WEST" in walls:
-            self.print_west_east(pixel_x, pixel_y, color)
+            self.print_west_east(pixel_x, pixel_y, index)
         if "EST" in walls:
-            self.print_west_east(pixel_x + add_to_coord, pixel_y, color)
+            self.print_west_east(pixel_x + add_to_coord, pixel_y, index)
         if "NORTH" in walls:
-            self.print_north_south(pixel_x, pixel_y, color)
+            self.print_north_south(pixel_x, pixel_y, index)
         if "SOUTH" in walls:
-            self.print_north_south(pixel_x, pixel_y + add_to_coord, color)
+            self.print_north_south(pixel_x, pixel_y + add_to_coord, index)
 
     def print_path(self) -> None:
         """Draw the shortest path in the maze.
@@ -1079,15 +2925,15 @@ class Displayer():
         """
         if self.toggle_path:
             maze = self.get_maze()
-            path_color = self.get_path_color()
-            walls_color = self.get_walls_color()
             for coords in maze.get_shortest_path_coords():
-                self.print_cell(coords, path_color)
+                if not self.is_visible(coords):
+                    continue
+                self.print_cell(coords, Displayer.PATH)
                 cell = maze.get_cell(coords)
                 walls = cell.get_state_walls(True)
-                self.print_walls(coords, walls, walls_color)
+                self.print_walls(coords, walls, Displayer.WALLS)
             if self.move_mode:
-                self.print_player(self.get_background_color())
+                self.print_player(Displayer.BACKGROUND)
 
     def close(self, _: None) -> None:
         """Close the MLX window and exit the event loop.
@@ -1134,7 +2980,13 @@ class Displayer():
             start_y: int = button.start_y
             if (start_x <= x and x <= start_x + width):
                 if (start_y <= y and y <= start_y + height):
+                    stats = self.stats
+                    if stats is not None:
+                        stats.start_frame("button")
                     button.function(button.param)
+                    if stats is not None:
+                        stats.mark("callback")
+                        stats.end_frame()
 
     def win_buttons(self) -> None:
         """Create a new window for displaying buttons."""
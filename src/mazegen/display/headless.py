@@ -0,0 +1,710 @@
+from typing import Any, Callable
+
+
+class HeadlessWindow():
+    """In-memory window used by :class:`HeadlessMlx`.
+
+    Attributes
+    ----------
+    width : int
+        Window width in pixels.
+    height : int
+        Window height in pixels.
+    title : str
+        Window title.
+    data : bytearray
+        Window content, 4 bytes per pixel (little-endian 0xAARRGGBB).
+    hooks : dict[int, tuple[Callable, Any]]
+        Callbacks registered with ``mlx_hook``, by X event number.
+    strings : list[tuple[int, int, int, str]]
+        Text put with ``mlx_string_put`` as (x, y, color, text).
+    n_puts : int
+        Number of images put to the window.
+    destroyed : bool
+        Whether the window was destroyed.
+    """
+    def __init__(self, width: int, height: int, title: str) -> None:
+        """Initialize an empty black window.
+
+        Parameters
+        ----------
+        width : int
+            Window width in pixels.
+        height : int
+            Window height in pixels.
+        title : str
+            Window title.
+
+        Returns
+        -------
+        None
+        """
+        self.width = width
+        self.height = height
+        self.title = title
+        self.data: bytearray = bytearray(width * height * 4)
+        self.hooks: dict[int, tuple[Callable[..., Any], Any]] = {}
+        self.strings: list[tuple[int, int, int, str]] = []
+        self.n_puts: int = 0
+        self.destroyed: bool = False
+
+
+class HeadlessImage():
+    """In-memory image used by :class:`HeadlessMlx`.
+
+    Attributes
+    ----------
+    width : int
+        Image width in pixels.
+    height : int
+        Image height in pixels.
+    data : bytearray
+        Image content, 4 bytes per pixel (little-endian 0xAARRGGBB).
+    """
+    def __init__(self, width: int, height: int) -> None:
+        """Initialize a transparent black image.
+
+        Parameters
+        ----------
+        width : int
+            Image width in pixels.
+        height : int
+            Image height in pixels.
+
+        Returns
+        -------
+        None
+        """
+        self.width = width
+        self.height = height
+        self.data: bytearray = bytearray(width * height * 4)
+
+
+class HeadlessMlx():
+    """Drop-in replacement for ``mlx.Mlx`` that needs no X display.
+
+    Implements the subset of the MLX API used by the Displayer, the buttons
+    and the victory screen on top of plain bytearrays. Pointers are plain
+    integers. Nothing is shown: putting an image to a window copies it into
+    the window buffer, so rendering can be benchmarked and inspected.
+
+    Since there is no event source, :meth:`mlx_loop` only calls the loop
+    hook ``loop_iterations`` times. Events can be sent by hand with
+    :meth:`send_key`, :meth:`send_mouse` and :meth:`send_close`.
+
+    Attributes
+    ----------
+    screen_size : tuple[int, int]
+        Size returned by ``mlx_get_screen_size``.
+    loop_iterations : int
+        Number of loop hook calls made by each ``mlx_loop`` call.
+    uploaded_bytes : int
+        Total number of bytes copied by ``mlx_put_image_to_window``.
+    loop_calls : int
+        Total number of loop hook calls.
+    """
+    def __init__(self, screen_size: tuple[int, int] = (1920, 1080),
+                 loop_iterations: int = 0) -> None:
+        """Initialize the headless backend.
+
+        Parameters
+        ----------
+        screen_size : tuple[int, int], optional
+            Fake screen size (default is 1920x1080).
+        loop_iterations : int, optional
+            Number of loop hook calls made by ``mlx_loop`` (default is 0).
+
+        Returns
+        -------
+        None
+        """
+        self.screen_size = screen_size
+        self.loop_iterations = loop_iterations
+        self.uploaded_bytes: int = 0
+        self.loop_calls: int = 0
+        self.windows: dict[int, HeadlessWindow] = {}
+        self.images: dict[int, HeadlessImage] = {}
+        self.loop_hook: tuple[Callable[[Any], Any], Any] | None = None
+        self.__next_ptr: int = 1
+        self.__loop_running: bool = False
+
+    def __new_ptr(self) -> int:
+        """Return a new unique fake pointer.
+
+        Returns
+        -------
+        int
+            The pointer value.
+        """
+        ptr = self.__next_ptr
+        self.__next_ptr += 1
+        return ptr
+
+    def mlx_init(self) -> int:
+        """Return the fake MLX context pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        return 0
+
+    def mlx_release(self, mlx_ptr: int) -> int:
+        """Release every window and image.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        self.windows.clear()
+        self.images.clear()
+        return 0
+
+    def mlx_get_screen_size(self, mlx_ptr: int) -> tuple[int, int, int]:
+        """Return the fake screen size.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+
+        Returns
+        -------
+        tuple[int, int, int]
+            (0, width, height), like the real wrapper.
+        """
+        width, height = self.screen_size
+        return (0, width, height)
+
+    def mlx_new_window(self, mlx_ptr: int, width: int, height: int,
+                       title: str) -> int:
+        """Create a window.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        width : int
+            Window width in pixels.
+        height : int
+            Window height in pixels.
+        title : str
+            Window title.
+
+        Returns
+        -------
+        int
+            Window pointer.
+        """
+        win_ptr = self.__new_ptr()
+        self.windows[win_ptr] = HeadlessWindow(width, height, title)
+        return win_ptr
+
+    def mlx_destroy_window(self, mlx_ptr: int, win_ptr: int) -> int:
+        """Mark a window as destroyed and drop its hooks.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        win_ptr : int
+            Window pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        window = self.windows.get(win_ptr)
+        if window is not None:
+            window.destroyed = True
+            window.hooks.clear()
+        return 0
+
+    def mlx_clear_window(self, mlx_ptr: int, win_ptr: int) -> int:
+        """Fill a window with black.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        win_ptr : int
+            Window pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        window = self.windows[win_ptr]
+        window.data[:] = bytes(len(window.data))
+        window.strings.clear()
+        return 0
+
+    def mlx_pixel_put(self, mlx_ptr: int, win_ptr: int, x: int, y: int,
+                      color: int) -> int:
+        """Put a single pixel in a window.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        win_ptr : int
+            Window pointer.
+        x : int
+            X coordinate in pixels.
+        y : int
+            Y coordinate in pixels.
+        color : int
+            Color as a 32-bit integer (0xAARRGGBB).
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        window = self.windows[win_ptr]
+        if 0 <= x < window.width and 0 <= y < window.height:
+            offset = (y * window.width + x) * 4
+            window.data[offset:offset + 4] = color.to_bytes(4, 'little')
+        return 0
+
+    def mlx_new_image(self, mlx_ptr: int, width: int, height: int) -> int:
+        """Create an image.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        width : int
+            Image width in pixels.
+        height : int
+            Image height in pixels.
+
+        Returns
+        -------
+        int
+            Image pointer.
+        """
+        img_ptr = self.__new_ptr()
+        self.images[img_ptr] = HeadlessImage(width, height)
+        return img_ptr
+
+    def mlx_destroy_image(self, mlx_ptr: int, img_ptr: int) -> int:
+        """Free an image.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        img_ptr : int
+            Image pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        self.images.pop(img_ptr, None)
+        return 0
+
+    def mlx_get_data_addr(self, img_ptr: int
+                          ) -> tuple[memoryview, int, int, int]:
+        """Return a writable view of an image buffer.
+
+        Parameters
+        ----------
+        img_ptr : int
+            Image pointer.
+
+        Returns
+        -------
+        tuple[memoryview, int, int, int]
+            (data, bits per pixel, bytes per line, endian), like the real
+            wrapper.
+        """
+        image = self.images[img_ptr]
+        return (memoryview(image.data), 32, image.width * 4, 0)
+
+    def mlx_put_image_to_window(self, mlx_ptr: int, win_ptr: int,
+                                img_ptr: int, x: int, y: int) -> int:
+        """Copy an image into a window buffer.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        win_ptr : int
+            Window pointer.
+        img_ptr : int
+            Image pointer.
+        x : int
+            X position of the image in the window.
+        y : int
+            Y position of the image in the window.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        window = self.windows[win_ptr]
+        image = self.images[img_ptr]
+
+        x_start = max(x, 0)
+        x_end = min(x + image.width, window.width)
+        y_start = max(y, 0)
+        y_end = min(y + image.height, window.height)
+        if x_start < x_end and y_start < y_end:
+            length = (x_end - x_start) * 4
+            for row in range(y_start, y_end):
+                src = ((row - y) * image.width + x_start - x) * 4
+                dst = (row * window.width + x_start) * 4
+                window.data[dst:dst + length] = image.data[src:src + length]
+            self.uploaded_bytes += length * (y_end - y_start)
+
+        window.n_puts += 1
+        return 0
+
+    def mlx_string_put(self, mlx_ptr: int, win_ptr: int, x: int, y: int,
+                       color: int, string: str) -> int:
+        """Record a string put in a window.
+
+        Text is not rasterized, it is only stored in ``window.strings``.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        win_ptr : int
+            Window pointer.
+        x : int
+            X position in pixels.
+        y : int
+            Y position in pixels.
+        color : int
+            Text color as a 24-bit integer.
+        string : str
+            Text to put.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        self.windows[win_ptr].strings.append((x, y, color, string))
+        return 0
+
+    def mlx_xpm_file_to_image(self, mlx_ptr: int,
+                              filename: str) -> tuple[int | None, int, int]:
+        """Load an XPM file into a new image.
+
+        Supports the XPM3 format with ``c`` color keys given as ``#RRGGBB``
+        or ``None`` (transparent).
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        filename : str
+            Path of the XPM file.
+
+        Returns
+        -------
+        tuple[int | None, int, int]
+            (image pointer, width, height), or (None, 0, 0) if the file
+            cannot be read, like the real wrapper.
+        """
+        try:
+            with open(filename) as xpm_file:
+                content = xpm_file.read()
+        except OSError:
+            return (None, 0, 0)
+
+        lines: list[str] = []
+        for line in content.split("\n"):
+            start = line.find('"')
+            end = line.rfind('"')
+            if start != -1 and end > start:
+                lines.append(line[start + 1:end])
+
+        try:
+            width, height, n_colors, cpp = (
+                int(value) for value in lines[0].split()[:4])
+            colors: dict[str, bytes] = {}
+            for line in lines[1:1 + n_colors]:
+                chars = line[:cpp]
+                keys = line[cpp:].split()
+                value = keys[keys.index("c") + 1]
+                if value.lower() == "none":
+                    colors[chars] = bytes(4)
+                else:
+                    colors[chars] = (
+                        (0xFF << 24) | int(value.lstrip("#")[:6], 16)
+                    ).to_bytes(4, 'little')
+
+            img_ptr = self.mlx_new_image(mlx_ptr, width, height)
+            data = self.images[img_ptr].data
+            pixels = lines[1 + n_colors:1 + n_colors + height]
+            for y, line in enumerate(pixels):
+                data[y * width * 4:(y + 1) * width * 4] = b"".join(
+                    colors[line[x:x + cpp]] for x in range(0, width * cpp, cpp)
+                )
+        except (IndexError, KeyError, ValueError):
+            return (None, 0, 0)
+        return (img_ptr, width, height)
+
+    def mlx_hook(self, win_ptr: int, x_event: int, x_mask: int,
+                 callback: Callable[..., Any] | None, param: Any) -> int:
+        """Register a callback for an X event on a window.
+
+        Parameters
+        ----------
+        win_ptr : int
+            Window pointer.
+        x_event : int
+            X event number (2 key press, 4 button press, 33 close...).
+        x_mask : int
+            X event mask (ignored).
+        callback : Callable | None
+            Callback to register, or None to remove it.
+        param : Any
+            Parameter passed back to the callback.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        hooks = self.windows[win_ptr].hooks
+        if callback is None:
+            hooks.pop(x_event, None)
+        else:
+            hooks[x_event] = (callback, param)
+        return 0
+
+    def mlx_key_hook(self, win_ptr: int,
+                     callback: Callable[..., Any] | None, param: Any) -> int:
+        """Register a key release callback on a window.
+
+        Parameters
+        ----------
+        win_ptr : int
+            Window pointer.
+        callback : Callable | None
+            Callback to register, or None to remove it.
+        param : Any
+            Parameter passed back to the callback.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        return self.mlx_hook(win_ptr, 3, 1 << 1, callback, param)
+
+    def mlx_mouse_hook(self, win_ptr: int,
+                       callback: Callable[..., Any] | None, param: Any) -> int:
+        """Register a mouse button callback on a window.
+
+        Parameters
+        ----------
+        win_ptr : int
+            Window pointer.
+        callback : Callable | None
+            Callback to register, or None to remove it.
+        param : Any
+            Parameter passed back to the callback.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        return self.mlx_hook(win_ptr, 4, 1 << 2, callback, param)
+
+    def mlx_loop_hook(self, mlx_ptr: int,
+                      callback: Callable[[Any], Any] | None,
+                      param: Any) -> int:
+        """Register the callback called on each loop iteration.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+        callback : Callable | None
+            Callback to register, or None to remove it.
+        param : Any
+            Parameter passed back to the callback.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        self.loop_hook = None if callback is None else (callback, param)
+        return 0
+
+    def mlx_loop(self, mlx_ptr: int) -> int:
+        """Call the loop hook up to ``loop_iterations`` times.
+
+        Stops early when ``mlx_loop_exit`` is called or when the hook is
+        removed.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        self.__loop_running = True
+        iterations = 0
+        while (self.__loop_running and self.loop_hook is not None
+                and iterations < self.loop_iterations):
+            self.run_loop_hook()
+            iterations += 1
+        self.__loop_running = False
+        return 0
+
+    def mlx_loop_exit(self, mlx_ptr: int) -> int:
+        """Stop the running ``mlx_loop``.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        self.__loop_running = False
+        return 0
+
+    def mlx_do_key_autorepeatoff(self, mlx_ptr: int) -> int:
+        """Do nothing, there is no keyboard.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        return 0
+
+    def mlx_do_key_autorepeaton(self, mlx_ptr: int) -> int:
+        """Do nothing, there is no keyboard.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        return 0
+
+    def mlx_do_sync(self, mlx_ptr: int) -> int:
+        """Do nothing, every operation is synchronous.
+
+        Parameters
+        ----------
+        mlx_ptr : int
+            MLX context pointer.
+
+        Returns
+        -------
+        int
+            Always 0.
+        """
+        return 0
+
+    def run_loop_hook(self) -> None:
+        """Call the loop hook once, if there is one.
+
+        Returns
+        -------
+        None
+        """
+        if self.loop_hook is not None:
+            callback, param = self.loop_hook
+            self.loop_calls += 1
+            callback(param)
+
+    def send_key(self, win_ptr: int, keycode: int) -> None:
+        """Send a key press event to a window.
+
+        Parameters
+        ----------
+        win_ptr : int
+            Window pointer.
+        keycode : int
+            X keysym of the pressed key.
+
+        Returns
+        -------
+        None
+        """
+        hook = self.windows[win_ptr].hooks.get(2)
+        if hook is not None:
+            callback, param = hook
+            callback(keycode, param)
+
+    def send_mouse(self, win_ptr: int, button: int, x: int, y: int) -> None:
+        """Send a mouse button press event to a window.
+
+        Parameters
+        ----------
+        win_ptr : int
+            Window pointer.
+        button : int
+            Mouse button number.
+        x : int
+            X position in pixels.
+        y : int
+            Y position in pixels.
+
+        Returns
+        -------
+        None
+        """
+        hook = self.windows[win_ptr].hooks.get(4)
+        if hook is not None:
+            callback, param = hook
+            callback(button, x, y, param)
+
+    def send_close(self, win_ptr: int) -> None:
+        """Send a close (destroy notify) event to a window.
+
+        Parameters
+        ----------
+        win_ptr : int
+            Window pointer.
+
+        Returns
+        -------
+        None
+        """
+        hook = self.windows[win_ptr].hooks.get(33)
+        if hook is not None:
+            callback, param = hook
+            callback(param)
@@ -0,0 +1,394 @@
+from typing import Any, BinaryIO
+import struct
+import zlib
+
+
+class RecorderError(Exception):
+    """Exception raised for invalid recorder parameters."""
+    def __init__(self, message: str = "undefined"):
+        """Initialize the exception with a custom message.
+
+        Parameters
+        ----------
+        message : str, optional
+            Human-readable error message. Default is 'undefined'.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(f"Recorder error: {message}")
+
+
+class VirtualClock():
+    """Clock advanced by its own ``sleep``, to animate without waiting.
+
+    Passed as the clock and sleep functions of a :class:`Displayer`, it
+    makes every loop hook call produce the next frame at once, so a
+    headless animation runs as fast as it can be drawn.
+
+    Attributes
+    ----------
+    now : float
+        Current time in seconds.
+    """
+    def __init__(self, start: float = 0.0) -> None:
+        """Initialize the clock.
+
+        Parameters
+        ----------
+        start : float, optional
+            Initial time in seconds (default is 0).
+
+        Returns
+        -------
+        None
+        """
+        self.now: float = start
+
+    def __call__(self) -> float:
+        """Return the current time.
+
+        Returns
+        -------
+        float
+            Time in seconds.
+        """
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the clock instead of waiting.
+
+        Parameters
+        ----------
+        seconds : float
+            Time to skip in seconds.
+
+        Returns
+        -------
+        None
+        """
+        if seconds > 0:
+            self.now += seconds
+
+
+class AnimationRecorder():
+    """Record the frames uploaded by a :class:`Displayer`.
+
+    Attach it with :meth:`Displayer.set_recorder`: every ``every``-th
+    uploaded frame is captured. With ``every=1`` during a generation
+    display, this is one frame per event batch.
+
+    - ``APNG``: a single animated PNG. Frames are delta-encoded: only the
+      rectangle that changed since the previous frame is stored, and frames
+      without change extend the display time of the previous one.
+    - ``PPM``: a sequence of full binary PPM images ``<path>_00000.ppm``,
+      ``<path>_00001.ppm``..., e.g. for ``ffmpeg``. Frames without change
+      are not written again.
+
+    Attributes
+    ----------
+    APNG, PPM : str
+        Names of the supported formats.
+    FORMATS : tuple[str, ...]
+        All supported formats.
+    frames : int
+        Number of frames captured.
+    written : int
+        Number of frames written (changed frames only).
+    """
+    APNG: str = "apng"
+    PPM: str = "ppm"
+    FORMATS: tuple[str, ...] = (APNG, PPM)
+
+    def __init__(self, path: str, fmt: str = APNG, every: int = 1,
+                 fps: int = 60, compression: int = 6) -> None:
+        """Initialize a recorder, no file is created before the first frame.
+
+        Parameters
+        ----------
+        path : str
+            Output file for ``APNG``, file name prefix for ``PPM``.
+        fmt : str, optional
+            One of ``FORMATS`` (default is ``APNG``).
+        every : int, optional
+            Capture one uploaded frame out of ``every`` (default is 1).
+        fps : int, optional
+            Frame rate of the animation, used for the frame delays
+            (default is 60).
+        compression : int, optional
+            zlib compression level of ``APNG`` frames (default is 6).
+
+        Raises
+        ------
+        RecorderError
+            If the format is unknown or ``every`` or ``fps`` is not
+            positive.
+
+        Returns
+        -------
+        None
+        """
+        if fmt not in AnimationRecorder.FORMATS:
+            raise RecorderError(f"unknown format '{fmt}'.")
+        if every <= 0 or fps <= 0:
+            raise RecorderError("every and fps have to be positive.")
+        self.__path = path
+        self.__format = fmt
+        self.__every = every
+        self.__fps = fps
+        self.__compression = compression
+        self.__file: BinaryIO | None = None
+        self.__size: tuple[int, int] = (0, 0)
+        self.__previous: bytes = b""
+        self.__pending: tuple[tuple[int, int, int, int], bytes] | None = None
+        self.__pending_delay: int = 0
+        self.__sequence: int = 0
+        self.__uploads: int = 0
+        self.frames: int = 0
+        self.written: int = 0
+
+    def capture(self, data: Any, width: int, height: int) -> None:
+        """Called at each upload, captures one frame out of ``every``.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Image in the MLX pixel format (32-bit little-endian ARGB), row
+            by row without padding.
+        width : int
+            Image width in pixels.
+        height : int
+            Image height in pixels.
+
+        Returns
+        -------
+        None
+        """
+        self.__uploads += 1
+        if (self.__uploads - 1) % self.__every:
+            return
+        self.frames += 1
+        frame = bytes(data)
+        if not self.__previous:
+            self.__size = (width, height)
+            self.__start()
+            box: tuple[int, int, int, int] | None = (0, 0, width, height)
+        elif (width, height) != self.__size:
+            raise RecorderError("the image size changed while recording.")
+        else:
+            box = self.__changed_box(self.__previous, frame)
+        self.__previous = frame
+
+        if box is None:
+            self.__pending_delay += 1
+            return
+        self.written += 1
+        if self.__format == AnimationRecorder.PPM:
+            self.__write_ppm(frame)
+            return
+        self.__flush_apng()
+        self.__pending = (box, self.__to_rgb(frame, box))
+        self.__pending_delay = 1
+
+    def close(self) -> None:
+        """Write the last frame and finish the file.
+
+        Returns
+        -------
+        None
+        """
+        if self.__file is None:
+            return
+        self.__flush_apng()
+        output = self.__file
+        output.write(self.__chunk(b"IEND", b""))
+        # The number of frames is only known now: rewrite acTL, right after
+        # the signature and IHDR.
+        output.seek(33)
+        output.write(self.__chunk(b"acTL", struct.pack(
+            ">II", self.written, 0)))
+        output.close()
+        self.__file = None
+
+    def __start(self) -> None:
+        """Open the output file and write the headers.
+
+        Returns
+        -------
+        None
+        """
+        if self.__format == AnimationRecorder.PPM:
+            return
+        width, height = self.__size
+        self.__file = open(self.__path, "wb")
+        self.__file.write(b"\x89PNG\r\n\x1a\n")
+        self.__file.write(self.__chunk(b"IHDR", struct.pack(
+            ">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        self.__file.write(self.__chunk(b"acTL", struct.pack(">II", 0, 0)))
+
+    def __changed_box(self, previous: bytes, frame: bytes
+                      ) -> tuple[int, int, int, int] | None:
+        """Return the rectangle of pixels that differ between two frames.
+
+        Parameters
+        ----------
+        previous : bytes
+            Previous frame.
+        frame : bytes
+            New frame of the same size.
+
+        Returns
+        -------
+        tuple[int, int, int, int] | None
+            (x, y, width, height) in pixels, or None if nothing changed.
+        """
+        if previous == frame:
+            return None
+        width, height = self.__size
+        stride = width * 4
+        changed = [y for y in range(height)
+                   if previous[y * stride:(y + 1) * stride]
+                   != frame[y * stride:(y + 1) * stride]]
+        # XOR the changed rows as integers: the lowest and highest set bits
+        # give the first and last changed bytes of all of them.
+        mask = 0
+        for y in changed:
+            row = slice(y * stride, (y + 1) * stride)
+            mask |= (int.from_bytes(previous[row], "little")
+                     ^ int.from_bytes(frame[row], "little"))
+        left = ((mask & -mask).bit_length() - 1) // 32
+        right = (mask.bit_length() - 1) // 32
+        return (left, changed[0], right - left + 1,
+                changed[-1] - changed[0] + 1)
+
+    def __to_rgb(self, frame: bytes, box: tuple[int, int, int, int]
+                 ) -> bytes:
+        """Return the PNG scanlines of a rectangle of a frame.
+
+        Parameters
+        ----------
+        frame : bytes
+            Frame in the MLX pixel format.
+        box : tuple[int, int, int, int]
+            (x, y, width, height) in pixels.
+
+        Returns
+        -------
+        bytes
+            RGB rows, each prefixed with the filter type 0.
+        """
+        x, y, box_width, box_height = box
+        stride = self.__size[0] * 4
+        rows = bytearray()
+        rgb = bytearray(box_width * 3)
+        for row_y in range(y, y + box_height):
+            start = row_y * stride + x * 4
+            row = frame[start:start + box_width * 4]
+            rgb[0::3] = row[2::4]
+            rgb[1::3] = row[1::4]
+            rgb[2::3] = row[0::4]
+            rows.append(0)
+            rows += rgb
+        return bytes(rows)
+
+    def __flush_apng(self) -> None:
+        """Write the pending APNG frame, now that its delay is known.
+
+        Returns
+        -------
+        None
+        """
+        output = self.__file
+        if self.__pending is None or output is None:
+            return
+        (x, y, width, height), rows = self.__pending
+        self.__pending = None
+        output.write(self.__chunk(b"fcTL", struct.pack(
+            ">IIIIIHHBB", self.__sequence, width, height, x, y,
+            min(0xFFFF, self.__pending_delay * self.__every), self.__fps,
+            0, 0)))
+        self.__sequence += 1
+        data = zlib.compress(rows, self.__compression)
+        if self.__sequence == 1:
+            output.write(self.__chunk(b"IDAT", data))
+        else:
+            output.write(self.__chunk(
+                b"fdAT", struct.pack(">I", self.__sequence) + data))
+            self.__sequence += 1
+
+    def __write_ppm(self, frame: bytes) -> None:
+        """Write a full frame as a binary PPM image.
+
+        Parameters
+        ----------
+        frame : bytes
+            Frame in the MLX pixel format.
+
+        Returns
+        -------
+        None
+        """
+        width, height = self.__size
+        name = f"{self.__path}_{self.written - 1:05d}.ppm"
+        rgb = bytearray(width * height * 3)
+        rgb[0::3] = frame[2::4]
+        rgb[1::3] = frame[1::4]
+        rgb[2::3] = frame[0::4]
+        with open(name, "wb") as output:
+            output.write(f"P6\n{width} {height}\n255\n".encode())
+            output.write(rgb)
+
+    @staticmethod
+    def __chunk(kind: bytes, data: bytes) -> bytes:
+        """Return a PNG chunk.
+
+        Parameters
+        ----------
+        kind : bytes
+            Chunk type.
+        data : bytes
+            Chunk data.
+
+        Returns
+        -------
+        bytes
+            Length, type, data and CRC.
+        """
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data)))
+
+
+def record_headless(displayer: Any, recorder: AnimationRecorder,
+                    max_frames: int = 100000) -> int:
+    """Run the MLX loop hook of a headless display until it is removed.
+
+    The displayer must use a :class:`HeadlessMlx`, and a
+    :class:`VirtualClock` to run faster than real time. Start an animation
+    first; the recorder is closed at the end.
+
+    Parameters
+    ----------
+    displayer : Displayer
+        Displayer with a started animation.
+    recorder : AnimationRecorder
+        Recorder to attach.
+    max_frames : int, optional
+        Maximum number of loop hook calls (default is 100000).
+
+    Returns
+    -------
+    int
+        Number of loop hook calls made.
+    """
+    mlx = displayer.get_mlx()
+    displayer.set_recorder(recorder)
+    calls = 0
+    try:
+        while mlx.loop_hook is not None and calls < max_frames:
+            mlx.run_loop_hook()
+            calls += 1
+    finally:
+        displayer.set_recorder(None)
+        recorder.close()
+    return calls
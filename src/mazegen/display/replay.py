@@ -0,0 +1,259 @@
+from typing import Iterator
+import struct
+
+
+class ReplayError(Exception):
+    """Exception raised when a run file cannot be read."""
+    def __init__(self, message: str = "undefined"):
+        """Initialize the exception with a custom message.
+
+        Parameters
+        ----------
+        message : str, optional
+            Human-readable error message. Default is 'undefined'.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(f"Replay error: {message}")
+
+
+class RunRecord():
+    """Player moves of a run, as a compact stream of direction codes.
+
+    Each move is one byte: the direction code in the 2 low bits, in the
+    order of ``DIRECTIONS``, and the number of frames since the previous
+    move in the 6 high bits. Longer pauses are stored as ``WAIT`` bytes of
+    63 frames each before the move.
+
+    Attributes
+    ----------
+    DIRECTIONS : tuple[str, ...]
+        Directions by code.
+    WAIT : int
+        Byte of a 63 frame pause without move.
+    MAGIC : bytes
+        First bytes of a run file.
+    HEADER : struct.Struct
+        Frame rate, start x and y and stream size, after ``MAGIC``.
+    fps : int
+        Frame rate of the timestamps.
+    start : tuple[int, int]
+        Cell the run starts from, as (x, y).
+    data : bytearray
+        The move stream.
+    frames : int
+        Timestamp of the last move, in frames since the start.
+    """
+    DIRECTIONS: tuple[str, ...] = ("NORTH", "EST", "SOUTH", "WEST")
+    WAIT: int = 63 << 2
+    MAGIC: bytes = b"AMZRUN1\n"
+    HEADER: struct.Struct = struct.Struct(">HHHI")
+
+    def __init__(self, fps: int, start: tuple[int, int],
+                 data: bytes = b"") -> None:
+        """Initialize a run.
+
+        Parameters
+        ----------
+        fps : int
+            Frame rate of the timestamps.
+        start : tuple[int, int]
+            Cell the run starts from, as (x, y).
+        data : bytes, optional
+            Move stream of an existing run (default is empty).
+
+        Raises
+        ------
+        ReplayError
+            If ``fps`` is not positive.
+
+        Returns
+        -------
+        None
+        """
+        if fps <= 0:
+            raise ReplayError("fps has to be positive.")
+        self.fps: int = fps
+        self.start: tuple[int, int] = start
+        self.data: bytearray = bytearray(data)
+        self.frames: int = sum(byte >> 2 for byte in self.data)
+        self.__codes: dict[str, int] = {
+            direction: code
+            for code, direction in enumerate(RunRecord.DIRECTIONS)}
+
+    def add_move(self, frame: int, direction: str) -> None:
+        """Append a move.
+
+        Parameters
+        ----------
+        frame : int
+            Timestamp of the move in frames since the start, not before
+            the previous move.
+        direction : str
+            "NORTH", "EST", "SOUTH" or "WEST".
+
+        Returns
+        -------
+        None
+        """
+        delta = max(0, frame - self.frames)
+        self.frames += delta
+        while delta >= 63:
+            self.data.append(RunRecord.WAIT)
+            delta -= 63
+        self.data.append(delta << 2 | self.__codes[direction])
+
+    def moves(self) -> Iterator[tuple[int, str]]:
+        """Iterate over the moves.
+
+        Returns
+        -------
+        Iterator[tuple[int, str]]
+            Timestamp in frames since the start and direction of each
+            move.
+        """
+        frame = 0
+        for byte in self.data:
+            if byte == RunRecord.WAIT:
+                frame += 63
+                continue
+            frame += byte >> 2
+            yield frame, RunRecord.DIRECTIONS[byte & 3]
+
+    def save(self, path: str) -> None:
+        """Write the run to a file.
+
+        Parameters
+        ----------
+        path : str
+            Output file.
+
+        Returns
+        -------
+        None
+        """
+        x, y = self.start
+        with open(path, "wb") as run_file:
+            run_file.write(RunRecord.MAGIC)
+            run_file.write(RunRecord.HEADER.pack(self.fps, x, y,
+                                                 len(self.data)))
+            run_file.write(self.data)
+
+    @staticmethod
+    def load(path: str) -> "RunRecord":
+        """Read a run written by :meth:`save`.
+
+        Parameters
+        ----------
+        path : str
+            Run file.
+
+        Raises
+        ------
+        ReplayError
+            If the file is not a run file.
+
+        Returns
+        -------
+        RunRecord
+            The run.
+        """
+        with open(path, "rb") as run_file:
+            content = run_file.read()
+        header_end = len(RunRecord.MAGIC) + RunRecord.HEADER.size
+        if (not content.startswith(RunRecord.MAGIC)
+                or len(content) < header_end):
+            raise ReplayError(f"'{path}' is not a run file.")
+        fps, x, y, size = RunRecord.HEADER.unpack(
+            content[len(RunRecord.MAGIC):header_end])
+        data = content[header_end:]
+        if len(data) != size or fps == 0:
+            raise ReplayError(f"'{path}' is truncated.")
+        return RunRecord(fps, (x, y), data)
+
+
+class Ghost():
+    """Replay of a :class:`RunRecord` following the frames of a clock.
+
+    Each call of :meth:`advance` reads only the moves due since the
+    previous call: the cost of a frame is the number of moves it replays,
+    without any path search.
+
+    Attributes
+    ----------
+    record : RunRecord
+        The run replayed.
+    position : tuple[int, int]
+        Current cell, as (x, y).
+    """
+    OFFSETS: tuple[tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+    def __init__(self, record: RunRecord) -> None:
+        """Initialize the ghost at the start of the run.
+
+        Parameters
+        ----------
+        record : RunRecord
+            The run to replay.
+
+        Returns
+        -------
+        None
+        """
+        self.record = record
+        self.position: tuple[int, int] = record.start
+        self.__cursor: int = 0
+        self.__next_frame: int = 0
+        self.__read_next()
+
+    def __read_next(self) -> None:
+        """Skip the pauses and read the timestamp of the next move.
+
+        Returns
+        -------
+        None
+        """
+        data = self.record.data
+        while (self.__cursor < len(data)
+               and data[self.__cursor] == RunRecord.WAIT):
+            self.__next_frame += 63
+            self.__cursor += 1
+        if self.__cursor < len(data):
+            self.__next_frame += data[self.__cursor] >> 2
+
+    def is_finished(self) -> bool:
+        """Return whether every move was replayed.
+
+        Returns
+        -------
+        bool
+            True at the end of the run.
+        """
+        return self.__cursor >= len(self.record.data)
+
+    def advance(self, elapsed: float) -> bool:
+        """Replay the moves due after some time.
+
+        Parameters
+        ----------
+        elapsed : float
+            Seconds since the start of the replay.
+
+        Returns
+        -------
+        bool
+            Whether the ghost moved.
+        """
+        frame = int(elapsed * self.record.fps)
+        data = self.record.data
+        moved = False
+        while self.__cursor < len(data) and self.__next_frame <= frame:
+            dx, dy = Ghost.OFFSETS[data[self.__cursor] & 3]
+            x, y = self.position
+            self.position = (x + dx, y + dy)
+            self.__cursor += 1
+            self.__read_next()
+            moved = True
+        return moved
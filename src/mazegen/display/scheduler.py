@@ -0,0 +1,223 @@
+from typing import Any, Callable
+import math
+import time
+
+
+class FrameScheduler():
+    """Call a frame function at a steady rate from the MLX loop hook.
+
+    The MLX loop calls its hook continuously while no event is pending.
+    Instead of returning at once until the next frame is due, the scheduler
+    sleeps until the deadline, so the loop does not spin a core. Deadlines
+    follow a fixed grid on a monotonic clock: when a frame overruns, the
+    missed frames are skipped instead of shifting every later frame.
+
+    When the frame function reports that nothing is animating anymore, the
+    hook is unregistered and the MLX loop only waits for events, unless an
+    idle function is set with :meth:`set_idle`: the hook then only wakes up
+    to call it at its own, low rate, without drawing any frame.
+
+    Attributes
+    ----------
+    skipped_frames : int
+        Number of frames skipped because of overruns since the last start.
+    """
+    IDLE_SLEEP: float = 0.05
+
+    def __init__(self, mlx: Any, mlx_ptr: Any,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Any] = time.sleep) -> None:
+        """Initialize a stopped scheduler.
+
+        Parameters
+        ----------
+        mlx : Mlx | HeadlessMlx
+            MLX backend whose loop hook is used.
+        mlx_ptr : Any
+            MLX context pointer.
+        clock : Callable[[], float], optional
+            Monotonic clock in seconds (default is ``time.monotonic``).
+        sleep : Callable[[float], Any], optional
+            Sleep function in seconds (default is ``time.sleep``).
+
+        Returns
+        -------
+        None
+        """
+        self.__mlx = mlx
+        self.__mlx_ptr = mlx_ptr
+        self.__clock = clock
+        self.__sleep = sleep
+        self.__frame: Callable[[], bool] | None = None
+        self.__frame_delay: float = 0.0
+        self.__deadline: float = 0.0
+        self.__retired_hooks: list[Any] = []
+        self.__idle: Callable[[], Any] | None = None
+        self.__idle_interval: float = 0.0
+        self.__idle_deadline: float = 0.0
+        self.__hooked: bool = False
+        self.skipped_frames: int = 0
+
+    def start(self, frame: Callable[[], bool], fps: int) -> None:
+        """Register the hook and call ``frame`` ``fps`` times per second.
+
+        The first frame is due at once. Starting again replaces the current
+        frame function, without registering the hook again: this is safe
+        from inside a frame.
+
+        Parameters
+        ----------
+        frame : Callable[[], bool]
+            Function drawing one frame, returning False once it has nothing
+            left to animate.
+        fps : int
+            Target frames per second.
+
+        Returns
+        -------
+        None
+        """
+        self.__frame = frame
+        self.__frame_delay = 1 / max(1, fps)
+        self.__deadline = self.__clock()
+        self.skipped_frames = 0
+        self.__hook()
+
+    def set_idle(self, idle: Callable[[], Any] | None,
+                 interval: float) -> None:
+        """Set a function called every ``interval`` seconds, e.g. to poll
+        a file, whether frames are drawn or not.
+
+        While only the idle function is left, the hook sleeps at most
+        ``IDLE_SLEEP`` seconds at a time, to keep input responsive, and
+        draws nothing.
+
+        Parameters
+        ----------
+        idle : Callable[[], Any] | None
+            Function called without argument, None to remove it.
+        interval : float
+            Time between two calls, in seconds.
+
+        Returns
+        -------
+        None
+        """
+        self.__idle = idle
+        self.__idle_interval = interval
+        self.__idle_deadline = self.__clock() + interval
+        if idle is not None:
+            self.__hook()
+        elif self.__frame is None:
+            self.__unhook()
+
+    def __hook(self) -> None:
+        """Register the loop hook, unless it already is.
+
+        Returns
+        -------
+        None
+        """
+        if not self.__hooked:
+            self.__hooked = True
+            self.__mlx.mlx_loop_hook(self.__mlx_ptr, self.__tick, None)
+
+    def __unhook(self) -> None:
+        """Unregister the loop hook, the MLX loop then only waits for events.
+
+        Returns
+        -------
+        None
+        """
+        if not self.__hooked:
+            return
+        self.__hooked = False
+        # The hook may be stopped from inside itself: keep the callback the
+        # MLX wrapper held alive until the next start, as the C loop still
+        # has to return through it.
+        refs = getattr(self.__mlx, "_python_ref_std", None)
+        if isinstance(refs, dict):
+            self.__retired_hooks = [refs.get("loop_f")]
+        self.__mlx.mlx_loop_hook(self.__mlx_ptr, None, None)
+
+    def stop(self) -> None:
+        """Stop drawing frames.
+
+        The hook is unregistered, the MLX loop then only waits for events,
+        unless an idle function is set.
+
+        Returns
+        -------
+        None
+        """
+        if self.__frame is None:
+            return
+        self.__frame = None
+        if self.__idle is None:
+            self.__unhook()
+
+    def is_running(self) -> bool:
+        """Return whether a frame function is scheduled.
+
+        Returns
+        -------
+        bool
+            True until the frame function returns False or :meth:`stop` is
+            called.
+        """
+        return self.__frame is not None
+
+    def get_frame_delay(self) -> float:
+        """Return the time between two frames.
+
+        Returns
+        -------
+        float
+            Frame delay in seconds.
+        """
+        return self.__frame_delay
+
+    def __tick(self, _: None = None) -> None:
+        """Loop hook: wait for the next deadline, then draw a frame.
+
+        The idle function is called first when it is due.
+
+        Parameters
+        ----------
+        _ : None, optional
+            Unused callback argument provided by the MLX loop.
+
+        Returns
+        -------
+        None
+        """
+        if (self.__idle is not None
+                and self.__clock() >= self.__idle_deadline):
+            self.__idle()
+            self.__idle_deadline = self.__clock() + self.__idle_interval
+        frame = self.__frame
+        if frame is None:
+            if self.__idle is not None:
+                wait = self.__idle_deadline - self.__clock()
+                if wait > 0:
+                    self.__sleep(min(wait, self.IDLE_SLEEP))
+            return
+        delay = self.__frame_delay
+
+        wait = self.__deadline - self.__clock()
+        if wait > 0:
+            # Never sleep more than a frame, to keep input responsive.
+            self.__sleep(min(wait, delay))
+            if self.__deadline > self.__clock():
+                return
+
+        running = frame()
+        self.__deadline += delay
+        late = self.__clock() - self.__deadline
+        if late > 0:
+            missed = math.floor(late / delay) + 1
+            self.__deadline += missed * delay
+            self.skipped_frames += missed
+
+        if not running and self.__frame is frame:
+            self.stop()
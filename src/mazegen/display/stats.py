@@ -0,0 +1,217 @@
+from collections import deque
+from typing import Any, Callable
+import time
+
+
+class FrameStats():
+    """Collect per-frame timings of a Displayer.
+
+    A frame starts with :meth:`start_frame` and ends with :meth:`end_frame`.
+    In between, :meth:`mark` adds the time elapsed since the previous mark
+    to a named stage. Frames can be nested (a key press that redraws the
+    whole view): only the outermost frame is recorded.
+
+    Attributes
+    ----------
+    HISTORY : int
+        Number of recorded frames kept for the averages.
+    frames : int
+        Total number of recorded frames.
+    cells : int
+        Number of cells drawn during the current frame.
+    uploaded_bytes : int
+        Number of bytes uploaded to the window during the current frame.
+    last_frame : dict[str, Any]
+        The last recorded frame (kind, total, stages, cells, bytes).
+    """
+    HISTORY: int = 120
+
+    def __init__(self, log_interval: float = 0.0,
+                 log: Callable[[str], Any] = print) -> None:
+        """Initialize empty statistics.
+
+        Parameters
+        ----------
+        log_interval : float, optional
+            Seconds between two log lines, 0 disables logging (default).
+        log : Callable[[str], Any], optional
+            Function called with each log line (default is ``print``).
+
+        Returns
+        -------
+        None
+        """
+        self.log_interval = log_interval
+        self.log = log
+
+        self.frames: int = 0
+        self.cells: int = 0
+        self.uploaded_bytes: int = 0
+        self.last_frame: dict[str, Any] = {}
+
+        self.__history: deque[dict[str, Any]] = deque(maxlen=self.HISTORY)
+        self.__depth: int = 0
+        self.__kind: str = ""
+        self.__start: float = 0.0
+        self.__last_mark: float = 0.0
+        self.__stages: dict[str, float] = {}
+        self.__last_log: float = time.perf_counter()
+
+    def start_frame(self, kind: str) -> None:
+        """Start a frame, or enter a nested one.
+
+        Parameters
+        ----------
+        kind : str
+            What triggered the frame ("display", "animation", "key"...).
+
+        Returns
+        -------
+        None
+        """
+        self.__depth += 1
+        if self.__depth > 1:
+            return
+        self.__kind = kind
+        self.__start = self.__last_mark = time.perf_counter()
+        self.__stages = {}
+        self.cells = 0
+        self.uploaded_bytes = 0
+
+    def mark(self, stage: str) -> None:
+        """Add the time elapsed since the previous mark to a stage.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage that just finished.
+
+        Returns
+        -------
+        None
+        """
+        now = time.perf_counter()
+        self.__stages[stage] = (
+            self.__stages.get(stage, 0.0) + now - self.__last_mark
+        )
+        self.__last_mark = now
+
+    def add_upload(self, n_bytes: int) -> None:
+        """Count bytes uploaded to the window.
+
+        Parameters
+        ----------
+        n_bytes : int
+            Number of uploaded bytes.
+
+        Returns
+        -------
+        None
+        """
+        self.uploaded_bytes += n_bytes
+
+    def cancel_frame(self) -> None:
+        """Leave the current frame without recording it.
+
+        Used when a frame callback returns without drawing anything.
+
+        Returns
+        -------
+        None
+        """
+        self.__depth = max(0, self.__depth - 1)
+
+    def end_frame(self) -> None:
+        """End the current frame and record it if it is the outermost one.
+
+        Logs a summary line if the log interval has elapsed.
+
+        Returns
+        -------
+        None
+        """
+        self.__depth = max(0, self.__depth - 1)
+        if self.__depth:
+            return
+
+        now = time.perf_counter()
+        self.last_frame = {
+            "kind": self.__kind,
+            "end": now,
+            "total": now - self.__start,
+            "stages": self.__stages,
+            "cells": self.cells,
+            "uploaded_bytes": self.uploaded_bytes,
+        }
+        self.__history.append(self.last_frame)
+        self.frames += 1
+
+        interval = self.log_interval
+        if interval > 0 and now - self.__last_log >= interval:
+            self.__last_log = now
+            self.log(self.format_line())
+
+    def get_fps(self) -> float:
+        """Return the number of frames recorded during the last second.
+
+        Returns
+        -------
+        float
+            Frames per second.
+        """
+        if not self.__history:
+            return 0.0
+        now = time.perf_counter()
+        recent = [frame for frame in self.__history
+                  if now - frame["end"] <= 1.0]
+        if len(recent) < 2:
+            return float(len(recent))
+        elapsed = recent[-1]["end"] - recent[0]["end"]
+        return (len(recent) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def get_summary(self) -> dict[str, Any]:
+        """Return averages over the recent frames.
+
+        Returns
+        -------
+        dict[str, Any]
+            Total frames, fps, and the mean frame duration, stage durations
+            (seconds), cells drawn and uploaded bytes of the last
+            ``HISTORY`` frames.
+        """
+        history = list(self.__history)
+        count = max(len(history), 1)
+        stages: dict[str, float] = {}
+        for frame in history:
+            for stage, duration in frame["stages"].items():
+                stages[stage] = stages.get(stage, 0.0) + duration / count
+        return {
+            "frames": self.frames,
+            "fps": self.get_fps(),
+            "frame_time": sum(frame["total"] for frame in history) / count,
+            "stages": stages,
+            "cells": sum(frame["cells"] for frame in history) / count,
+            "uploaded_bytes": sum(
+                frame["uploaded_bytes"] for frame in history) / count,
+        }
+
+    def format_line(self) -> str:
+        """Return the summary as a single human-readable line.
+
+        Returns
+        -------
+        str
+            The summary line.
+        """
+        summary = self.get_summary()
+        stages = " ".join(
+            f"{stage}={duration * 1000:.2f}ms"
+            for stage, duration in summary["stages"].items()
+        )
+        return (
+            f"fps={summary['fps']:.1f} "
+            f"frame={summary['frame_time'] * 1000:.2f}ms "
+            f"cells={summary['cells']:.0f} "
+            f"upload={summary['uploaded_bytes'] / 1024:.0f}KiB "
+            f"{stages}"
+        ).rstrip()
@@ -0,0 +1,45 @@
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(package: str, exports: dict[str, str]
+                 ) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the module ``__getattr__`` and ``__dir__`` of a package.
+
+    Each exported name is imported from its module on first access only,
+    then cached in the package, so importing a package does not import
+    every module behind it.
+
+    Parameters
+    ----------
+    package : str
+        Name of the package, its ``__name__``.
+    exports : dict[str, str]
+        Module defining each exported name, relative to the package. A
+        name exported from the module of the same name is the module
+        itself.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        The ``__getattr__`` and ``__dir__`` functions of the package.
+
+    Examples
+    --------
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {
+    ...     "Displayer": ".display"})
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(
+                f"module '{package}' has no attribute '{name}'")
+        module = import_module(module_name, package)
+        value = module if module_name == f".{name}" else getattr(module, name)
+        setattr(import_module(package), name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(import_module(package))) | set(exports))
+
+    return __getattr__, __dir__
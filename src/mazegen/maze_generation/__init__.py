@@ -1,10 +1,29 @@
-from .cell import Cell
-from .maze import MazeGenerator
-from .seed import create_seed, next_randint
+from mazegen.lazy import lazy_exports
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cell import Cell
+    from .maze import MazeGenerator
+    from .seed import create_seed, next_randint
+    from .worker import GenerationWorker
+    from .batch import generate_batch, generate_task
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "Cell": ".cell",
+    "MazeGenerator": ".maze",
+    "GenerationWorker": ".worker",
+    "generate_batch": ".batch",
+    "generate_task": ".batch",
+    "create_seed": ".seed",
+    "next_randint": ".seed",
+    })
 
 __all__ = [
     "Cell",
     "MazeGenerator",
+    "GenerationWorker",
+    "generate_batch",
+    "generate_task",
     "create_seed",
     "next_randint"
     ]
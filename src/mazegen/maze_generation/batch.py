@@ -0,0 +1,120 @@
+from mazegen.maze_generation.maze import MazeGenerator
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+import io
+import os
+import time
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+# (width, height, entry, exit, perfect, seed, icon file, output file)
+GenerationTask = tuple[int, int, tuple[int, int], tuple[int, int], bool, int,
+                       str, str]
+
+# Tasks sent to a worker process at once.
+CHUNK_SIZE: int = 16
+
+
+def generate_task(task: GenerationTask) -> dict[str, Any]:
+    """Generate a maze and write it to its output file.
+
+    Parameters
+    ----------
+    task : GenerationTask
+        The maze parameters. An empty icon file name means no icon, an
+        empty output file name that the maze is not written.
+
+    Returns
+    -------
+    dict[str, Any]
+        The maze parameters, with the seed actually used, the length of
+        the shortest path, the generation time in seconds and the error
+        message, empty if the maze was generated.
+    """
+    width, height, entry, _exit, perfect, seed, icon_file, output_file = task
+    result: dict[str, Any] = {
+        "width": width, "height": height, "entry": entry, "exit": _exit,
+        "perfect": perfect, "seed": seed, "output": output_file,
+        "path": 0, "time": 0.0, "error": "",
+    }
+    start = time.perf_counter()
+    try:
+        if icon_file:
+            with open(icon_file, "r") as icon:
+                maze = MazeGenerator(width, height, entry, _exit, perfect,
+                                     seed, icon)
+        else:
+            maze = MazeGenerator(width, height, entry, _exit, perfect, seed,
+                                 io.StringIO(""))
+        maze.create_full_maze()
+        if output_file:
+            with open(output_file, "w") as output:
+                maze.output_in_file(output)
+    except Exception as error:
+        result["error"] = str(error)
+        return result
+    result.update(seed=maze.get_seed(), path=len(maze.get_shortest_path()),
+                  time=time.perf_counter() - start)
+    return result
+
+
+def generate_chunk(tasks: list[GenerationTask]) -> list[dict[str, Any]]:
+    """Run :func:`generate_task` on tasks, in a worker process.
+
+    Parameters
+    ----------
+    tasks : list[GenerationTask]
+        The mazes to generate.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        A result per task.
+    """
+    return [generate_task(task) for task in tasks]
+
+
+def generate_batch(tasks: Iterable[GenerationTask],
+                   jobs: int = 0) -> Iterator[dict[str, Any]]:
+    """Generate many mazes, in parallel worker processes.
+
+    Tasks are read from ``tasks`` only as workers become free: at most two
+    chunks of ``CHUNK_SIZE`` tasks per worker are pending, so a lazy
+    iterable of any length is never loaded in memory.
+
+    Parameters
+    ----------
+    tasks : Iterable[GenerationTask]
+        The mazes to generate.
+    jobs : int, optional
+        Number of worker processes, 0 for one per CPU and 1 to run in the
+        current process (default is 0).
+
+    Returns
+    -------
+    Iterator[dict[str, Any]]
+        The result of each task, see :func:`generate_task`, in the order
+        of the tasks.
+    """
+    jobs = jobs if jobs > 0 else os.cpu_count() or 1
+    if jobs == 1:
+        yield from map(generate_task, tasks)
+        return
+    # Imported here, it is slow to import and only needed in parallel.
+    from concurrent.futures import ProcessPoolExecutor
+
+    task_iterator = iter(tasks)
+    with ProcessPoolExecutor(jobs) as executor:
+        pending: deque[Future[list[dict[str, Any]]]] = deque()
+        while True:
+            while len(pending) < jobs * 2:
+                chunk = list(islice(task_iterator, CHUNK_SIZE))
+                if not chunk:
+                    break
+                pending.append(executor.submit(generate_chunk, chunk))
+            if not pending:
+                return
+            yield from pending.popleft().result()
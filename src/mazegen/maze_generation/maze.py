@@ -1,9 +1,12 @@
 from collections import deque
-from typing import Any, TextIO, cast
+from typing import Any, Callable, TextIO, cast
 from mazegen.maze_generation.cell import Cell
 from mazegen.maze_generation.seed import (create_seed, next_randint)
 
 
+MazeEvent = tuple[str, tuple[int, int], str | None]
+
+
 class MazeError(Exception):
     """Exception raised for general maze errors.
 
@@ -64,11 +67,34 @@ class MazeGenerator():
     The MazeGenerator class stores Cell objects in a matrix and provides
     methods to generate, query and export the maze structure.
 
+    While generating, the maze can report its progress as events
+    ``(kind, coords, direction)`` to a callback set with
+    :meth:`set_event_callback`:
+
+    - ``CARVE``: the wall of ``coords`` towards ``direction`` was opened.
+    - ``BACKTRACK``: generation goes back to the visited cell ``coords``.
+    - ``BREACH``: like ``CARVE``, for the extra openings of non-perfect
+      mazes.
+    - ``DONE``: generation is over, ``coords`` is the exit.
+
+    The sub-phases of :meth:`create_full_maze` and :meth:`output_in_file`
+    are reported by name to a callback set with :meth:`set_phase_callback`.
+
     Attributes
     ----------
     n_breach : int
         Number of breaches to create in non-perfect mazes.
+    CARVE, BACKTRACK, BREACH, DONE : str
+        Kinds of generation events.
+    HINT_DIRECTIONS : tuple[str, ...]
+        Directions of the hint table, by their 2-bit value.
     """
+    CARVE: str = "carve"
+    BACKTRACK: str = "backtrack"
+    BREACH: str = "breach"
+    DONE: str = "done"
+    HINT_DIRECTIONS: tuple[str, ...] = ("NORTH", "EST", "SOUTH", "WEST")
+
     def __init__(self, width: int, height: int, entry: tuple[int, int],
                  exit: tuple[int, int], perfect: bool, seed: int,
                  icon_file: TextIO) -> None:
@@ -126,6 +152,10 @@ class MazeGenerator():
         self.__shortest_path: list[str] = []
         self.__shortest_path_cells: list[Cell] = []
         self.__shortest_path_coords: list[tuple[int, int]] = []
+        self.__hint_table: bytearray | None = None
+        self.__event_callback: Callable[[MazeEvent], Any] | None = None
+        self.__wall_event: str = MazeGenerator.CARVE
+        self.__phase_callback: Callable[[str | None], Any] | None = None
         self.set_n_breach(3)
 
         for coords in [entry, exit]:
@@ -199,6 +229,63 @@ class MazeGenerator():
         """
         self.n_breach: int = abs(n_breach) + (n_breach == 0)
 
+    def set_event_callback(self,
+                           callback: Callable[[MazeEvent], Any] | None
+                           ) -> None:
+        """Set the function called with each generation event.
+
+        Opening a wall with :meth:`set_wall` emits an event, so any
+        generation algorithm built on it reports its progress.
+
+        Parameters
+        ----------
+        callback : Callable[[MazeEvent], Any] | None
+            Function called with each ``(kind, coords, direction)`` event,
+            or None to stop emitting events (the default).
+
+        Returns
+        -------
+        None
+        """
+        self.__event_callback = callback
+
+    def set_phase_callback(self,
+                           callback: Callable[[str | None], Any] | None
+                           ) -> None:
+        """Set the function called when a generation phase starts.
+
+        :meth:`create_full_maze` reports its phases ``"carve"``,
+        ``"breach"`` (non-perfect mazes only), ``"check_maze"`` and
+        ``"shortest_path"``, and :meth:`output_in_file` the phase
+        ``"output_in_file"``; None is reported when they return.
+
+        Parameters
+        ----------
+        callback : Callable[[str | None], Any] | None
+            Function called with the name of each phase, or None to stop
+            reporting phases (the default).
+
+        Returns
+        -------
+        None
+        """
+        self.__phase_callback = callback
+
+    def __enter_phase(self, name: str | None) -> None:
+        """Report the start of a phase to the phase callback, if any.
+
+        Parameters
+        ----------
+        name : str | None
+            Name of the phase, None once the last phase is over.
+
+        Returns
+        -------
+        None
+        """
+        if self.__phase_callback is not None:
+            self.__phase_callback(name)
+
     def get_matrix(self) -> list[list[Cell]]:
         """Return the internal matrix of Cells.
 
@@ -362,6 +449,7 @@ class MazeGenerator():
         """
         cell: Cell = self.get_cell(coords)
         cell.set_wall(direction, state)
+        self.__hint_table = None
 
         x, y = coords
         next_dir: str | None = None
@@ -389,6 +477,9 @@ class MazeGenerator():
             next_cell: Cell = self.get_cell(next_coords)
             next_cell.set_wall(next_dir, state)
 
+        if not state and self.__event_callback is not None:
+            self.__event_callback((self.__wall_event, coords, direction))
+
     def output_in_file(self, file: TextIO) -> None:
         """Write a textual representation of the maze to ``file``.
 
@@ -405,6 +496,7 @@ class MazeGenerator():
         -------
         None
         """
+        self.__enter_phase("output_in_file")
         output: str = ""
         for y in range(self.__height):
             for x in range(self.__width):
@@ -424,6 +516,7 @@ class MazeGenerator():
         output += "\n"
 
         file.write(output)
+        self.__enter_phase(None)
 
     def create_path(self,
                     coords: tuple[int, int],
@@ -519,6 +612,9 @@ class MazeGenerator():
                 return None
             next_cell: tuple[int, int] = visited_cells[
                 next_randint(0, n_visited_cells)]
+            if self.__event_callback is not None:
+                self.__event_callback(
+                    (MazeGenerator.BACKTRACK, next_cell, None))
             return self.find_next_cell(next_cell)
 
         return coords
@@ -578,6 +674,7 @@ class MazeGenerator():
         -------
         None
         """
+        self.__enter_phase("carve")
         entry_coords: tuple[int, int] = self.get_entry()
         next_coords: tuple[int, int] | None = self.create_path(entry_coords)
         next_coords = self.find_next_cell(next_coords)
@@ -587,6 +684,7 @@ class MazeGenerator():
             next_coords = self.find_next_cell(next_coords)
 
         if not self.is_perfect():
+            self.__enter_phase("breach")
             possible_breach: list[tuple[str, tuple[int, int]]] = []
 
             for y in range(self.__height):
@@ -650,6 +748,7 @@ class MazeGenerator():
                 n_breach: int = min(
                     n_possible_breach, next_randint(1, self.n_breach))
 
+                self.__wall_event = MazeGenerator.BREACH
                 while n_breach > 0:
                     direction, coords = possible_breach[
                         next_randint(0, n_possible_breach)]
@@ -687,7 +786,10 @@ class MazeGenerator():
                     # if del_wall:
                     n_breach -= 1
                     self.set_wall(coords, direction, False)
+                self.__wall_event = MazeGenerator.CARVE
+        self.__enter_phase("check_maze")
         self.check_maze()
+        self.__enter_phase("shortest_path")
         self.__shortest_path = self.find_shortest_path()
 
         coords = self.get_entry()
@@ -695,6 +797,10 @@ class MazeGenerator():
             coords = self.get_coords_by_dir(coords, char)
             self.__shortest_path_coords.append(coords)
             self.__shortest_path_cells.append(self.get_cell(coords))
+        self.__enter_phase(None)
+
+        if self.__event_callback is not None:
+            self.__event_callback((MazeGenerator.DONE, self.get_exit(), None))
 
     @staticmethod
     def get_coords_by_dir(coords: tuple[int, int],
@@ -860,3 +966,77 @@ class MazeGenerator():
                     queue.append((next_coords, path + [direction]))
 
         return []
+
+    def get_hint_table(self) -> bytearray:
+        """Return the direction towards the exit of every cell.
+
+        The table is computed on first use with a single breadth-first
+        search from the exit, then kept until a wall changes. Each cell uses
+        2 bits, four cells per byte: the cell ``(x, y)`` has the index
+        ``i = y * width + x`` and its direction is
+        ``HINT_DIRECTIONS[(table[i >> 2] >> ((i & 3) * 2)) & 3]``.
+
+        Cells that cannot reach the exit, and the exit itself, keep the
+        value 0; use :meth:`get_hint` to tell them apart.
+
+        Returns
+        -------
+        bytearray
+            The packed table, ``ceil(width * height / 4)`` bytes.
+        """
+        if self.__hint_table is None:
+            self.__hint_table = self.__build_hint_table()
+        return self.__hint_table
+
+    def get_hint(self, coords: tuple[int, int]) -> str | None:
+        """Return the next move from a cell along a shortest path to the exit.
+
+        Parameters
+        ----------
+        coords : tuple[int, int]
+            Cell coordinates as (x, y).
+
+        Returns
+        -------
+        str | None
+            "NORTH", "SOUTH", "EST" or "WEST", or None at the exit and for
+            cells that cannot reach it.
+        """
+        if coords == self.__exit:
+            return None
+        x, y = coords
+        index = y * self.__width + x
+        table = self.get_hint_table()
+        direction = MazeGenerator.HINT_DIRECTIONS[
+            (table[index >> 2] >> ((index & 3) * 2)) & 3]
+        if self.get_cell(coords).get_wall(direction):
+            return None
+        return direction
+
+    def __build_hint_table(self) -> bytearray:
+        """Compute the packed hint table, see :meth:`get_hint_table`.
+
+        Returns
+        -------
+        bytearray
+            The packed table.
+        """
+        width = self.__width
+        table = bytearray((width * self.__height + 3) >> 2)
+        opposite = {"NORTH": 2, "EST": 3, "SOUTH": 0, "WEST": 1}
+        queue: deque[tuple[int, int]] = deque([self.__exit])
+        visited = set([self.__exit])
+
+        while queue:
+            coords = queue.popleft()
+            for direction in self.get_cell(coords).get_state_walls(False):
+                next_coords = self.get_coords_by_dir(coords, direction)
+                if next_coords in visited:
+                    continue
+                visited.add(next_coords)
+                queue.append(next_coords)
+                # From the neighbor, the way back is the opposite direction.
+                index = next_coords[1] * width + next_coords[0]
+                table[index >> 2] |= opposite[direction] << ((index & 3) * 2)
+
+        return table
@@ -0,0 +1,266 @@
+from mazegen.maze_generation.maze import MazeGenerator, MazeEvent
+from collections import deque
+from typing import Any, Callable
+import queue
+import threading
+
+
+class GenerationCancelled(Exception):
+    """Exception raised in the worker thread to stop a generation."""
+    pass
+
+
+class GenerationWorker():
+    """Generate a maze in a background thread and stream its events.
+
+    The generation events are put in a bounded queue: when the consumer
+    falls behind, a blocking worker waits instead of buffering the whole
+    maze, so that the events always describe the real progress of the
+    algorithm, e.g. for an animation. A non-blocking worker never waits:
+    while the queue is full, its events pile up in a growing chunk, put in
+    the queue once there is room again. Events go through the queue in
+    chunks of at least ``CHUNK_SIZE`` to keep the locking cost low.
+
+    Attributes
+    ----------
+    QUEUE_SIZE : int
+        Default maximum number of pending events.
+    CHUNK_SIZE : int
+        Number of events put in the queue at once.
+    """
+    QUEUE_SIZE: int = 4096
+    CHUNK_SIZE: int = 256
+
+    def __init__(self, maze: MazeGenerator,
+                 output_file_name: str | None = None,
+                 queue_size: int = QUEUE_SIZE,
+                 on_done: Callable[[MazeGenerator], Any] | None = None,
+                 blocking: bool = True) -> None:
+        """Initialize a worker for a maze that is not generated yet.
+
+        Parameters
+        ----------
+        maze : MazeGenerator
+            Maze to generate.
+        output_file_name : str | None, optional
+            File the maze is written to, from the worker thread, once it is
+            generated (default is None).
+        queue_size : int, optional
+            Maximum number of pending events (default is ``QUEUE_SIZE``).
+        on_done : Callable[[MazeGenerator], Any] | None, optional
+            Function called in the worker thread with the maze once it is
+            generated (default is None).
+        blocking : bool, optional
+            Whether generation waits while the queue is full (default is
+            True). A consumer that does not pace the events, such as
+            :meth:`Displayer.start_generation_display`, should use False.
+
+        Returns
+        -------
+        None
+        """
+        self.__maze = maze
+        self.__output_file_name = output_file_name
+        self.__cancelled: bool = False
+        self.__events: queue.Queue[list[MazeEvent]] = queue.Queue(
+            max(1, queue_size // GenerationWorker.CHUNK_SIZE))
+        self.__chunk: list[MazeEvent] = []
+        self.__pending: deque[MazeEvent] = deque()
+        self.__on_done = on_done
+        self.__blocking = blocking
+        self.__error: BaseException | None = None
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+
+    def __run(self) -> None:
+        """Generate the maze, streaming its events to the queue.
+
+        The ``DONE`` event of the generation is held back until the maze
+        is written and ``on_done`` returned, so that once the consumer
+        reads it, :meth:`get_error` reports any error of the whole run.
+
+        Returns
+        -------
+        None
+        """
+        maze = self.__maze
+        maze.set_event_callback(self.__emit)
+        try:
+            maze.create_full_maze()
+            maze.set_event_callback(None)
+            if self.__output_file_name is not None:
+                with open(self.__output_file_name, "w") as output_file:
+                    maze.output_in_file(output_file)
+            if self.__on_done is not None:
+                self.__on_done(maze)
+        except GenerationCancelled:
+            maze.set_event_callback(None)
+            return
+        except Exception as error:
+            self.__error = error
+            maze.set_event_callback(None)
+        chunk = self.__chunk
+        self.__chunk = []
+        chunk.append((MazeGenerator.DONE, maze.get_exit(), None))
+        try:
+            self.__put(chunk)
+        except GenerationCancelled:
+            pass
+
+    def __put(self, chunk: list[MazeEvent]) -> None:
+        """Put a chunk of events in the queue, waiting while it is full.
+
+        Parameters
+        ----------
+        chunk : list[MazeEvent]
+            The events.
+
+        Raises
+        ------
+        GenerationCancelled
+            If the worker was cancelled.
+
+        Returns
+        -------
+        None
+        """
+        while True:
+            if self.__cancelled:
+                raise GenerationCancelled()
+            try:
+                self.__events.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def __emit(self, event: MazeEvent) -> None:
+        """Add an event to the current chunk.
+
+        Full chunks are put in the queue. A blocking worker waits while the
+        queue is full, a non-blocking one keeps filling the chunk. The
+        ``DONE`` event of the generation is dropped, :meth:`__run` emits
+        its own once the whole run is over.
+
+        Parameters
+        ----------
+        event : MazeEvent
+            The generation event.
+
+        Raises
+        ------
+        GenerationCancelled
+            If the worker was cancelled.
+
+        Returns
+        -------
+        None
+        """
+        if event[0] == MazeGenerator.DONE:
+            return
+        chunk = self.__chunk
+        chunk.append(event)
+        if len(chunk) % GenerationWorker.CHUNK_SIZE:
+            return
+        if self.__cancelled:
+            raise GenerationCancelled()
+        if not self.__blocking:
+            try:
+                self.__events.put_nowait(chunk)
+            except queue.Full:
+                return
+        else:
+            self.__put(chunk)
+        self.__chunk = []
+
+    def start(self) -> "GenerationWorker":
+        """Start generating.
+
+        Returns
+        -------
+        GenerationWorker
+            The worker itself.
+        """
+        self.__thread.start()
+        return self
+
+    def cancel(self) -> None:
+        """Stop the generation at its next event.
+
+        The maze is left partially generated and is not written.
+
+        Returns
+        -------
+        None
+        """
+        self.__cancelled = True
+
+    def get_maze(self) -> MazeGenerator:
+        """Return the maze being generated.
+
+        Returns
+        -------
+        MazeGenerator
+            The maze.
+        """
+        return self.__maze
+
+    def get_events(self, max_events: int) -> list[MazeEvent]:
+        """Return the pending events, without waiting for new ones.
+
+        Parameters
+        ----------
+        max_events : int
+            Maximum number of events to return.
+
+        Returns
+        -------
+        list[MazeEvent]
+            The events, oldest first. The last event of a generation has
+            the kind ``MazeGenerator.DONE``.
+        """
+        pending = self.__pending
+        events: list[MazeEvent] = []
+        while len(events) < max_events:
+            if not pending:
+                try:
+                    pending.extend(self.__events.get_nowait())
+                except queue.Empty:
+                    break
+            events.append(pending.popleft())
+        return events
+
+    def get_error(self) -> BaseException | None:
+        """Return the exception raised by the generation, if any.
+
+        Returns
+        -------
+        BaseException | None
+            The exception, or None.
+        """
+        return self.__error
+
+    def is_done(self) -> bool:
+        """Return whether the worker thread has finished.
+
+        Returns
+        -------
+        bool
+            True once the maze is generated (and ``on_done`` returned).
+        """
+        return not self.__thread.is_alive()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the worker thread to finish.
+
+        Pending events must be consumed, or generation may be blocked on the
+        full queue.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            Maximum time to wait in seconds (default is no limit).
+
+        Returns
+        -------
+        None
+        """
+        self.__thread.join(timeout)
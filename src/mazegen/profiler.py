@@ -0,0 +1,341 @@
+from typing import Any, Callable, Iterator
+from contextlib import contextmanager
+import cProfile
+import threading
+import time
+import tracemalloc
+
+
+class PhaseProfiler():
+    """Time and allocation breakdown of named phases of a program.
+
+    Phases are opened with :meth:`phase` around a block, or with
+    :meth:`switch`, which closes the previous phase it opened in the same
+    thread; phases opened inside another one are nested under it. Events
+    such as the first frame are recorded once with :meth:`mark`, as a time
+    since :meth:`start`.
+
+    Allocations are measured with ``tracemalloc``: the memory still
+    allocated at the end of a phase and the peak reached during it, both
+    relative to its start. ``tracemalloc`` covers the whole process, so
+    phases running at the same time in different threads see each other's
+    allocations. The optional ``cProfile`` run only covers the thread that
+    called :meth:`start`.
+
+    Tracing slows the whole program down, so a profiler given a
+    ``stop_after`` phase or mark stops itself as soon as it is recorded.
+
+    Attributes
+    ----------
+    records : list[dict[str, Any]]
+        One record per closed phase or mark: name, thread, depth, start
+        and duration in seconds, allocated and peak memory in bytes.
+    """
+    def __init__(self, stats_file: str = "", trace_memory: bool = True,
+                 clock: Callable[[], float] = time.perf_counter,
+                 stop_after: str = "",
+                 on_stop: Callable[["PhaseProfiler"], Any] | None = None
+                 ) -> None:
+        """Initialize a profiler, stopped.
+
+        Parameters
+        ----------
+        stats_file : str, optional
+            File the ``cProfile`` statistics are dumped to by :meth:`stop`,
+            in ``pstats`` format (default is empty, for no ``cProfile``).
+        trace_memory : bool, optional
+            Whether to measure allocations (default is True).
+        clock : Callable[[], float], optional
+            Clock of the timings, in seconds (default is
+            ``time.perf_counter``).
+        stop_after : str, optional
+            Phase or mark after which the profiler stops itself (default is
+            empty, to only stop with :meth:`stop`).
+        on_stop : Callable[[PhaseProfiler], Any] | None, optional
+            Function called with the profiler once it stopped, e.g. to
+            print :meth:`format_table` (default is None).
+
+        Returns
+        -------
+        None
+        """
+        self.records: list[dict[str, Any]] = []
+        self.__stats_file = stats_file
+        self.__stop_after = stop_after
+        self.__on_stop = on_stop
+        self.__trace_memory = trace_memory
+        self.__clock = clock
+        self.__start: float = 0.0
+        self.__running: bool = False
+        self.__started_tracing: bool = False
+        self.__profile: cProfile.Profile | None = None
+        self.__stacks: dict[int, list[dict[str, Any]]] = {}
+        self.__once: set[str] = set()
+        self.__lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start timing, tracing allocations and profiling.
+
+        Returns
+        -------
+        None
+        """
+        if self.__trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+        if self.__stats_file:
+            self.__profile = cProfile.Profile()
+            self.__profile.enable()
+        self.__start = self.__clock()
+        self.__running = True
+
+    def stop(self) -> None:
+        """Close the open phases, stop and dump the ``cProfile`` statistics.
+
+        Calls ``on_stop`` once stopped; does nothing when not running.
+
+        Returns
+        -------
+        None
+        """
+        if not self.__running:
+            return
+        for thread in list(self.__stacks):
+            while self.__stacks[thread]:
+                self.__leave(thread)
+        self.__running = False
+        if self.__profile is not None:
+            self.__profile.disable()
+            self.__profile.dump_stats(self.__stats_file)
+            self.__profile = None
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+        if self.__on_stop is not None:
+            self.__on_stop(self)
+
+    def get_stats_file(self) -> str:
+        """Return the file the ``cProfile`` statistics are dumped to.
+
+        Returns
+        -------
+        str
+            The file name, empty when ``cProfile`` is not used.
+        """
+        return self.__stats_file
+
+    def is_running(self) -> bool:
+        """Return whether the profiler was started and not stopped.
+
+        Returns
+        -------
+        bool
+            True between :meth:`start` and :meth:`stop`.
+        """
+        return self.__running
+
+    def __memory(self) -> tuple[int, int]:
+        """Return the current and peak traced memory.
+
+        Returns
+        -------
+        tuple[int, int]
+            Bytes, 0 when allocations are not traced.
+        """
+        if not tracemalloc.is_tracing():
+            return 0, 0
+        return tracemalloc.get_traced_memory()
+
+    def __enter(self, name: str, switched: bool) -> None:
+        """Open a phase in the current thread.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+        switched : bool
+            Whether the phase was opened by :meth:`switch`.
+
+        Returns
+        -------
+        None
+        """
+        if not self.__running:
+            return
+        with self.__lock:
+            stack = self.__stacks.setdefault(threading.get_ident(), [])
+            current, peak = self.__memory()
+            # The peak is reset for the new phase: keep the one reached so
+            # far by the enclosing phases.
+            for phase in self.__all_phases():
+                phase["peak"] = max(phase["peak"], peak)
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            stack.append({
+                "name": name,
+                "thread": threading.current_thread().name,
+                "depth": len(stack),
+                "start": self.__clock() - self.__start,
+                "memory": current,
+                "peak": current,
+                "switched": switched,
+            })
+
+    def __all_phases(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the open phases of every thread.
+
+        Returns
+        -------
+        Iterator[dict[str, Any]]
+            The open phases.
+        """
+        for stack in self.__stacks.values():
+            yield from stack
+
+    def __leave(self, thread: int | None = None) -> None:
+        """Close the innermost phase of a thread.
+
+        Parameters
+        ----------
+        thread : int | None, optional
+            Thread identifier (default is None, for the current thread).
+
+        Returns
+        -------
+        None
+        """
+        with self.__lock:
+            stack = self.__stacks.get(
+                threading.get_ident() if thread is None else thread)
+            if not stack:
+                return
+            phase = stack.pop()
+            current, peak = self.__memory()
+            for other in self.__all_phases():
+                other["peak"] = max(other["peak"], peak)
+            self.records.append({
+                "name": phase["name"],
+                "thread": phase["thread"],
+                "depth": phase["depth"],
+                "start": phase["start"],
+                "duration": self.__clock() - self.__start - phase["start"],
+                "allocated": current - phase["memory"],
+                "peak": max(phase["peak"], peak) - phase["memory"],
+            })
+
+    @contextmanager
+    def phase(self, name: str, once: bool = False) -> Iterator[None]:
+        """Record the block of a ``with`` statement as a phase.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+        once : bool, optional
+            Whether to only record the first phase of this name, for a
+            block run repeatedly such as a frame (default is False).
+
+        Returns
+        -------
+        Iterator[None]
+            The context manager.
+        """
+        if not self.__running or (once and name in self.__once):
+            yield
+            return
+        if once:
+            self.__once.add(name)
+        self.__enter(name, False)
+        try:
+            yield
+        finally:
+            if self.__running:
+                self.__leave()
+                if name == self.__stop_after:
+                    self.stop()
+
+    def switch(self, name: str | None) -> None:
+        """Close the last phase opened by this method and open another.
+
+        Meant for phase callbacks, such as
+        :meth:`MazeGenerator.set_phase_callback`.
+
+        Parameters
+        ----------
+        name : str | None
+            Name of the new phase, None to only close the previous one.
+
+        Returns
+        -------
+        None
+        """
+        if not self.__running:
+            return
+        stack = self.__stacks.get(threading.get_ident(), [])
+        if stack and stack[-1]["switched"]:
+            self.__leave()
+        if name is not None:
+            self.__enter(name, True)
+
+    def mark(self, name: str) -> None:
+        """Record the first occurrence of an event.
+
+        Parameters
+        ----------
+        name : str
+            Name of the event; later occurrences are ignored.
+
+        Returns
+        -------
+        None
+        """
+        if not self.__running or name in self.__once:
+            return
+        self.__once.add(name)
+        self.records.append({
+            "name": name,
+            "thread": threading.current_thread().name,
+            "depth": 0,
+            "start": self.__clock() - self.__start,
+            "duration": None,
+            "allocated": None,
+            "peak": None,
+        })
+        if name == self.__stop_after:
+            self.stop()
+
+    def format_table(self) -> str:
+        """Format the records as a text table, by start time.
+
+        Nested phases are indented under their enclosing phase. Marks have
+        no duration.
+
+        Returns
+        -------
+        str
+            One line per record, with a header.
+        """
+        header = ("phase", "thread", "start (ms)", "time (ms)",
+                  "allocated (KiB)", "peak (KiB)")
+        records = sorted(self.records,
+                         key=lambda record: (record["start"], record["depth"]))
+        rows = [header] + [(
+            "  " * record["depth"] + record["name"],
+            record["thread"],
+            f"{record['start'] * 1000:.2f}",
+            "" if record["duration"] is None
+            else f"{record['duration'] * 1000:.2f}",
+            "" if record["allocated"] is None or not self.__trace_memory
+            else f"{record['allocated'] / 1024:.1f}",
+            "" if record["peak"] is None or not self.__trace_memory
+            else f"{record['peak'] / 1024:.1f}",
+        ) for record in records]
+        widths = [max(len(row[column]) for row in rows)
+                  for column in range(len(header))]
+        lines = ["  ".join(value.ljust(width) if column < 2
+                           else value.rjust(width)
+                           for column, (value, width)
+                           in enumerate(zip(row, widths)))
+                 for row in rows]
+        lines.insert(1, "-" * len(lines[0]))
+        return "\n".join(lines)
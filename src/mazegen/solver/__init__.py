@@ -0,0 +1,49 @@
+from mazegen.lazy import lazy_exports
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .frontier import FrontierSolver, SolverError
+    from .compact import CompactMaze
+    from .agents import Agent, WallFollowerAgent, TremauxAgent
+    from .junction import JunctionGraph
+    from .agents import DeadEndFillingAgent, BFSAgent, AStarAgent
+    from .agents import JunctionAgent, AGENTS
+    from .arena import Arena, MazeTask, run_agents, solve_task
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "FrontierSolver": ".frontier",
+    "SolverError": ".frontier",
+    "CompactMaze": ".compact",
+    "Agent": ".agents",
+    "WallFollowerAgent": ".agents",
+    "TremauxAgent": ".agents",
+    "DeadEndFillingAgent": ".agents",
+    "BFSAgent": ".agents",
+    "AStarAgent": ".agents",
+    "JunctionAgent": ".agents",
+    "JunctionGraph": ".junction",
+    "AGENTS": ".agents",
+    "Arena": ".arena",
+    "MazeTask": ".arena",
+    "run_agents": ".arena",
+    "solve_task": ".arena",
+    })
+
+__all__ = [
+    "FrontierSolver",
+    "SolverError",
+    "CompactMaze",
+    "Agent",
+    "WallFollowerAgent",
+    "TremauxAgent",
+    "DeadEndFillingAgent",
+    "BFSAgent",
+    "AStarAgent",
+    "JunctionAgent",
+    "JunctionGraph",
+    "AGENTS",
+    "Arena",
+    "MazeTask",
+    "run_agents",
+    "solve_task"
+    ]
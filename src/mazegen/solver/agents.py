@@ -0,0 +1,613 @@
+from mazegen.solver.compact import CompactMaze
+from mazegen.solver.junction import JunctionGraph
+from abc import ABC, abstractmethod
+from collections import deque
+import heapq
+
+
+class Agent(ABC):
+    """Base class of the step-based solvers of a :class:`CompactMaze`.
+
+    Each call of :meth:`step` does one unit of work: one move for the
+    agents walking in the maze, one cell expanded or filled for the others.
+    The maze is only read, so several agents can share it. Subclasses
+    implement :meth:`step` and :meth:`get_path`.
+
+    Attributes
+    ----------
+    NAME : str
+        Name of the agent in ``AGENTS``.
+    steps : int
+        Number of steps done.
+    """
+    NAME: str = ""
+
+    def __init__(self, maze: CompactMaze) -> None:
+        """Initialize the agent on the maze entry.
+
+        Parameters
+        ----------
+        maze : CompactMaze
+            The maze to solve.
+
+        Returns
+        -------
+        None
+        """
+        self.maze = maze
+        self.steps: int = 0
+        self.done: bool = False
+        self.solved: bool = False
+
+    @abstractmethod
+    def step(self) -> bool:
+        """Do one step of the search.
+
+        Returns
+        -------
+        bool
+            False once the agent is done.
+        """
+
+    def run(self, max_steps: int = 0) -> bool:
+        """Step until the agent is done.
+
+        Parameters
+        ----------
+        max_steps : int, optional
+            Maximum number of steps, 0 for a default of 16 steps per cell.
+
+        Returns
+        -------
+        bool
+            Whether the exit was reached.
+        """
+        if max_steps <= 0:
+            max_steps = 16 * self.maze.width * self.maze.height
+        while self.steps < max_steps and self.step():
+            pass
+        return self.solved
+
+    @abstractmethod
+    def get_path(self) -> list[int]:
+        """Return the path found from the entry to the exit.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, empty if the maze is not solved.
+        """
+
+
+class WallFollowerAgent(Agent):
+    """Walk with the right hand on the wall.
+
+    Solves every perfect maze; in mazes with loops it may circle forever
+    and is then stopped by the step limit of :meth:`Agent.run`.
+    """
+    NAME: str = "wall_follower"
+    # Directions clockwise, from NORTH.
+    CLOCKWISE: tuple[int, ...] = CompactMaze.DIRECTIONS
+
+    def __init__(self, maze: CompactMaze) -> None:
+        """Initialize the agent on the maze entry, heading north.
+
+        Parameters
+        ----------
+        maze : CompactMaze
+            The maze to solve.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(maze)
+        self.position: int = maze.entry
+        self.heading: int = 0
+        self.trail: list[int] = [maze.entry]
+        self.solved = self.done = maze.entry == maze.exit
+
+    def step(self) -> bool:
+        """Move to the next cell, trying right, ahead, left then back.
+
+        Returns
+        -------
+        bool
+            False once the exit is reached or the agent is stuck.
+        """
+        if self.done:
+            return False
+        maze = self.maze
+        clockwise = WallFollowerAgent.CLOCKWISE
+        for turn in (1, 0, 3, 2):
+            heading = (self.heading + turn) % 4
+            if maze.is_open(self.position, clockwise[heading]):
+                break
+        else:
+            self.done = True
+            return False
+        self.heading = heading
+        self.position = maze.move(self.position, clockwise[heading])
+        self.trail.append(self.position)
+        self.steps += 1
+        if self.position == maze.exit:
+            self.solved = self.done = True
+        return not self.done
+
+    def get_path(self) -> list[int]:
+        """Return the walk with its dead ends removed.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, empty if the maze is not solved.
+        """
+        if not self.solved:
+            return []
+        path: list[int] = []
+        seen: dict[int, int] = {}
+        for index in self.trail:
+            if index in seen:
+                # Back on a visited cell: drop the loop or dead end.
+                for dropped in path[seen[index] + 1:]:
+                    del seen[dropped]
+                del path[seen[index] + 1:]
+            else:
+                seen[index] = len(path)
+                path.append(index)
+        return path
+
+
+class TremauxAgent(Agent):
+    """Walk with Trémaux's algorithm, marking each passage crossed.
+
+    Solves any maze, each passage being walked at most twice. The passages
+    marked once at the end form the path.
+    """
+    NAME: str = "tremaux"
+
+    def __init__(self, maze: CompactMaze) -> None:
+        """Initialize the agent on the maze entry.
+
+        Parameters
+        ----------
+        maze : CompactMaze
+            The maze to solve.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(maze)
+        self.position: int = maze.entry
+        # Marks of the passages: slot cell * 4 + 1 for the east passage of
+        # a cell, cell * 4 + 2 for its south passage.
+        self.marks: bytearray = bytearray(4 * maze.width * maze.height)
+        self.came_from: int | None = None
+        self.solved = self.done = maze.entry == maze.exit
+
+    def __passage(self, index: int, number: int) -> int:
+        """Return the mark slot of a passage, shared by both of its cells.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+        number : int
+            Direction number in ``CompactMaze.DIRECTIONS``.
+
+        Returns
+        -------
+        int
+            Mark slot, owned by the north or west cell of the passage.
+        """
+        if number == 0:
+            return self.maze.move(index, CompactMaze.NORTH) * 4 + 2
+        if number == 3:
+            return self.maze.move(index, CompactMaze.WEST) * 4 + 1
+        return index * 4 + number
+
+    def step(self) -> bool:
+        """Cross one passage, following Trémaux's rules.
+
+        Returns
+        -------
+        bool
+            False once the exit is reached or the maze is fully walked.
+        """
+        if self.done:
+            return False
+        maze = self.maze
+        marks = self.marks
+        position = self.position
+        options = [(number, self.__passage(position, number))
+                   for number, direction in enumerate(CompactMaze.DIRECTIONS)
+                   if maze.is_open(position, direction)]
+        back = self.came_from
+        chosen: tuple[int, int] | None = None
+        back_option = next((option for option in options
+                            if option[0] == back), None)
+        if (back_option is not None and marks[back_option[1]] == 1
+                and any(marks[slot] for number, slot in options
+                        if number != back)):
+            # Known junction reached by a new passage: turn around.
+            chosen = back_option
+        else:
+            candidates = [option for option in options
+                          if marks[option[1]] < 2]
+            candidates.sort(key=lambda option: (marks[option[1]],
+                                                option[0] == back))
+            if candidates:
+                chosen = candidates[0]
+        if chosen is None:
+            self.done = True
+            return False
+
+        number, slot = chosen
+        marks[slot] += 1
+        self.position = maze.move(position, CompactMaze.DIRECTIONS[number])
+        self.came_from = (number + 2) % 4
+        self.steps += 1
+        if self.position == maze.exit:
+            self.solved = self.done = True
+        return not self.done
+
+    def get_path(self) -> list[int]:
+        """Return the path along the passages marked once.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, empty if the maze is not solved.
+        """
+        if not self.solved:
+            return []
+        maze = self.maze
+        path = [maze.entry]
+        previous = -1
+        while path[-1] != maze.exit:
+            index = path[-1]
+            for number, direction in enumerate(CompactMaze.DIRECTIONS):
+                if not maze.is_open(index, direction):
+                    continue
+                next_index = maze.move(index, direction)
+                if (next_index != previous
+                        and self.marks[self.__passage(index, number)] == 1):
+                    break
+            else:
+                return []
+            previous = index
+            path.append(next_index)
+        return path
+
+
+class BFSAgent(Agent):
+    """Breadth-first search, one cell expanded per step.
+
+    Cells set in ``blocked`` are never entered.
+    """
+    NAME: str = "bfs"
+
+    def __init__(self, maze: CompactMaze,
+                 blocked: bytearray | None = None) -> None:
+        """Initialize the search from the maze entry.
+
+        Parameters
+        ----------
+        maze : CompactMaze
+            The maze to solve.
+        blocked : bytearray | None, optional
+            One byte per cell, non-zero for the cells to avoid (default is
+            None).
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(maze)
+        self.parents: list[int] = [-1] * (maze.width * maze.height)
+        self.parents[maze.entry] = maze.entry
+        self.queue: deque[int] = deque([maze.entry])
+        self.blocked = blocked
+
+    def step(self) -> bool:
+        """Expand the next cell of the queue.
+
+        Returns
+        -------
+        bool
+            False once the exit is found or the queue is empty.
+        """
+        if self.done:
+            return False
+        if not self.queue:
+            self.done = True
+            return False
+        index = self.queue.popleft()
+        self.steps += 1
+        if index == self.maze.exit:
+            self.solved = self.done = True
+            return False
+        parents = self.parents
+        blocked = self.blocked
+        for next_index in self.maze.neighbors(index):
+            if parents[next_index] < 0 and (blocked is None
+                                            or not blocked[next_index]):
+                parents[next_index] = index
+                self.queue.append(next_index)
+        return True
+
+    def get_path(self) -> list[int]:
+        """Return the path, following the parents back from the exit.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, empty if the maze is not solved.
+        """
+        if not self.solved:
+            return []
+        path = [self.maze.exit]
+        while path[-1] != self.maze.entry:
+            path.append(self.parents[path[-1]])
+        path.reverse()
+        return path
+
+
+class AStarAgent(BFSAgent):
+    """A* search with the Manhattan distance, one cell expanded per step."""
+    NAME: str = "astar"
+
+    def __init__(self, maze: CompactMaze) -> None:
+        """Initialize the search from the maze entry.
+
+        Parameters
+        ----------
+        maze : CompactMaze
+            The maze to solve.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(maze)
+        self.exit_coords: tuple[int, int] = maze.coords(maze.exit)
+        self.costs: dict[int, int] = {maze.entry: 0}
+        self.heap: list[tuple[int, int, int]] = [
+            (self.__estimate(maze.entry, 0), 0, maze.entry)]
+        self.closed: set[int] = set()
+
+    def __estimate(self, index: int, cost: int) -> int:
+        """Return the estimated total cost of a path through a cell.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+        cost : int
+            Cost from the entry to the cell.
+
+        Returns
+        -------
+        int
+            Cost plus the Manhattan distance to the exit.
+        """
+        x, y = self.maze.coords(index)
+        exit_x, exit_y = self.exit_coords
+        return cost + abs(x - exit_x) + abs(y - exit_y)
+
+    def step(self) -> bool:
+        """Expand the open cell with the lowest estimated cost.
+
+        Returns
+        -------
+        bool
+            False once the exit is found or no cell is left.
+        """
+        if self.done:
+            return False
+        heap = self.heap
+        while heap and heap[0][2] in self.closed:
+            heapq.heappop(heap)
+        if not heap:
+            self.done = True
+            return False
+        _, cost, index = heapq.heappop(heap)
+        self.closed.add(index)
+        self.steps += 1
+        if index == self.maze.exit:
+            self.solved = self.done = True
+            return False
+        costs = self.costs
+        for next_index in self.maze.neighbors(index):
+            next_cost = cost + 1
+            if next_cost < costs.get(next_index, next_cost + 1):
+                costs[next_index] = next_cost
+                self.parents[next_index] = index
+                heapq.heappush(heap, (self.__estimate(next_index, next_cost),
+                                      next_cost, next_index))
+        return True
+
+
+class DeadEndFillingAgent(Agent):
+    """Fill the dead ends until only the paths are left.
+
+    Each step fills one dead end cell. The path is then found with a
+    breadth-first search restricted to the cells left, whose steps are
+    counted too.
+    """
+    NAME: str = "dead_end_filling"
+
+    def __init__(self, maze: CompactMaze) -> None:
+        """Initialize the agent, listing the dead ends of the maze.
+
+        Parameters
+        ----------
+        maze : CompactMaze
+            The maze to solve.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(maze)
+        size = maze.width * maze.height
+        self.filled: bytearray = bytearray(size)
+        self.degrees: bytearray = bytearray(
+            maze.count_open(index) for index in range(size))
+        self.dead_ends: list[int] = [
+            index for index in range(size)
+            if self.degrees[index] <= 1 and self.__fillable(index)]
+        self.search: BFSAgent | None = None
+
+    def __fillable(self, index: int) -> bool:
+        """Return whether a cell may be filled.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+
+        Returns
+        -------
+        bool
+            False for the entry, the exit and the filled cells.
+        """
+        return (index != self.maze.entry and index != self.maze.exit
+                and not self.filled[index])
+
+    def step(self) -> bool:
+        """Fill one dead end, or expand one cell of the final search.
+
+        Returns
+        -------
+        bool
+            False once the path is found or proven missing.
+        """
+        if self.done:
+            return False
+        self.steps += 1
+        if self.search is None:
+            if self.dead_ends:
+                index = self.dead_ends.pop()
+                if not self.__fillable(index):
+                    return True
+                self.filled[index] = 1
+                for next_index in self.maze.neighbors(index):
+                    if self.filled[next_index]:
+                        continue
+                    self.degrees[next_index] -= 1
+                    if (self.degrees[next_index] == 1
+                            and self.__fillable(next_index)):
+                        self.dead_ends.append(next_index)
+                return True
+            self.search = BFSAgent(self.maze, self.filled)
+        if not self.search.step():
+            self.solved = self.search.solved
+            self.done = True
+        return not self.done
+
+    def get_path(self) -> list[int]:
+        """Return the path found among the cells left.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, empty if the maze is not solved.
+        """
+        if self.search is None:
+            return []
+        return self.search.get_path()
+
+
+class JunctionAgent(Agent):
+    """Dijkstra search on the junction graph of the maze.
+
+    The first step builds the :class:`JunctionGraph`, each following step
+    expands one node, so a corridor costs a single step whatever its
+    length.
+    """
+    NAME: str = "junction"
+
+    def __init__(self, maze: CompactMaze) -> None:
+        """Initialize the agent, the graph is built by the first step.
+
+        Parameters
+        ----------
+        maze : CompactMaze
+            The maze to solve.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(maze)
+        self.graph: JunctionGraph | None = None
+        self.costs: dict[int, int] = {}
+        self.parents: dict[int, int] = {}
+        self.heap: list[tuple[int, int]] = []
+        self.closed: set[int] = set()
+
+    def step(self) -> bool:
+        """Build the graph, or expand the open node with the lowest cost.
+
+        Returns
+        -------
+        bool
+            False once the exit is found or no node is left.
+        """
+        if self.done:
+            return False
+        self.steps += 1
+        graph = self.graph
+        if graph is None:
+            self.graph = JunctionGraph(self.maze)
+            self.costs[self.graph.entry] = 0
+            self.heap.append((0, self.graph.entry))
+            return True
+        heap = self.heap
+        while heap and heap[0][1] in self.closed:
+            heapq.heappop(heap)
+        if not heap:
+            self.done = True
+            return False
+        cost, node = heapq.heappop(heap)
+        self.closed.add(node)
+        if node == graph.exit:
+            self.solved = self.done = True
+            return False
+        costs = self.costs
+        for edge in graph.neighbors(node):
+            target = graph.targets[edge]
+            next_cost = cost + graph.weights[edge]
+            if next_cost < costs.get(target, next_cost + 1):
+                costs[target] = next_cost
+                self.parents[target] = edge
+                heapq.heappush(heap, (next_cost, target))
+        return True
+
+    def get_path(self) -> list[int]:
+        """Return the path, expanding the edges back into cells.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, empty if the maze is not solved.
+        """
+        graph = self.graph
+        if not self.solved or graph is None:
+            return []
+        edges: list[int] = []
+        node = graph.exit
+        while node != graph.entry:
+            edges.append(self.parents[node])
+            node = graph.get_source(edges[-1])
+        edges.reverse()
+        return graph.path_cells(graph.entry, edges)
+
+
+AGENTS: dict[str, type[Agent]] = {
+    agent.NAME: agent for agent in (
+        WallFollowerAgent, TremauxAgent, DeadEndFillingAgent, BFSAgent,
+        AStarAgent, JunctionAgent)
+}
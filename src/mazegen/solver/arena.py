@@ -0,0 +1,238 @@
+from mazegen.maze_generation.maze import MazeGenerator
+from mazegen.solver.agents import AGENTS
+from mazegen.solver.compact import CompactMaze
+from mazegen.solver.frontier import SolverError
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable, Sequence
+import io
+import os
+import time
+import tracemalloc
+
+
+# (width, height, entry, exit, perfect, seed, icon file)
+MazeTask = tuple[int, int, tuple[int, int], tuple[int, int], bool, int, str]
+
+
+def run_agents(maze: CompactMaze, agents: Sequence[str],
+               measure_memory: bool = True) -> list[dict[str, Any]]:
+    """Run agents one after the other on the same maze.
+
+    Parameters
+    ----------
+    maze : CompactMaze
+        The maze, shared by all the agents.
+    agents : Sequence[str]
+        Names of the agents in ``AGENTS``.
+    measure_memory : bool, optional
+        Whether to run each agent a second time with ``tracemalloc`` to
+        measure its peak memory (default is True). Time is measured on
+        the first run, which is not traced.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        For each agent: its name, whether it solved the maze, its steps,
+        path length, time in seconds and peak memory in bytes (0 when not
+        measured).
+    """
+    results: list[dict[str, Any]] = []
+    for name in agents:
+        agent = AGENTS[name](maze)
+        start = time.perf_counter()
+        solved = agent.run()
+        duration = time.perf_counter() - start
+
+        memory = 0
+        if measure_memory:
+            tracemalloc.start()
+            AGENTS[name](maze).run()
+            memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        results.append({
+            "agent": name,
+            "solved": solved,
+            "steps": agent.steps,
+            "path": len(agent.get_path()),
+            "time": duration,
+            "memory": memory,
+        })
+    return results
+
+
+def solve_task(task: MazeTask, agents: Sequence[str],
+               measure_memory: bool = True) -> list[dict[str, Any]]:
+    """Generate a maze and run agents on it, in a worker process.
+
+    Parameters
+    ----------
+    task : MazeTask
+        The maze parameters. An empty icon file name means no icon.
+    agents : Sequence[str]
+        Names of the agents in ``AGENTS``.
+    measure_memory : bool, optional
+        See :func:`run_agents` (default is True).
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        The results of :func:`run_agents`, with the maze parameters.
+    """
+    width, height, entry, _exit, perfect, seed, icon_file = task
+    if icon_file:
+        with open(icon_file, "r") as icon:
+            maze = MazeGenerator(width, height, entry, _exit, perfect, seed,
+                                 icon)
+    else:
+        maze = MazeGenerator(width, height, entry, _exit, perfect, seed,
+                             io.StringIO(""))
+    maze.create_full_maze()
+    results = run_agents(CompactMaze.from_maze(maze), agents,
+                         measure_memory)
+    for result in results:
+        result.update(width=width, height=height, entry=entry, exit=_exit,
+                      perfect=perfect, seed=seed, icon=icon_file)
+    return results
+
+
+class Arena():
+    """Compare solver agents on many mazes, in parallel worker processes.
+
+    Each maze is generated and compacted once in a worker, then every agent
+    is run on it. Results are gathered with :meth:`run`, averaged per agent
+    with :meth:`summarize` and printed with :meth:`format_table`.
+    """
+    def __init__(self, agents: Sequence[str] = tuple(AGENTS), jobs: int = 0,
+                 measure_memory: bool = True) -> None:
+        """Initialize an arena.
+
+        Parameters
+        ----------
+        agents : Sequence[str], optional
+            Names of the agents in ``AGENTS`` (default is all of them).
+        jobs : int, optional
+            Number of worker processes, 0 for one per CPU and 1 to run in
+            the current process (default is 0).
+        measure_memory : bool, optional
+            Whether to measure the peak memory of each agent (default is
+            True).
+
+        Raises
+        ------
+        SolverError
+            If an agent is unknown.
+
+        Returns
+        -------
+        None
+        """
+        for name in agents:
+            if name not in AGENTS:
+                raise SolverError(f"unknown agent '{name}'.")
+        self.__agents = tuple(agents)
+        self.__jobs = jobs if jobs > 0 else os.cpu_count() or 1
+        self.__measure_memory = measure_memory
+
+    def run(self, tasks: Iterable[MazeTask]) -> list[dict[str, Any]]:
+        """Run every agent on every maze.
+
+        Parameters
+        ----------
+        tasks : Iterable[MazeTask]
+            The mazes to solve.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            One result per maze and agent, see :func:`solve_task`.
+        """
+        tasks = list(tasks)
+        agents = [self.__agents] * len(tasks)
+        memory = [self.__measure_memory] * len(tasks)
+        results: list[dict[str, Any]] = []
+        if self.__jobs == 1:
+            for maze_results in map(solve_task, tasks, agents, memory):
+                results.extend(maze_results)
+            return results
+        chunk_size = max(1, len(tasks) // (self.__jobs * 4))
+        with ProcessPoolExecutor(self.__jobs) as executor:
+            for maze_results in executor.map(solve_task, tasks, agents,
+                                             memory, chunksize=chunk_size):
+                results.extend(maze_results)
+        return results
+
+    @staticmethod
+    def summarize(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Average the results per agent.
+
+        Parameters
+        ----------
+        results : list[dict[str, Any]]
+            Results of :meth:`run`.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            For each agent, in order of first appearance: the number of
+            mazes and of solved mazes, the mean steps, path length and time
+            in seconds, and the maximum peak memory in bytes. Means are
+            over the solved mazes.
+        """
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for result in results:
+            groups.setdefault(result["agent"], []).append(result)
+        summary: list[dict[str, Any]] = []
+        for name, group in groups.items():
+            solved = [result for result in group if result["solved"]]
+            count = max(1, len(solved))
+            summary.append({
+                "agent": name,
+                "mazes": len(group),
+                "solved": len(solved),
+                "steps": sum(result["steps"] for result in solved) / count,
+                "path": sum(result["path"] for result in solved) / count,
+                "time": sum(result["time"] for result in solved) / count,
+                "memory": max(result["memory"] for result in group),
+            })
+        return summary
+
+    @staticmethod
+    def format_table(summary: list[dict[str, Any]],
+                     memory: bool = True) -> str:
+        """Format a summary as a text table.
+
+        Parameters
+        ----------
+        summary : list[dict[str, Any]]
+            Result of :meth:`summarize`.
+        memory : bool, optional
+            Whether to show the peak memory, False when it was not measured
+            (default is True).
+
+        Returns
+        -------
+        str
+            One line per agent, with a header.
+        """
+        header: tuple[str, ...] = ("agent", "solved", "steps", "path",
+                                   "time (ms)")
+        if memory:
+            header += ("memory (KiB)",)
+        rows = [header] + [(
+            line["agent"],
+            f"{line['solved']}/{line['mazes']}",
+            f"{line['steps']:.1f}",
+            f"{line['path']:.1f}",
+            f"{line['time'] * 1000:.3f}",
+        ) + ((f"{line['memory'] / 1024:.1f}",) if memory else ())
+            for line in summary]
+        widths = [max(len(row[column]) for row in rows)
+                  for column in range(len(header))]
+        lines = ["  ".join(value.ljust(width) if column == 0
+                           else value.rjust(width)
+                           for column, (value, width)
+                           in enumerate(zip(row, widths)))
+                 for row in rows]
+        lines.insert(1, "-" * len(lines[0]))
+        return "\n".join(lines)
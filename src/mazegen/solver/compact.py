@@ -0,0 +1,222 @@
+from mazegen.maze_generation.maze import MazeGenerator
+from typing import TextIO
+
+
+class CompactMaze():
+    """Read-only maze stored as one wall bitmask byte per cell.
+
+    Cells are numbered row by row: the cell ``(x, y)`` has the index
+    ``y * width + x``. Walls use the bits of the output file format: 1 for
+    north, 2 for east, 4 for south and 8 for west, set when the wall is
+    closed. The whole maze is a single ``bytes`` object, cheap to share
+    between solvers and to send to other processes.
+
+    Attributes
+    ----------
+    NORTH, EST, SOUTH, WEST : int
+        Wall bits.
+    DIRECTIONS : tuple[int, ...]
+        All wall bits, in the order of the output file format.
+    """
+    NORTH: int = 1
+    EST: int = 2
+    SOUTH: int = 4
+    WEST: int = 8
+    DIRECTIONS: tuple[int, ...] = (NORTH, EST, SOUTH, WEST)
+
+    def __init__(self, width: int, height: int, walls: bytes,
+                 entry: tuple[int, int], exit: tuple[int, int]) -> None:
+        """Initialize a compact maze.
+
+        Parameters
+        ----------
+        width : int
+            Width in cells.
+        height : int
+            Height in cells.
+        walls : bytes
+            Wall bitmask of each cell, row by row.
+        entry : tuple[int, int]
+            Entry coordinates as (x, y).
+        exit : tuple[int, int]
+            Exit coordinates as (x, y).
+
+        Raises
+        ------
+        ValueError
+            If ``walls`` does not hold one byte per cell.
+
+        Returns
+        -------
+        None
+        """
+        if len(walls) != width * height:
+            raise ValueError("walls has to hold one byte per cell.")
+        self.width: int = width
+        self.height: int = height
+        self.walls: bytes = walls
+        self.entry: int = self.index(entry)
+        self.exit: int = self.index(exit)
+        self.__steps: dict[int, int] = {
+            CompactMaze.NORTH: -width,
+            CompactMaze.EST: 1,
+            CompactMaze.SOUTH: width,
+            CompactMaze.WEST: -1,
+        }
+
+    @staticmethod
+    def from_maze(maze: MazeGenerator) -> "CompactMaze":
+        """Build the compact maze of a generated maze.
+
+        Parameters
+        ----------
+        maze : MazeGenerator
+            A generated maze.
+
+        Returns
+        -------
+        CompactMaze
+            Its compact copy.
+        """
+        walls = bytes(int(cell.get_hex_value(), 16)
+                      for row in maze.get_matrix() for cell in row)
+        return CompactMaze(maze.get_width(), maze.get_height(), walls,
+                           maze.get_entry(), maze.get_exit())
+
+    @staticmethod
+    def from_file(file: TextIO) -> "CompactMaze":
+        """Read a maze written by :meth:`MazeGenerator.output_in_file`.
+
+        Parameters
+        ----------
+        file : TextIO
+            Open text file.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a maze output file.
+
+        Returns
+        -------
+        CompactMaze
+            The maze.
+        """
+        rows: list[str] = []
+        lines = iter(file.read().split("\n"))
+        for line in lines:
+            if line == "":
+                break
+            rows.append(line)
+        try:
+            entry_x, entry_y = next(lines).split(",")
+            exit_x, exit_y = next(lines).split(",")
+            walls = bytes.fromhex("".join("0" + char
+                                          for row in rows for char in row))
+        except (StopIteration, ValueError):
+            raise ValueError("invalid maze file.")
+        width = len(rows[0]) if rows else 0
+        return CompactMaze(width, len(rows), walls,
+                           (int(entry_x), int(entry_y)),
+                           (int(exit_x), int(exit_y)))
+
+    def index(self, coords: tuple[int, int]) -> int:
+        """Return the index of a cell.
+
+        Parameters
+        ----------
+        coords : tuple[int, int]
+            Cell coordinates as (x, y).
+
+        Returns
+        -------
+        int
+            The cell index.
+        """
+        x, y = coords
+        return y * self.width + x
+
+    def coords(self, index: int) -> tuple[int, int]:
+        """Return the coordinates of a cell.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+
+        Returns
+        -------
+        tuple[int, int]
+            Cell coordinates as (x, y).
+        """
+        return index % self.width, index // self.width
+
+    def move(self, index: int, direction: int) -> int:
+        """Return the index of the neighbor in a direction.
+
+        The wall is not checked, see :meth:`is_open`.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+        direction : int
+            One of ``DIRECTIONS``.
+
+        Returns
+        -------
+        int
+            The neighbor index.
+        """
+        return index + self.__steps[direction]
+
+    def is_open(self, index: int, direction: int) -> bool:
+        """Return whether the wall of a cell in a direction is open.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+        direction : int
+            One of ``DIRECTIONS``.
+
+        Returns
+        -------
+        bool
+            True if the cell leads to its neighbor in that direction.
+        """
+        return not self.walls[index] & direction
+
+    def neighbors(self, index: int) -> list[int]:
+        """Return the cells reachable in one step from a cell.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+
+        Returns
+        -------
+        list[int]
+            Indexes of the neighbors without a wall in between.
+        """
+        walls = self.walls[index]
+        steps = self.__steps
+        return [index + steps[direction]
+                for direction in CompactMaze.DIRECTIONS
+                if not walls & direction]
+
+    def count_open(self, index: int) -> int:
+        """Return the number of open walls of a cell.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+
+        Returns
+        -------
+        int
+            Between 0 and 4.
+        """
+        return 4 - bin(self.walls[index]).count("1")
@@ -0,0 +1,204 @@
+from mazegen.maze_generation.maze import MazeGenerator
+from typing import Iterator
+import heapq
+
+
+class SolverError(Exception):
+    """Exception raised for invalid solver parameters."""
+    def __init__(self, message: str = "undefined"):
+        """Initialize the exception with a custom message.
+
+        Parameters
+        ----------
+        message : str, optional
+            Human-readable error message. Default is 'undefined'.
+
+        Returns
+        -------
+        None
+        """
+        super().__init__(f"Solver error: {message}")
+
+
+class FrontierSolver():
+    """Solve a maze step by step, one frontier layer at a time.
+
+    Iterating :meth:`layers` yields the cells explored at each step, which
+    lets a display draw the search in bulk, then :meth:`get_path` returns
+    the path found.
+
+    - ``BFS``: each layer holds the cells at the same distance from the
+      entry.
+    - ``ASTAR``: each layer holds the cells expanded with the same estimated
+      total cost (distance from the entry plus Manhattan distance to the
+      exit).
+
+    Attributes
+    ----------
+    BFS, ASTAR : str
+        Names of the supported algorithms.
+    ALGORITHMS : tuple[str, ...]
+        All supported algorithms.
+    """
+    BFS: str = "bfs"
+    ASTAR: str = "astar"
+    ALGORITHMS: tuple[str, ...] = (BFS, ASTAR)
+
+    def __init__(self, maze: MazeGenerator, algorithm: str = BFS) -> None:
+        """Initialize a solver for a generated maze.
+
+        Parameters
+        ----------
+        maze : MazeGenerator
+            The maze to solve.
+        algorithm : str, optional
+            One of ``ALGORITHMS`` (default is ``BFS``).
+
+        Raises
+        ------
+        SolverError
+            If the algorithm is unknown.
+
+        Returns
+        -------
+        None
+        """
+        if algorithm not in FrontierSolver.ALGORITHMS:
+            raise SolverError(f"unknown algorithm '{algorithm}'.")
+        self.__maze = maze
+        self.__algorithm = algorithm
+        self.__parents: dict[tuple[int, int], tuple[int, int] | None] = {}
+        self.__solved: bool = False
+
+    def get_algorithm(self) -> str:
+        """Return the name of the algorithm.
+
+        Returns
+        -------
+        str
+            The algorithm.
+        """
+        return self.__algorithm
+
+    def neighbors(self, coords: tuple[int, int]) -> list[tuple[int, int]]:
+        """Return the cells reachable in one step from a cell.
+
+        Parameters
+        ----------
+        coords : tuple[int, int]
+            Cell coordinates as (x, y).
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Coordinates of the neighbors without a wall in between.
+        """
+        maze = self.__maze
+        return [maze.get_coords_by_dir(coords, direction)
+                for direction in maze.get_cell(coords).get_state_walls(False)]
+
+    def layers(self) -> Iterator[list[tuple[int, int]]]:
+        """Explore the maze, yielding each frontier layer.
+
+        The first layer is the entry, the last one contains the exit.
+
+        Yields
+        ------
+        list[tuple[int, int]]
+            Coordinates of the cells explored at this step.
+        """
+        self.__parents = {self.__maze.get_entry(): None}
+        self.__solved = False
+        if self.__algorithm == FrontierSolver.ASTAR:
+            yield from self.__astar_layers()
+        else:
+            yield from self.__bfs_layers()
+
+    def __bfs_layers(self) -> Iterator[list[tuple[int, int]]]:
+        """Breadth-first search, one distance per layer.
+
+        Yields
+        ------
+        list[tuple[int, int]]
+            Cells at the same distance from the entry.
+        """
+        parents = self.__parents
+        exit_coords = self.__maze.get_exit()
+        layer: list[tuple[int, int]] = [self.__maze.get_entry()]
+
+        while layer:
+            yield layer
+            if exit_coords in parents:
+                self.__solved = True
+                return
+            next_layer: list[tuple[int, int]] = []
+            for coords in layer:
+                for next_coords in self.neighbors(coords):
+                    if next_coords not in parents:
+                        parents[next_coords] = coords
+                        next_layer.append(next_coords)
+            layer = next_layer
+
+    def __astar_layers(self) -> Iterator[list[tuple[int, int]]]:
+        """A* search, one estimated total cost per layer.
+
+        Yields
+        ------
+        list[tuple[int, int]]
+            Cells expanded with the same estimated total cost.
+        """
+        parents = self.__parents
+        entry = self.__maze.get_entry()
+        exit_x, exit_y = self.__maze.get_exit()
+
+        def estimate(coords: tuple[int, int], cost: int) -> int:
+            return cost + abs(coords[0] - exit_x) + abs(coords[1] - exit_y)
+
+        costs: dict[tuple[int, int], int] = {entry: 0}
+        heap: list[tuple[int, int, tuple[int, int]]] = [
+            (estimate(entry, 0), 0, entry)]
+        closed: set[tuple[int, int]] = set()
+        layer: list[tuple[int, int]] = []
+        layer_cost: int = heap[0][0]
+
+        while heap:
+            total, cost, coords = heapq.heappop(heap)
+            if coords in closed:
+                continue
+            if total != layer_cost and layer:
+                yield layer
+                layer = []
+            layer_cost = total
+            closed.add(coords)
+            layer.append(coords)
+            if coords == (exit_x, exit_y):
+                self.__solved = True
+                break
+            for next_coords in self.neighbors(coords):
+                next_cost = cost + 1
+                if next_cost < costs.get(next_coords, next_cost + 1):
+                    costs[next_coords] = next_cost
+                    parents[next_coords] = coords
+                    heapq.heappush(heap, (estimate(next_coords, next_cost),
+                                          next_cost, next_coords))
+        if layer:
+            yield layer
+
+    def get_path(self) -> list[tuple[int, int]]:
+        """Return the path found, once :meth:`layers` is exhausted.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Coordinates from the entry to the exit, empty if the exit was
+            not reached.
+        """
+        if not self.__solved:
+            return []
+        path: list[tuple[int, int]] = []
+        coords: tuple[int, int] | None = self.__maze.get_exit()
+        while coords is not None:
+            path.append(coords)
+            coords = self.__parents[coords]
+        path.reverse()
+        return path
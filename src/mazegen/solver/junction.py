@@ -0,0 +1,314 @@
+from mazegen.solver.compact import CompactMaze
+from array import array
+from bisect import bisect_right
+import heapq
+
+
+class JunctionGraph():
+    """Maze collapsed into a weighted graph of its junctions.
+
+    Corridor cells, with exactly two open walls, are merged into the edges
+    linking the other cells: junctions, dead ends, the entry and the exit,
+    which become the nodes. Each edge keeps its length in moves and the
+    corridor cells it goes through, so that paths map back to the grid. In
+    a maze carved by a depth-first search, most cells are corridor cells.
+
+    The graph is stored in compressed sparse row (CSR) arrays. The edges
+    leaving node ``n`` are ``offsets[n]`` to ``offsets[n + 1] - 1``; every
+    corridor is stored once in each direction. The corridor cells of edge
+    ``e`` are ``cells[cell_offsets[e]:cell_offsets[e + 1]]``, in walking
+    order.
+
+    Attributes
+    ----------
+    maze : CompactMaze
+        The maze of the graph.
+    nodes : array
+        Cell index of each node.
+    offsets : array
+        First edge of each node, followed by the number of edges.
+    targets : array
+        Node reached by each edge.
+    weights : array
+        Length of each edge, in moves.
+    cell_offsets : array
+        First corridor cell of each edge, followed by the number of
+        corridor cells.
+    cells : array
+        Corridor cell indexes of all the edges.
+    entry, exit : int
+        Nodes of the maze entry and exit.
+    """
+    # Number of open walls of each wall bitmask.
+    OPEN_WALLS: bytes = bytes(4 - bin(walls & 15).count("1")
+                              for walls in range(256))
+
+    def __init__(self, maze: CompactMaze) -> None:
+        """Build the graph of a maze.
+
+        Parameters
+        ----------
+        maze : CompactMaze
+            The maze to collapse.
+
+        Returns
+        -------
+        None
+        """
+        self.maze = maze
+        open_walls = maze.walls.translate(JunctionGraph.OPEN_WALLS)
+        node_of = array("i", [-1]) * len(open_walls)
+        nodes = array("i")
+        for index, count in enumerate(open_walls):
+            if count not in (0, 2) or index in (maze.entry, maze.exit):
+                node_of[index] = len(nodes)
+                nodes.append(index)
+
+        offsets = array("i", [0])
+        targets = array("i")
+        weights = array("i")
+        cell_offsets = array("i", [0])
+        cells = array("i")
+        walls = maze.walls
+        moves = [(direction, maze.move(0, direction))
+                 for direction in CompactMaze.DIRECTIONS]
+        for node_cell in nodes:
+            for current in maze.neighbors(node_cell):
+                previous = node_cell
+                length = 1
+                while node_of[current] < 0:
+                    cells.append(current)
+                    # Leave the corridor cell by its other open wall.
+                    closed = walls[current]
+                    for direction, step in moves:
+                        if (not closed & direction
+                                and current + step != previous):
+                            previous, current = current, current + step
+                            break
+                    length += 1
+                targets.append(node_of[current])
+                weights.append(length)
+                cell_offsets.append(len(cells))
+            offsets.append(len(targets))
+
+        self.nodes = nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.cell_offsets = cell_offsets
+        self.cells = cells
+        self.entry: int = node_of[maze.entry]
+        self.exit: int = node_of[maze.exit]
+        self.__node_of = node_of
+        self.__edge_of: "array[int] | None" = None
+
+    def node_count(self) -> int:
+        """Return the number of nodes.
+
+        Returns
+        -------
+        int
+            Junctions, dead ends, entry and exit.
+        """
+        return len(self.nodes)
+
+    def edge_count(self) -> int:
+        """Return the number of edges, each corridor counting twice.
+
+        Returns
+        -------
+        int
+            Length of ``targets``.
+        """
+        return len(self.targets)
+
+    def get_node(self, index: int) -> int:
+        """Return the node of a cell.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+
+        Returns
+        -------
+        int
+            The node, or -1 for corridor cells and closed cells.
+        """
+        return self.__node_of[index]
+
+    def get_edge(self, index: int) -> int:
+        """Return an edge going through a corridor cell.
+
+        The lookup array is built on first use.
+
+        Parameters
+        ----------
+        index : int
+            The cell index.
+
+        Returns
+        -------
+        int
+            One of the two edges of the corridor, or -1 for the other
+            cells.
+        """
+        if self.__edge_of is None:
+            edge_of = array("i", [-1]) * len(self.__node_of)
+            cell_offsets = self.cell_offsets
+            for edge in range(len(self.targets)):
+                for position in range(cell_offsets[edge],
+                                      cell_offsets[edge + 1]):
+                    edge_of[self.cells[position]] = edge
+            self.__edge_of = edge_of
+        return self.__edge_of[index]
+
+    def get_source(self, edge: int) -> int:
+        """Return the node an edge leaves from.
+
+        Parameters
+        ----------
+        edge : int
+            The edge.
+
+        Returns
+        -------
+        int
+            The source node.
+        """
+        return bisect_right(self.offsets, edge) - 1
+
+    def neighbors(self, node: int) -> range:
+        """Return the edges leaving a node.
+
+        Parameters
+        ----------
+        node : int
+            The node.
+
+        Returns
+        -------
+        range
+            Edge numbers, to index ``targets``, ``weights`` and
+            ``cell_offsets``.
+        """
+        return range(self.offsets[node], self.offsets[node + 1])
+
+    def node_coords(self, node: int) -> tuple[int, int]:
+        """Return the grid coordinates of a node.
+
+        Parameters
+        ----------
+        node : int
+            The node.
+
+        Returns
+        -------
+        tuple[int, int]
+            Cell coordinates as (x, y).
+        """
+        return self.maze.coords(self.nodes[node])
+
+    def edge_cells(self, edge: int) -> list[int]:
+        """Return the cells of an edge, from its source to its target.
+
+        Parameters
+        ----------
+        edge : int
+            The edge.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, both end nodes included.
+        """
+        corridor = self.cells[self.cell_offsets[edge]:
+                              self.cell_offsets[edge + 1]]
+        return ([self.nodes[self.get_source(edge)]] + corridor.tolist()
+                + [self.nodes[self.targets[edge]]])
+
+    def path_cells(self, start: int, edges: list[int]) -> list[int]:
+        """Expand a path of edges into grid cells.
+
+        Parameters
+        ----------
+        start : int
+            The node the path starts from.
+        edges : list[int]
+            Consecutive edges of the path.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, from the start node to the last target.
+        """
+        path = [self.nodes[start]]
+        cell_offsets = self.cell_offsets
+        for edge in edges:
+            path.extend(self.cells[cell_offsets[edge]:cell_offsets[edge + 1]])
+            path.append(self.nodes[self.targets[edge]])
+        return path
+
+    def shortest_path(self, start: int, goal: int) -> list[int]:
+        """Find a shortest path between two nodes with Dijkstra.
+
+        Parameters
+        ----------
+        start : int
+            Start node.
+        goal : int
+            Goal node.
+
+        Returns
+        -------
+        list[int]
+            Edges of the path, empty if the goal cannot be reached or is
+            the start.
+        """
+        targets = self.targets
+        weights = self.weights
+        offsets = self.offsets
+        costs: dict[int, int] = {start: 0}
+        parents: dict[int, int] = {}
+        heap: list[tuple[int, int]] = [(0, start)]
+        closed: set[int] = set()
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if node in closed:
+                continue
+            if node == goal:
+                break
+            closed.add(node)
+            for edge in range(offsets[node], offsets[node + 1]):
+                target = targets[edge]
+                next_cost = cost + weights[edge]
+                if next_cost < costs.get(target, next_cost + 1):
+                    costs[target] = next_cost
+                    parents[target] = edge
+                    heapq.heappush(heap, (next_cost, target))
+        else:
+            return []
+
+        edges: list[int] = []
+        node = goal
+        while node != start:
+            edge = parents[node]
+            edges.append(edge)
+            node = self.get_source(edge)
+        edges.reverse()
+        return edges
+
+    def solve(self) -> list[int]:
+        """Return a shortest path from the maze entry to its exit.
+
+        Returns
+        -------
+        list[int]
+            Cell indexes, empty if the exit cannot be reached.
+        """
+        if self.entry == self.exit:
+            return [self.nodes[self.entry]]
+        edges = self.shortest_path(self.entry, self.exit)
+        if not edges:
+            return []
+        return self.path_cells(self.entry, edges)